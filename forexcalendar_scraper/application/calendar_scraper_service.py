@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+import logging
+import queue
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 from forexcalendar_scraper.core.config import Settings
 from forexcalendar_scraper.core.constants import DEFAULT_SCRAPER_DATE_PARAM
 from forexcalendar_scraper.domain.entities import CommandResult
-from forexcalendar_scraper.ports import CalendarGatewayPort, EventRepositoryPort, EventStorePort, LoggerFactory, PathServicePort
+from forexcalendar_scraper.ports import (
+    CalendarGatewayPort,
+    EventRepositoryPort,
+    EventStorePort,
+    LoggerFactory,
+    PathServicePort,
+)
 
 
 @dataclass(slots=True)
@@ -20,13 +30,62 @@ class CalendarScraperService:
     event_store: EventStorePort | None = None
 
     def run(self, date_param: str | None = None) -> CommandResult:
-        effective_date_param = date_param or DEFAULT_SCRAPER_DATE_PARAM
-        logger = self.logger_factory(
+        return self._scrape_date(date_param or DEFAULT_SCRAPER_DATE_PARAM, self._build_logger())
+
+    def run_many(self, date_params: Sequence[str]) -> list[CommandResult]:
+        """Scrape several date parameters, returning one result per parameter in input order.
+
+        Up to `max_concurrency` workers run at once, and each keeps a single browser for all of
+        its dates instead of launching Chromium per date. A date that fails is logged and
+        reported with `failed_events=1`, so the remaining dates still run.
+        """
+
+        logger = self._build_logger()
+        work_queue: queue.SimpleQueue[tuple[int, str]] = queue.SimpleQueue()
+        for item in enumerate(date_params):
+            work_queue.put(item)
+        results: dict[int, CommandResult] = {}
+
+        def run_worker() -> None:
+            with self.calendar_gateway.open_session(logger, "calendar scraping"):
+                while True:
+                    try:
+                        index, date_param = work_queue.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        results[index] = self._scrape_date(date_param, logger)
+                    except Exception:
+                        logger.exception("Calendar scrape failed for %s", date_param)
+                        results[index] = CommandResult(failed_events=1)
+
+        worker_count = max(1, min(self.settings.max_concurrency, len(date_params)))
+        if worker_count == 1:
+            run_worker()
+        else:
+            logger.info(
+                "Scraping %s date parameters with %s concurrent workers",
+                len(date_params),
+                worker_count,
+            )
+            with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                for future in [executor.submit(run_worker) for _ in range(worker_count)]:
+                    future.result()
+        return [results[index] for index in range(len(date_params))]
+
+    def _build_logger(self) -> logging.Logger:
+        return self.logger_factory(
             "scraper",
             self.path_service.build_log_file_path("scraper"),
             self.settings.log_level,
+            self.settings.log_to_console,
+        )
+
+    def _scrape_date(self, effective_date_param: str, logger: logging.Logger) -> CommandResult:
+        output_file = self.path_service.build_output_file_path(
+            effective_date_param,
+            extension=f".{self.settings.events_output_format}",
         )
-        output_file = self.path_service.build_output_file_path(effective_date_param)
         logger.info("Starting calendar scrape for %s", effective_date_param)
         logger.info("Output file: %s", self.path_service.display_path(output_file))
 
@@ -6,9 +6,21 @@ from dataclasses import dataclass
 
 from forexcalendar_scraper.core.config import Settings
 from forexcalendar_scraper.core.constants import DEFAULT_EXTRACTOR_DATE_PARAM
-from forexcalendar_scraper.domain.entities import CommandResult, DetailBlock
-from forexcalendar_scraper.ports import CalendarGatewayPort, EventRepositoryPort, EventStorePort, LoggerFactory, PathServicePort
+from forexcalendar_scraper.domain.entities import CalendarEvent, CommandResult, DetailBlock
+from forexcalendar_scraper.ports import (
+    CalendarGatewayPort,
+    EventRepositoryPort,
+    EventStorePort,
+    ExtractionCachePort,
+    LoggerFactory,
+    PathServicePort,
+)
+from forexcalendar_scraper.utils.serialization import decode_json, encode_json
 from forexcalendar_scraper.application.event_processing import EventBatchProcessor
+from forexcalendar_scraper.application.extraction_cache import (
+    extraction_cache_run,
+    with_extraction_cache,
+)
 from forexcalendar_scraper.application.runtime import resolve_required_input_csv
 
 
@@ -20,6 +32,7 @@ class DetailExtractionService:
     calendar_gateway: CalendarGatewayPort
     logger_factory: LoggerFactory
     event_store: EventStorePort | None = None
+    extraction_cache: ExtractionCachePort | None = None
 
     def run(
         self,
@@ -30,6 +43,7 @@ class DetailExtractionService:
             "detail_extractor",
             self.path_service.build_log_file_path("detail_extractor"),
             self.settings.log_level,
+            self.settings.log_to_console,
         )
         resolved_csv_file = resolve_required_input_csv(self.path_service, csv_file, date_param)
         logger.info(
@@ -40,31 +54,73 @@ class DetailExtractionService:
         logger.info("Found %s events to process", len(events))
 
         processor = EventBatchProcessor[DetailBlock](self.settings, logger)
-        results, summary = processor.process(
-            events,
+        extractor = with_extraction_cache(
             lambda event: self.calendar_gateway.extract_detail_block(event, date_param, logger),
-            "Processed %s event details so far",
+            self.extraction_cache,
+            self.settings,
+            logger,
+            key_builder=lambda event: f"details:{date_param}:{event.detail_id}",
+            encode=lambda block: encode_json(block.fields if block else None),
+            decode=_decode_cached_detail_block,
         )
+        output_file = self.path_service.build_output_file_path(date_param, "_details")
+        store_events = self.event_store is not None and self.event_store.is_enabled()
+        written_count = 0
+        with (
+            extraction_cache_run(self.extraction_cache),
+            self.csv_repository.open_detail_block_writer(output_file) as writer,
+        ):
+
+            def write_block(_: CalendarEvent, block: DetailBlock) -> None:
+                nonlocal written_count
+                writer.write(block)
+                written_count += 1
+
+            results, summary = processor.process(
+                events,
+                extractor,
+                "Processed %s event details so far",
+                session_factory=lambda: self.calendar_gateway.open_session(
+                    logger,
+                    "detail extraction",
+                ),
+                on_result=write_block,
+                share_result=lambda event, block: block.with_event_context(event),
+                # Every event has a specs table, so an empty overlay means it did not render.
+                empty_results_are_misses=True,
+                keep_results=store_events,
+            )
 
-        detail_blocks = [block for _, block in results]
         result = CommandResult(
             processed_events=summary.processed_events,
             failed_events=summary.failed_events,
             skipped_events=summary.skipped_events,
         )
-        if detail_blocks:
-            output_file = self.path_service.build_output_file_path(date_param, "_details")
-            self.csv_repository.save_detail_blocks(output_file, detail_blocks)
-            if self.event_store is not None and self.event_store.is_enabled():
+        if written_count:
+            if store_events:
                 self.event_store.upsert_detail_blocks(date_param, results)
             result.output_files["details"] = output_file
-            result.written_counts["details"] = len(detail_blocks)
+            result.written_counts["details"] = written_count
             logger.info(
                 "Saved %s detail blocks to %s",
-                len(detail_blocks),
+                written_count,
                 self.path_service.display_path(output_file),
             )
         else:
             logger.warning("No event details found to save")
 
         return result
+
+
+def _decode_cached_detail_block(event: CalendarEvent, payload: str) -> DetailBlock | None:
+    fields = decode_json(payload)
+    if not fields:
+        return None
+    return DetailBlock(
+        detail_id=event.detail_id,
+        event_date=event.date,
+        event_time=event.time,
+        event_currency=event.currency,
+        event_name=event.name,
+        fields=fields,
+    )
@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Mapping
 
+from forexcalendar_scraper.application.extraction_cache import extraction_cache_run
 from forexcalendar_scraper.core.constants import DETAILS_FILE_GLOB
 from forexcalendar_scraper.core.exceptions import InputFileResolutionError
-from forexcalendar_scraper.ports import EventRepositoryPort, PathServicePort
+from forexcalendar_scraper.ports import EventRepositoryPort, ExtractionCachePort, PathServicePort
 from forexcalendar_scraper.utils.formatting import numeric_sort_key, truncate_text
+from forexcalendar_scraper.utils.serialization import decode_json, encode_json
 
 
 @dataclass(slots=True)
 class DetailQueryService:
     path_service: PathServicePort
     csv_repository: EventRepositoryPort
+    extraction_cache: ExtractionCachePort | None = None
+    cache_ttl_seconds: float = 0.0
 
     def resolve_details_file(self, file_name: str | None) -> tuple[Path, bool]:
         if file_name:
@@ -33,7 +38,28 @@ class DetailQueryService:
         return latest_file, True
 
     def load_details(self, filename: str | Path) -> dict[str, dict[str, str]]:
-        return self.csv_repository.load_detail_blocks(filename)
+        """Parse a details CSV, reusing the cached parse while the file is unchanged."""
+
+        if self.extraction_cache is None or self.cache_ttl_seconds <= 0:
+            return self.csv_repository.load_detail_blocks(filename)
+
+        details_file = Path(filename).resolve()
+        file_stat = details_file.stat()
+        # One entry per file, overwritten when the file changes, so rewrites never pile up copies.
+        key = f"details-csv:{details_file}"
+        signature = [file_stat.st_mtime_ns, file_stat.st_size]
+        with extraction_cache_run(self.extraction_cache):
+            cached_events = _decode_cached_details(self.extraction_cache.get(key), signature)
+            if cached_events is not None:
+                return cached_events
+
+            events = self.csv_repository.load_detail_blocks(details_file)
+            self.extraction_cache.set(
+                key,
+                encode_json({"signature": signature, "events": events}),
+                self.cache_ttl_seconds,
+            )
+        return events
 
     def show_event(self, events: Mapping[str, Mapping[str, str]], event_id: str) -> str:
         if event_id not in events:
@@ -117,13 +143,29 @@ class DetailQueryService:
         return "\n".join(lines) + "\n"
 
     def list_all_fields(self, events: Mapping[str, Mapping[str, str]]) -> str:
-        all_fields: set[str] = set()
-        for event in events.values():
-            all_fields.update(event.keys())
-
-        lines = [f"All Unique Fields ({len(all_fields)} total):", "=" * 80]
-        for field_name in sorted(all_fields):
-            count = sum(1 for event in events.values() if field_name in event)
-            lines.append(f"{field_name:25s} (present in {count}/{len(events)} events)")
+        field_counts = Counter(field_name for event in events.values() for field_name in event)
+
+        lines = [f"All Unique Fields ({len(field_counts)} total):", "=" * 80]
+        for field_name in sorted(field_counts):
+            lines.append(
+                f"{field_name:25s} (present in {field_counts[field_name]}/{len(events)} events)"
+            )
         lines.append("=" * 80)
-        return "\n".join(lines) + "\n"
\ No newline at end of file
+        return "\n".join(lines) + "\n"
+
+
+def _decode_cached_details(
+    cached_payload: str | None,
+    signature: list[int],
+) -> dict[str, dict[str, str]] | None:
+    """Return the cached parse if it matches `signature`; malformed or older entries miss."""
+
+    if cached_payload is None:
+        return None
+    try:
+        cached = decode_json(cached_payload)
+        if cached["signature"] != signature or not isinstance(cached["events"], dict):
+            return None
+        return cached["events"]
+    except (ValueError, KeyError, TypeError):
+        return None
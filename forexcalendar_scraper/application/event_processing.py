@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
 import logging
+import queue
+import threading
 import time
 from typing import Callable, Generic, Sequence, TypeVar
 
+from forexcalendar_scraper.application.extraction_cache import CachedExtractor
 from forexcalendar_scraper.core.config import Settings
+from forexcalendar_scraper.core.exceptions import DetailUnavailableError, RateLimitedError
 from forexcalendar_scraper.domain.entities import CalendarEvent
 
 
 PayloadT = TypeVar("PayloadT")
+SessionFactory = Callable[[], AbstractContextManager[None]]
+ResultHandler = Callable[[CalendarEvent, PayloadT], None]
+ResultSharer = Callable[[CalendarEvent, PayloadT], PayloadT]
+_WorkerResult = tuple[int, CalendarEvent, PayloadT | None]
+_Delivery = Callable[[int, CalendarEvent, PayloadT | None], None]
 
 
 @dataclass(slots=True)
@@ -21,8 +32,63 @@ class BatchProcessingSummary:
     skipped_events: int = 0
 
 
+class AdaptiveDelay:
+    """Back off exponentially when the server throttles and decay on healthy responses.
+
+    A run of `failure_threshold` consecutive empty results also counts as throttling, since
+    overlays that repeatedly fail to render usually mean the site is pushing back.
+    """
+
+    def __init__(self, min_delay: float, max_delay: float, failure_threshold: int = 0) -> None:
+        self.min_delay = max(0.0, min_delay)
+        self.max_delay = max(self.min_delay, max_delay)
+        self.failure_threshold = failure_threshold
+        self.current = self.min_delay
+        self._consecutive_failures = 0
+
+    def record_success(self) -> None:
+        self._consecutive_failures = 0
+        self.current = max(self.current / 2, self.min_delay)
+
+    def record_failure(self) -> None:
+        self._consecutive_failures += 1
+        if self.failure_threshold > 0 and self._consecutive_failures >= self.failure_threshold:
+            self.record_throttle()
+
+    def record_throttle(self) -> None:
+        self.current = min(max(self.current * 2, 1.0), self.max_delay)
+
+
+class TokenBucket:
+    """Share one request budget between worker threads.
+
+    Up to `capacity` requests may start back to back; after that, starts are spaced so the
+    overall rate never exceeds `rate_per_second`, however many workers draw from the bucket.
+    """
+
+    def __init__(self, rate_per_second: float, capacity: float = 1.0) -> None:
+        self.rate_per_second = rate_per_second
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated_at
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+                self._updated_at = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate_per_second
+            time.sleep(wait)
+
+
 class EventBatchProcessor(Generic[PayloadT]):
-    """Run per-event extraction with consistent delays and browser lifecycle."""
+    """Run per-event extraction with adaptive delays and browser lifecycle."""
 
     def __init__(
         self,
@@ -31,47 +97,235 @@ class EventBatchProcessor(Generic[PayloadT]):
     ) -> None:
         self.settings = settings
         self.logger = logger
+        self._lock = threading.Lock()
+        self._delay = AdaptiveDelay(
+            settings.min_delay_seconds,
+            settings.max_delay_seconds,
+            settings.failure_backoff_threshold,
+        )
 
     def process(
         self,
         events: Sequence[CalendarEvent],
         extractor: Callable[[CalendarEvent], PayloadT | None],
         progress_message: str,
+        session_factory: SessionFactory | None = None,
+        on_result: ResultHandler[PayloadT] | None = None,
+        share_result: ResultSharer[PayloadT] | None = None,
+        keep_results: bool = True,
+        empty_results_are_misses: bool = False,
     ) -> tuple[list[tuple[CalendarEvent, PayloadT]], BatchProcessingSummary]:
-        results: list[tuple[CalendarEvent, PayloadT]] = []
-        summary = BatchProcessingSummary()
+        """Extract every event, handing results to `on_result` in input order as they complete.
 
-        for index, event in enumerate(events, start=1):
-            if not event.detail_id:
-                summary.skipped_events += 1
-                self.logger.debug("Skipping event %s because it has no detail ID", index)
-                self._apply_delay(index, len(events))
-                continue
+        Each detail ID is extracted once. With `share_result`, later events repeating a detail ID
+        receive a copy of the first event's payload, emitted right after it; otherwise they are
+        skipped. Pass `keep_results=False` with `on_result` to drop each result once it has been
+        handed over, so memory stays flat on long runs; the returned list is then empty.
 
-            payload = extractor(event)
+        Overlays that fail to load count toward the failure backoff. Empty results only count
+        with `empty_results_are_misses`, for extractors where every event should have data;
+        many indicators legitimately have no history or news.
+        """
+
+        payloads: dict[int, list[tuple[CalendarEvent, PayloadT]]] = {}
+        summary = BatchProcessingSummary()
+        events, duplicates = self._select_unique_detail_events(
+            events,
+            summary,
+            share_duplicates=share_result is not None,
+        )
+        total_events = len(events)
+        if not total_events:
+            # Nothing survived the filter, so do not start a browser session for an empty queue.
+            return [], summary
+        work_queue: queue.SimpleQueue[tuple[int, CalendarEvent]] = queue.SimpleQueue()
+        for item in enumerate(events, start=1):
+            work_queue.put(item)
+        emitter = _OrderedEmitter(payloads, on_result, keep_results)
+        worker_count = max(1, min(self.settings.max_concurrency, total_events))
+        rate_limiter = self._build_rate_limiter(worker_count)
 
+        def record(index: int, event: CalendarEvent, payload: PayloadT | None) -> None:
+            repeats = duplicates.get(event.detail_id, [])
             if payload:
-                results.append((event, payload))
-                summary.processed_events += 1
+                payloads[index] = [(event, payload)] + [
+                    (repeat, share_result(repeat, payload)) for repeat in repeats
+                ]
+                summary.processed_events += 1 + len(repeats)
                 if summary.processed_events % self.settings.batch_size == 0:
                     self.logger.info(progress_message, summary.processed_events)
             else:
-                summary.failed_events += 1
+                summary.failed_events += 1 + len(repeats)
+            emitter.complete(index)
+
+        # Cache hits never reach the site, so they bypass the rate limit, delay, and backoff.
+        if isinstance(extractor, CachedExtractor):
+            lookup, live_extractor = extractor.lookup, extractor.extract
+        else:
+            lookup, live_extractor = None, extractor
+
+        def run_worker(deliver: _Delivery[PayloadT]) -> None:
+            with session_factory() if session_factory is not None else nullcontext():
+                paced = False
+                while True:
+                    try:
+                        index, event = work_queue.get_nowait()
+                    except queue.Empty:
+                        return
+                    hit = lookup(event) if lookup is not None else None
+                    if hit is not None:
+                        deliver(index, event, hit.payload)
+                        continue
+                    # Only the gap between two live extractions is paced, so a worker whose
+                    # queue has drained stops without waiting.
+                    if paced:
+                        self._apply_delay()
+                    if rate_limiter is not None:
+                        rate_limiter.acquire()
+                    deliver(
+                        index,
+                        event,
+                        self._extract_event(index, event, live_extractor, empty_results_are_misses),
+                    )
+                    paced = True
 
-            self._apply_delay(index, len(events))
+        if worker_count == 1:
+            run_worker(record)
+        else:
+            self.logger.info("Processing events with %s concurrent workers", worker_count)
+            self._run_workers(worker_count, run_worker, record)
 
+        results = [result for index in sorted(payloads) for result in payloads[index]]
         return results, summary
 
-    def _apply_delay(self, index: int, total_events: int) -> None:
-        if index >= total_events:
-            return
+    def _run_workers(
+        self,
+        worker_count: int,
+        run_worker: Callable[[_Delivery[PayloadT]], None],
+        record: _Delivery[PayloadT],
+    ) -> None:
+        """Fan events out to worker threads and record their results on the calling thread."""
+
+        results_queue: queue.SimpleQueue[_WorkerResult[PayloadT] | None] = queue.SimpleQueue()
+
+        def worker() -> None:
+            try:
+                run_worker(lambda index, event, payload: results_queue.put((index, event, payload)))
+            finally:
+                results_queue.put(None)
 
-        if index % self.settings.batch_size == 0:
-            delay = self.settings.batch_delay_seconds
-            self.logger.info("Waiting %.1f seconds (batch delay)", delay)
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            futures = [executor.submit(worker) for _ in range(worker_count)]
+            finished_workers = 0
+            while finished_workers < worker_count:
+                result = results_queue.get()
+                if result is None:
+                    finished_workers += 1
+                else:
+                    record(*result)
+            for future in futures:
+                future.result()
+
+    def _extract_event(
+        self,
+        index: int,
+        event: CalendarEvent,
+        extractor: Callable[[CalendarEvent], PayloadT | None],
+        empty_results_are_misses: bool,
+    ) -> PayloadT | None:
+        try:
+            payload = extractor(event)
+        except RateLimitedError as error:
+            self.logger.warning("Throttled while extracting event %s: %s", index, error)
+            with self._lock:
+                self._delay.record_throttle()
+            return None
+        except DetailUnavailableError as error:
+            self.logger.debug("Could not load event %s: %s", index, error)
+            with self._lock:
+                self._delay.record_failure()
+            return None
+
+        with self._lock:
+            if payload or not empty_results_are_misses:
+                self._delay.record_success()
+            else:
+                self._delay.record_failure()
+        return payload
+
+    def _select_unique_detail_events(
+        self,
+        events: Sequence[CalendarEvent],
+        summary: BatchProcessingSummary,
+        share_duplicates: bool,
+    ) -> tuple[list[CalendarEvent], dict[str, list[CalendarEvent]]]:
+        unique_events: dict[str, CalendarEvent] = {}
+        duplicates: dict[str, list[CalendarEvent]] = {}
+        missing_count = 0
+        for event in events:
+            detail_id = event.detail_id
+            if not detail_id:
+                missing_count += 1
+            elif detail_id in unique_events:
+                duplicates.setdefault(detail_id, []).append(event)
+            else:
+                unique_events[detail_id] = event
+        selected = list(unique_events.values())
+
+        duplicate_count = len(events) - missing_count - len(selected)
+        if share_duplicates:
+            summary.skipped_events = missing_count
+            if duplicate_count:
+                self.logger.info("Reusing results for %s repeated detail IDs", duplicate_count)
         else:
-            delay = self.settings.request_delay_seconds
-            self.logger.debug("Waiting %.1f seconds", delay)
+            summary.skipped_events = missing_count + duplicate_count
+            duplicates = {}
+            if duplicate_count:
+                self.logger.info("Skipped %s duplicate detail IDs", duplicate_count)
+        if missing_count:
+            self.logger.info("Skipped %s events without detail IDs", missing_count)
+        return selected, duplicates
 
+    def _build_rate_limiter(self, worker_count: int) -> TokenBucket | None:
+        max_per_minute = self.settings.max_requests_per_minute
+        if max_per_minute <= 0:
+            return None
+        return TokenBucket(max_per_minute / 60.0, capacity=worker_count)
+
+    def _apply_delay(self) -> None:
+        with self._lock:
+            delay = self._delay.current
         if delay > 0:
+            self.logger.debug("Waiting %.1f seconds", delay)
             time.sleep(delay)
+
+
+class _OrderedEmitter(Generic[PayloadT]):
+    """Hand completed results to a handler in input order as workers finish."""
+
+    def __init__(
+        self,
+        payloads: dict[int, list[tuple[CalendarEvent, PayloadT]]],
+        on_result: ResultHandler[PayloadT] | None,
+        keep_results: bool = True,
+    ) -> None:
+        self._payloads = payloads
+        self._on_result = on_result
+        self._keep_results = keep_results
+        self._completed: set[int] = set()
+        self._next_index = 1
+
+    def complete(self, index: int) -> None:
+        if self._on_result is None:
+            return
+
+        self._completed.add(index)
+        while self._next_index in self._completed:
+            self._completed.discard(self._next_index)
+            if self._keep_results:
+                emitted = self._payloads.get(self._next_index, ())
+            else:
+                emitted = self._payloads.pop(self._next_index, ())
+            for result in emitted:
+                self._on_result(*result)
+            self._next_index += 1
@@ -0,0 +1,104 @@
+"""Read-through caching for per-event extractors."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from forexcalendar_scraper.core.config import Settings
+from forexcalendar_scraper.domain.entities import CalendarEvent
+from forexcalendar_scraper.ports import ExtractionCachePort
+
+PayloadT = TypeVar("PayloadT")
+
+
+@contextmanager
+def extraction_cache_run(cache: ExtractionCachePort | None) -> Iterator[None]:
+    """Release the cache's connection when a run ends, so only active runs keep it open."""
+
+    try:
+        yield
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+@dataclass(frozen=True, slots=True)
+class CacheHit(Generic[PayloadT]):
+    """A payload served from the extraction cache; `None` is a cached miss."""
+
+    payload: PayloadT | None
+
+
+class CachedExtractor(Generic[PayloadT]):
+    """Read-through cache around an extractor, including its misses.
+
+    `lookup` and `extract` are exposed separately so the batch processor can serve hits without
+    pacing or rate limiting them, since they never reach the site.
+    """
+
+    def __init__(
+        self,
+        extractor: Callable[[CalendarEvent], PayloadT | None],
+        cache: ExtractionCachePort,
+        settings: Settings,
+        logger: logging.Logger,
+        key_builder: Callable[[CalendarEvent], str],
+        encode: Callable[[PayloadT | None], str],
+        decode: Callable[[CalendarEvent, str], PayloadT | None],
+    ) -> None:
+        self._extractor = extractor
+        self._cache = cache
+        self._settings = settings
+        self._logger = logger
+        self._key_builder = key_builder
+        self._encode = encode
+        self._decode = decode
+
+    def __call__(self, event: CalendarEvent) -> PayloadT | None:
+        hit = self.lookup(event)
+        return hit.payload if hit is not None else self.extract(event)
+
+    def lookup(self, event: CalendarEvent) -> CacheHit[PayloadT] | None:
+        if self._settings.extraction_cache_refresh:
+            return None
+        key = self._key_builder(event)
+        cached_payload = self._cache.get(key)
+        if cached_payload is None:
+            return None
+        self._logger.debug("Using cached extraction for %s", key)
+        return CacheHit(self._decode(event, cached_payload))
+
+    def extract(self, event: CalendarEvent) -> PayloadT | None:
+        payload = self._extractor(event)
+        ttl_seconds = (
+            self._settings.extraction_cache_ttl_seconds
+            if payload
+            else self._settings.extraction_cache_negative_ttl_seconds
+        )
+        if ttl_seconds > 0:
+            self._cache.set(self._key_builder(event), self._encode(payload), ttl_seconds)
+        return payload
+
+
+def with_extraction_cache(
+    extractor: Callable[[CalendarEvent], PayloadT | None],
+    cache: ExtractionCachePort | None,
+    settings: Settings,
+    logger: logging.Logger,
+    key_builder: Callable[[CalendarEvent], str],
+    encode: Callable[[PayloadT | None], str],
+    decode: Callable[[CalendarEvent, str], PayloadT | None],
+) -> Callable[[CalendarEvent], PayloadT | None]:
+    """Wrap an extractor so cached payloads, including misses, skip browser work.
+
+    Only results the extractor returns are cached; errors such as `DetailUnavailableError`
+    propagate uncached, so a transient failure is retried on the next run.
+    """
+
+    if cache is None:
+        return extractor
+    return CachedExtractor(extractor, cache, settings, logger, key_builder, encode, decode)
@@ -6,9 +6,21 @@ from dataclasses import dataclass
 
 from forexcalendar_scraper.core.config import Settings
 from forexcalendar_scraper.core.constants import DEFAULT_EXTRACTOR_DATE_PARAM
-from forexcalendar_scraper.domain.entities import CommandResult, HistoryRecord
-from forexcalendar_scraper.ports import CalendarGatewayPort, EventRepositoryPort, EventStorePort, LoggerFactory, PathServicePort
+from forexcalendar_scraper.domain.entities import CalendarEvent, CommandResult, HistoryRecord
+from forexcalendar_scraper.ports import (
+    CalendarGatewayPort,
+    EventRepositoryPort,
+    EventStorePort,
+    ExtractionCachePort,
+    LoggerFactory,
+    PathServicePort,
+)
+from forexcalendar_scraper.utils.serialization import decode_json, encode_json
 from forexcalendar_scraper.application.event_processing import EventBatchProcessor
+from forexcalendar_scraper.application.extraction_cache import (
+    extraction_cache_run,
+    with_extraction_cache,
+)
 from forexcalendar_scraper.application.runtime import resolve_required_input_csv
 
 
@@ -20,6 +32,7 @@ class HistoryExtractionService:
     calendar_gateway: CalendarGatewayPort
     logger_factory: LoggerFactory
     event_store: EventStorePort | None = None
+    extraction_cache: ExtractionCachePort | None = None
 
     def run(
         self,
@@ -30,6 +43,7 @@ class HistoryExtractionService:
             "history_extractor",
             self.path_service.build_log_file_path("history_extractor"),
             self.settings.log_level,
+            self.settings.log_to_console,
         )
         resolved_csv_file = resolve_required_input_csv(self.path_service, csv_file, date_param)
         logger.info(
@@ -40,35 +54,87 @@ class HistoryExtractionService:
         logger.info("Found %s events to process", len(events))
 
         processor = EventBatchProcessor[list[HistoryRecord]](self.settings, logger)
-        results, summary = processor.process(
-            events,
+        # History tables depend only on the indicator, so the cache key omits the date param.
+        extractor = with_extraction_cache(
             lambda event: self.calendar_gateway.extract_history_records(event, date_param, logger),
-            "Processed %s history events so far",
+            self.extraction_cache,
+            self.settings,
+            logger,
+            key_builder=lambda event: f"history:{event.detail_id}",
+            encode=_encode_history_records,
+            decode=_decode_cached_history_records,
         )
+        output_file = self.path_service.build_output_file_path(date_param, "_history")
+        store_events = self.event_store is not None and self.event_store.is_enabled()
+        written_count = 0
+        with (
+            extraction_cache_run(self.extraction_cache),
+            self.csv_repository.open_history_record_writer(output_file) as writer,
+        ):
+
+            def write_records(_: CalendarEvent, records: list[HistoryRecord]) -> None:
+                nonlocal written_count
+                writer.write_many(records)
+                written_count += len(records)
+
+            results, summary = processor.process(
+                events,
+                extractor,
+                "Processed %s history events so far",
+                session_factory=lambda: self.calendar_gateway.open_session(
+                    logger,
+                    "history extraction",
+                ),
+                on_result=write_records,
+                share_result=lambda event, records: [
+                    record.with_event_context(event) for record in records
+                ],
+                keep_results=store_events,
+            )
 
-        history_records = [
-            history_record
-            for _, records in results
-            for history_record in records
-        ]
         result = CommandResult(
             processed_events=summary.processed_events,
             failed_events=summary.failed_events,
             skipped_events=summary.skipped_events,
         )
-        if history_records:
-            output_file = self.path_service.build_output_file_path(date_param, "_history")
-            self.csv_repository.save_history_records(output_file, history_records)
-            if self.event_store is not None and self.event_store.is_enabled():
+        if written_count:
+            if store_events:
                 self.event_store.replace_history_records(date_param, results)
             result.output_files["history"] = output_file
-            result.written_counts["history"] = len(history_records)
+            result.written_counts["history"] = written_count
             logger.info(
                 "Saved %s history records to %s",
-                len(history_records),
+                written_count,
                 self.path_service.display_path(output_file),
             )
         else:
             logger.warning("No history data found to save")
 
         return result
+
+
+def _encode_history_records(records: list[HistoryRecord] | None) -> str:
+    return encode_json(
+        [
+            [record.date, record.date_url, record.actual, record.forecast, record.previous]
+            for record in records or []
+        ]
+    )
+
+
+def _decode_cached_history_records(
+    event: CalendarEvent,
+    payload: str,
+) -> list[HistoryRecord] | None:
+    records = [
+        HistoryRecord(
+            detail_id=event.detail_id,
+            date=date,
+            date_url=date_url,
+            actual=actual,
+            forecast=forecast,
+            previous=previous,
+        ).with_event_context(event)
+        for date, date_url, actual, forecast, previous in decode_json(payload)
+    ]
+    return records or None
@@ -8,7 +8,7 @@ from forexcalendar_scraper.application.event_processing import EventBatchProcess
 from forexcalendar_scraper.application.runtime import resolve_required_input_csv
 from forexcalendar_scraper.core.config import Settings
 from forexcalendar_scraper.core.constants import DEFAULT_EXTRACTOR_DATE_PARAM
-from forexcalendar_scraper.domain.entities import CommandResult, HistoryNewsBundle
+from forexcalendar_scraper.domain.entities import CalendarEvent, CommandResult, HistoryNewsBundle
 from forexcalendar_scraper.ports import (
     CalendarGatewayPort,
     EventRepositoryPort,
@@ -31,11 +31,13 @@ class HistoryNewsExtractionService:
         self,
         csv_file: str | None = None,
         date_param: str = DEFAULT_EXTRACTOR_DATE_PARAM,
+        resume: bool = False,
     ) -> CommandResult:
         logger = self.logger_factory(
             "history_news_extractor",
             self.path_service.build_log_file_path("history_news_extractor"),
             self.settings.log_level,
+            self.settings.log_to_console,
         )
         resolved_csv_file = resolve_required_input_csv(self.path_service, csv_file, date_param)
         logger.info(
@@ -46,46 +48,67 @@ class HistoryNewsExtractionService:
         logger.info("Found %s events to process", len(events))
 
         processor = EventBatchProcessor[HistoryNewsBundle](self.settings, logger)
-        results, summary = processor.process(
-            events,
-            lambda event: self.calendar_gateway.extract_history_news_bundle(
-                event,
-                date_param,
-                logger,
-            ),
-            "Processed %s history/news events so far",
-        )
+        history_file = self.path_service.build_output_file_path(date_param, "_history")
+        news_file = self.path_service.build_output_file_path(date_param, "_news")
+        resumed_events = 0
+        if resume:
+            completed_ids = self.csv_repository.load_detail_ids(history_file)
+            completed_ids |= self.csv_repository.load_detail_ids(news_file)
+            pending_events = [event for event in events if event.detail_id not in completed_ids]
+            resumed_events = len(events) - len(pending_events)
+            events = pending_events
+            logger.info("Resuming: skipping %s events already in the output files", resumed_events)
+
+        store_events = self.event_store is not None and self.event_store.is_enabled()
+        history_count = 0
+        news_count = 0
+        repository = self.csv_repository
+        with (
+            repository.open_history_record_writer(history_file, append=resume) as history_writer,
+            repository.open_news_item_writer(news_file, append=resume) as news_writer,
+        ):
 
-        history_records = [
-            history_record
-            for _, bundle in results
-            for history_record in bundle.history
-        ]
-        news_items = [
-            news_item
-            for _, bundle in results
-            for news_item in bundle.news
-        ]
+            def write_bundle(_: CalendarEvent, bundle: HistoryNewsBundle) -> None:
+                nonlocal history_count, news_count
+                history_writer.write_many(bundle.history)
+                news_writer.write_many(bundle.news)
+                history_count += len(bundle.history)
+                news_count += len(bundle.news)
+
+            results, summary = processor.process(
+                events,
+                lambda event: self.calendar_gateway.extract_history_news_bundle(
+                    event,
+                    date_param,
+                    logger,
+                ),
+                "Processed %s history/news events so far",
+                session_factory=lambda: self.calendar_gateway.open_session(
+                    logger,
+                    "history and news extraction",
+                ),
+                on_result=write_bundle,
+                share_result=lambda event, bundle: bundle.with_event_context(event),
+                keep_results=store_events,
+            )
 
         result = CommandResult(
             processed_events=summary.processed_events,
             failed_events=summary.failed_events,
-            skipped_events=summary.skipped_events,
+            skipped_events=summary.skipped_events + resumed_events,
         )
-        if history_records:
-            history_file = self.path_service.build_output_file_path(date_param, "_history")
-            self.csv_repository.save_history_records(history_file, history_records)
+        if history_count:
             result.output_files["history"] = history_file
-            result.written_counts["history"] = len(history_records)
+            result.written_counts["history"] = history_count
             logger.info(
                 "Saved %s history records to %s",
-                len(history_records),
+                history_count,
                 self.path_service.display_path(history_file),
             )
         else:
             logger.warning("No history data found to save")
 
-        if self.event_store is not None and self.event_store.is_enabled():
+        if store_events:
             history_results = [
                 (event, bundle.history)
                 for event, bundle in results
@@ -94,20 +117,18 @@ class HistoryNewsExtractionService:
             if history_results:
                 self.event_store.replace_history_records(date_param, history_results)
 
-        if news_items:
-            news_file = self.path_service.build_output_file_path(date_param, "_news")
-            self.csv_repository.save_news_items(news_file, news_items)
+        if news_count:
             result.output_files["news"] = news_file
-            result.written_counts["news"] = len(news_items)
+            result.written_counts["news"] = news_count
             logger.info(
                 "Saved %s news items to %s",
-                len(news_items),
+                news_count,
                 self.path_service.display_path(news_file),
             )
         else:
             logger.warning("No news data found to save")
 
-        if self.event_store is not None and self.event_store.is_enabled():
+        if store_events:
             news_results = [
                 (event, bundle.news)
                 for event, bundle in results
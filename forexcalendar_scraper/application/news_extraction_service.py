@@ -8,7 +8,7 @@ from forexcalendar_scraper.application.event_processing import EventBatchProcess
 from forexcalendar_scraper.application.runtime import resolve_required_input_csv
 from forexcalendar_scraper.core.config import Settings
 from forexcalendar_scraper.core.constants import DEFAULT_EXTRACTOR_DATE_PARAM
-from forexcalendar_scraper.domain.entities import CommandResult, NewsItem
+from forexcalendar_scraper.domain.entities import CalendarEvent, CommandResult, NewsItem
 from forexcalendar_scraper.ports import (
     CalendarGatewayPort,
     EventRepositoryPort,
@@ -36,6 +36,7 @@ class NewsExtractionService:
             "news_extractor",
             self.path_service.build_log_file_path("news_extractor"),
             self.settings.log_level,
+            self.settings.log_to_console,
         )
         resolved_csv_file = resolve_required_input_csv(self.path_service, csv_file, date_param)
         logger.info(
@@ -46,28 +47,48 @@ class NewsExtractionService:
         logger.info("Found %s events to process", len(events))
 
         processor = EventBatchProcessor[list[NewsItem]](self.settings, logger)
-        results, summary = processor.process(
-            events,
-            lambda event: self.calendar_gateway.extract_news_items(event, date_param, logger),
-            "Processed %s news events so far",
+        output_file = self.path_service.build_output_file_path(
+            date_param,
+            "_news",
+            extension=f".{self.settings.news_output_format}",
         )
+        store_events = self.event_store is not None and self.event_store.is_enabled()
+        written_count = 0
+        with self.csv_repository.open_news_item_writer(output_file) as writer:
+
+            def write_news_items(_: CalendarEvent, news_items: list[NewsItem]) -> None:
+                nonlocal written_count
+                writer.write_many(news_items)
+                written_count += len(news_items)
+
+            results, summary = processor.process(
+                events,
+                lambda event: self.calendar_gateway.extract_news_items(event, date_param, logger),
+                "Processed %s news events so far",
+                session_factory=lambda: self.calendar_gateway.open_session(
+                    logger,
+                    "news extraction",
+                ),
+                on_result=write_news_items,
+                share_result=lambda event, news_items: [
+                    item.with_event_context(event) for item in news_items
+                ],
+                keep_results=store_events,
+            )
 
-        news_items = [news_item for _, records in results for news_item in records]
         result = CommandResult(
             processed_events=summary.processed_events,
             failed_events=summary.failed_events,
             skipped_events=summary.skipped_events,
         )
-        if news_items:
-            output_file = self.path_service.build_output_file_path(date_param, "_news")
-            self.csv_repository.save_news_items(output_file, news_items)
-            if self.event_store is not None and self.event_store.is_enabled():
+        if written_count:
+            if store_events:
                 self.event_store.replace_news_items(date_param, results)
             result.output_files["news"] = output_file
-            result.written_counts["news"] = len(news_items)
+            result.written_counts["news"] = written_count
             logger.info(
                 "Saved %s news items to %s",
-                len(news_items),
+                written_count,
                 self.path_service.display_path(output_file),
             )
         else:
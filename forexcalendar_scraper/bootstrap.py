@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from forexcalendar_scraper.application import (
     CalendarScraperService,
     DetailExtractionService,
@@ -17,17 +19,26 @@ from forexcalendar_scraper.core.logging import configure_logger
 from forexcalendar_scraper.core.paths import get_default_path_service
 from forexcalendar_scraper.infrastructure.persistence.csv_repository import CsvRepository
 from forexcalendar_scraper.infrastructure.persistence.null_event_store import NullEventStore
-from forexcalendar_scraper.infrastructure.web.browser import BrowserSessionFactory
-from forexcalendar_scraper.infrastructure.web.forexfactory_client import ForexFactoryClient
-from forexcalendar_scraper.infrastructure.web.forexfactory_gateway import ForexFactoryGateway
+from forexcalendar_scraper.infrastructure.persistence.sqlite_extraction_cache import (
+    SqliteExtractionCache,
+)
 from forexcalendar_scraper.ports import (
     CalendarGatewayPort,
     EventRepositoryPort,
     EventStorePort,
+    ExtractionCachePort,
     LoggerFactory,
     PathServicePort,
 )
 
+if TYPE_CHECKING:
+    from forexcalendar_scraper.infrastructure.web.forexfactory_http_client import (
+        ForexFactoryHttpClient,
+    )
+
+
+EXTRACTION_CACHE_NAME = "extraction_cache"
+
 
 def _resolve_settings(settings: Settings | None) -> Settings:
     return settings or get_settings()
@@ -40,13 +51,40 @@ def build_calendar_gateway(
     if calendar_gateway is not None:
         return calendar_gateway
 
+    # Playwright is imported here rather than at module level, so commands that never scrape,
+    # such as detail queries, skip its import cost at startup.
+    from forexcalendar_scraper.infrastructure.web import (
+        BrowserSessionFactory,
+        ForexFactoryClient,
+        ForexFactoryGateway,
+    )
+
     resolved_settings = _resolve_settings(settings)
     return ForexFactoryGateway(
         browser_factory=BrowserSessionFactory(resolved_settings),
         client=ForexFactoryClient(resolved_settings),
+        http_client=build_http_client(resolved_settings),
     )
 
 
+def build_http_client(settings: Settings | None = None) -> ForexFactoryHttpClient | None:
+    resolved_settings = _resolve_settings(settings)
+    if not resolved_settings.http_fast_path_enabled:
+        return None
+
+    try:
+        from forexcalendar_scraper.infrastructure.web.forexfactory_http_client import (
+            ForexFactoryHttpClient,
+        )
+    except ModuleNotFoundError as error:
+        raise OptionalDependencyError(
+            "The HTTP fast path requires optional HTTP dependencies. "
+            "Install with `pip install -e '.[http]'`."
+        ) from error
+
+    return ForexFactoryHttpClient(resolved_settings)
+
+
 def build_csv_repository(repository: EventRepositoryPort | None = None) -> EventRepositoryPort:
     return repository or CsvRepository()
 
@@ -79,6 +117,22 @@ def build_event_store(
     return PostgresEventStore(resolved_settings.postgres_dsn)
 
 
+def build_extraction_cache(
+    settings: Settings | None = None,
+    path_service: PathServicePort | None = None,
+    extraction_cache: ExtractionCachePort | None = None,
+) -> ExtractionCachePort | None:
+    if extraction_cache is not None:
+        return extraction_cache
+
+    resolved_settings = _resolve_settings(settings)
+    if not resolved_settings.extraction_cache_enabled:
+        return None
+
+    resolved_path_service = build_path_service(path_service)
+    return SqliteExtractionCache(resolved_path_service.build_cache_file_path(EXTRACTION_CACHE_NAME))
+
+
 def build_logger_factory(logger_factory: LoggerFactory | None = None) -> LoggerFactory:
     return logger_factory or configure_logger
 
@@ -109,15 +163,22 @@ def build_detail_extraction_service(
     calendar_gateway: CalendarGatewayPort | None = None,
     logger_factory: LoggerFactory | None = None,
     event_store: EventStorePort | None = None,
+    extraction_cache: ExtractionCachePort | None = None,
 ) -> DetailExtractionService:
     resolved_settings = _resolve_settings(settings)
+    resolved_path_service = build_path_service(path_service)
     return DetailExtractionService(
         settings=resolved_settings,
-        path_service=build_path_service(path_service),
+        path_service=resolved_path_service,
         csv_repository=build_csv_repository(repository),
         calendar_gateway=build_calendar_gateway(resolved_settings, calendar_gateway),
         logger_factory=build_logger_factory(logger_factory),
         event_store=build_event_store(resolved_settings, event_store),
+        extraction_cache=build_extraction_cache(
+            resolved_settings,
+            resolved_path_service,
+            extraction_cache,
+        ),
     )
 
 
@@ -128,15 +189,22 @@ def build_history_extraction_service(
     calendar_gateway: CalendarGatewayPort | None = None,
     logger_factory: LoggerFactory | None = None,
     event_store: EventStorePort | None = None,
+    extraction_cache: ExtractionCachePort | None = None,
 ) -> HistoryExtractionService:
     resolved_settings = _resolve_settings(settings)
+    resolved_path_service = build_path_service(path_service)
     return HistoryExtractionService(
         settings=resolved_settings,
-        path_service=build_path_service(path_service),
+        path_service=resolved_path_service,
         csv_repository=build_csv_repository(repository),
         calendar_gateway=build_calendar_gateway(resolved_settings, calendar_gateway),
         logger_factory=build_logger_factory(logger_factory),
         event_store=build_event_store(resolved_settings, event_store),
+        extraction_cache=build_extraction_cache(
+            resolved_settings,
+            resolved_path_service,
+            extraction_cache,
+        ),
     )
 
 
@@ -181,10 +249,20 @@ def build_history_news_extraction_service(
 def build_detail_query_service(
     path_service: PathServicePort | None = None,
     repository: EventRepositoryPort | None = None,
+    settings: Settings | None = None,
+    extraction_cache: ExtractionCachePort | None = None,
 ) -> DetailQueryService:
+    resolved_settings = _resolve_settings(settings)
+    resolved_path_service = build_path_service(path_service)
+    # Queries are read-only, so they only reuse a cache that an extraction run already created.
+    cache_file = resolved_path_service.build_cache_file_path(EXTRACTION_CACHE_NAME)
+    if extraction_cache is None and cache_file.exists():
+        extraction_cache = build_extraction_cache(resolved_settings, resolved_path_service)
     return DetailQueryService(
-        path_service=build_path_service(path_service),
+        path_service=resolved_path_service,
         csv_repository=build_csv_repository(repository),
+        extraction_cache=extraction_cache,
+        cache_ttl_seconds=resolved_settings.extraction_cache_ttl_seconds,
     )
 
 
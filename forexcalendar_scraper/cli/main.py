@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 import sys
 from collections.abc import Callable, Sequence
+from dataclasses import replace
 
 from forexcalendar_scraper.bootstrap import (
     build_calendar_scraper_service,
@@ -13,12 +14,17 @@ from forexcalendar_scraper.bootstrap import (
     build_history_extraction_service,
     build_history_news_extraction_service,
     build_news_extraction_service,
+    build_path_service,
 )
+from forexcalendar_scraper.core.config import Settings, get_settings
 from forexcalendar_scraper.core.constants import (
     DEFAULT_EXTRACTOR_DATE_PARAM,
     DEFAULT_SCRAPER_DATE_PARAM,
+    EVENT_OUTPUT_FORMATS,
+    NEWS_OUTPUT_FORMATS,
 )
 from forexcalendar_scraper.core.exceptions import ForexCalendarError
+from forexcalendar_scraper.core.paths import build_consecutive_week_params
 
 CommandHandler = Callable[[argparse.Namespace], int]
 
@@ -36,18 +42,101 @@ def configure_scraper_parser(parser: argparse.ArgumentParser) -> argparse.Argume
 Examples:
     forexcalendar-scrape
     forexcalendar-scrape --date-param day=oct6.2025
+    forexcalendar-scrape --date-param day=oct6.2025 day=oct7.2025 day=oct8.2025 --workers 3
+    forexcalendar-scrape --date-param week=oct6.2025 --weeks 4
     python3 -m forexcalendar_scraper scrape --date-param week=oct21.2025
 """
     parser.add_argument(
         "--date-param",
         "--url-params",
         dest="date_param",
-        default=DEFAULT_SCRAPER_DATE_PARAM,
-        help="ForexFactory date parameter such as day=oct6.2025 or week=oct21.2025.",
+        nargs="+",
+        default=[DEFAULT_SCRAPER_DATE_PARAM],
+        help=(
+            "One or more ForexFactory date parameters such as day=oct6.2025 or week=oct21.2025."
+        ),
+    )
+    parser.add_argument(
+        "--weeks",
+        type=int,
+        help=(
+            "Also scrape the weeks after each week=... date parameter, for this many weeks "
+            "in total. The weeks share each worker's browser."
+        ),
     )
+    parser.add_argument(
+        "--max-concurrency",
+        "--workers",
+        type=int,
+        help=(
+            "Number of date parameters to scrape in parallel, each worker with its own browser. "
+            "Defaults to FOREXFACTORY_MAX_CONCURRENCY."
+        ),
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=EVENT_OUTPUT_FORMATS,
+        help=(
+            "Write events as CSV or as zstd-compressed Parquet (needs the parquet extra). "
+            "The extractors read the CSV. Defaults to FOREXFACTORY_EVENTS_OUTPUT_FORMAT (csv)."
+        ),
+    )
+    _add_run_arguments(parser)
     return parser
 
 
+def _add_run_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--block-ads",
+        action=argparse.BooleanOptionalAction,
+        help=(
+            "Abort browser requests to known ad and analytics domains. "
+            "Defaults to FOREXFACTORY_BLOCK_ADS (on)."
+        ),
+    )
+    parser.add_argument(
+        "--persistent",
+        action="store_true",
+        help="Keep a persistent Chromium profile under outputs/cache/browser_profile.",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=str,
+        help=(
+            "Persistent Chromium profile directory so HTTP and code caches survive runs. "
+            "Defaults to FOREXFACTORY_BROWSER_PROFILE_DIR."
+        ),
+    )
+    parser.add_argument(
+        "--storage-state",
+        type=str,
+        help=(
+            "JSON file that keeps captured cookies and storage between runs. "
+            "Defaults to FOREXFACTORY_STORAGE_STATE_FILE."
+        ),
+    )
+    parser.add_argument(
+        "--verbose",
+        "--debug",
+        action="store_true",
+        help="Log at DEBUG level instead of FOREXFACTORY_LOG_LEVEL.",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Write logs only to the log file, not the console (e.g. in CI).",
+    )
+    parser.add_argument(
+        "--http-fast-path",
+        "--no-browser",
+        action="store_true",
+        help=(
+            "Fetch pages over plain HTTP first and only start Chromium when that fails "
+            "(needs the http extra). Defaults to FOREXFACTORY_HTTP_FAST_PATH."
+        ),
+    )
+
+
 def configure_extractor_parser(
     parser: argparse.ArgumentParser,
     description: str,
@@ -69,6 +158,72 @@ def configure_extractor_parser(
         default=DEFAULT_EXTRACTOR_DATE_PARAM,
         help="ForexFactory date parameter such as day=oct22.2025.",
     )
+    parser.add_argument(
+        "--max-concurrency",
+        "--max-parallel-pages",
+        "--workers",
+        type=int,
+        help=(
+            "Number of events to extract in parallel, each worker with its own browser. "
+            "Defaults to FOREXFACTORY_MAX_CONCURRENCY."
+        ),
+    )
+    parser.add_argument(
+        "--min-delay",
+        type=float,
+        help=(
+            "Minimum seconds to wait between events; throttling backs off from here. "
+            "Defaults to FOREXFACTORY_MIN_DELAY_SECONDS."
+        ),
+    )
+    parser.add_argument(
+        "--max-requests-per-minute",
+        type=float,
+        help=(
+            "Event extractions started per minute across all workers; 0 disables the limit. "
+            "Defaults to FOREXFACTORY_MAX_REQUESTS_PER_MINUTE."
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the on-disk extraction cache for this run.",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        help=(
+            "Seconds to keep successful cached extractions. "
+            "Defaults to FOREXFACTORY_CACHE_TTL_SECONDS."
+        ),
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached extraction results but store fresh ones.",
+    )
+    _add_run_arguments(parser)
+    return parser
+
+
+def _add_resume_argument(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip events already present in the output CSVs and append new rows to them.",
+    )
+    return parser
+
+
+def _add_output_format_argument(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    parser.add_argument(
+        "--output-format",
+        choices=NEWS_OUTPUT_FORMATS,
+        help=(
+            "Write news items as CSV or as JSON Lines (one object per item). "
+            "Defaults to FOREXFACTORY_NEWS_OUTPUT_FORMAT (csv)."
+        ),
+    )
     return parser
 
 
@@ -149,20 +304,22 @@ Examples:
 
 
 def build_news_extractor_parser() -> argparse.ArgumentParser:
-    return configure_extractor_parser(
+    parser = configure_extractor_parser(
                 _raw_text_parser(prog="forexcalendar-news-extract"),
         "Extract related news links for events that have ForexFactory detail IDs.",
         """
 Examples:
     forexcalendar-news-extract
     forexcalendar-news-extract --date-param day=oct22.2025
+    forexcalendar-news-extract --date-param day=oct22.2025 --output-format jsonl
     python3 -m forexcalendar_scraper news --csv-file outputs/oct-22-2025/day=oct22.2025.csv
 """,
     )
+    return _add_output_format_argument(parser)
 
 
 def build_history_news_extractor_parser() -> argparse.ArgumentParser:
-    return configure_extractor_parser(
+    parser = configure_extractor_parser(
                 _raw_text_parser(prog="forexcalendar-history-news-extract"),
         "Extract both historical release data and related news links in one pass.",
         """
@@ -170,8 +327,10 @@ Examples:
     forexcalendar-history-news-extract
     forexcalendar-history-news-extract --date-param day=oct22.2025
     python3 -m forexcalendar_scraper history-news --csv-file outputs/oct-22-2025/day=oct22.2025.csv
+    forexcalendar-history-news-extract --date-param day=oct22.2025 --resume
 """,
     )
+    return _add_resume_argument(parser)
 
 
 def build_query_details_parser() -> argparse.ArgumentParser:
@@ -230,6 +389,7 @@ def build_main_parser() -> argparse.ArgumentParser:
         "Extract related news links for events that have ForexFactory detail IDs.",
         "",
     )
+    _add_output_format_argument(news_parser)
     news_parser.set_defaults(handler=_run_news_extractor_command)
 
     history_news_parser = configure_extractor_parser(
@@ -241,6 +401,7 @@ def build_main_parser() -> argparse.ArgumentParser:
         "Extract both historical release data and related news links in one pass.",
         "",
     )
+    _add_resume_argument(history_news_parser)
     history_news_parser.set_defaults(handler=_run_history_news_extractor_command)
 
     query_parser = configure_query_details_parser(
@@ -272,28 +433,82 @@ def _run_with_error_handling(handler: CommandHandler, args: argparse.Namespace)
         return 1
 
 
+def _resolve_run_settings(args: argparse.Namespace) -> Settings:
+    settings = get_settings()
+    if args.block_ads is not None:
+        settings = replace(settings, block_ads=args.block_ads)
+    if args.profile_dir:
+        settings = replace(settings, browser_profile_dir=args.profile_dir)
+    elif args.persistent:
+        profile_dir = build_path_service().build_browser_profile_path()
+        settings = replace(settings, browser_profile_dir=str(profile_dir))
+    if args.storage_state:
+        settings = replace(settings, storage_state_file=args.storage_state)
+    if args.verbose:
+        settings = replace(settings, log_level="DEBUG")
+    if args.quiet:
+        settings = replace(settings, log_to_console=False)
+    if args.http_fast_path:
+        settings = replace(settings, http_fast_path_enabled=True)
+    return settings
+
+
+def _resolve_extractor_settings(args: argparse.Namespace) -> Settings:
+    settings = _resolve_run_settings(args)
+    if args.max_concurrency is not None:
+        settings = replace(settings, max_concurrency=args.max_concurrency)
+    if args.min_delay is not None:
+        settings = replace(settings, min_delay_seconds=args.min_delay)
+    if args.max_requests_per_minute is not None:
+        settings = replace(settings, max_requests_per_minute=args.max_requests_per_minute)
+    if args.no_cache:
+        settings = replace(settings, extraction_cache_enabled=False)
+    if args.refresh:
+        settings = replace(settings, extraction_cache_refresh=True)
+    if args.cache_ttl is not None:
+        settings = replace(settings, extraction_cache_ttl_seconds=args.cache_ttl)
+    return settings
+
+
 def _display_path(service: object, key: str, result: object) -> str:
     output_file = result.output_files[key]
     return service.path_service.display_path(output_file)
 
 
 def _run_scraper_command(args: argparse.Namespace) -> int:
-    service = build_calendar_scraper_service()
-    result = service.run(date_param=args.date_param)
-    if "events" not in result.output_files:
-        print("No events found to save")
-        return 0
-
-    print(
-        "Scraped "
-        f"{result.written_counts['events']} events and saved to "
-        f"{_display_path(service, 'events', result)}"
-    )
-    return 0
+    settings = _resolve_run_settings(args)
+    if args.max_concurrency is not None:
+        settings = replace(settings, max_concurrency=args.max_concurrency)
+    if args.output_format:
+        settings = replace(settings, events_output_format=args.output_format)
+    date_params = args.date_param
+    if args.weeks is not None:
+        date_params = [
+            week_param
+            for date_param in date_params
+            for week_param in build_consecutive_week_params(date_param, args.weeks)
+        ]
+    service = build_calendar_scraper_service(settings=settings)
+    exit_code = 0
+    for date_param, result in zip(date_params, service.run_many(date_params), strict=True):
+        if result.failed_events:
+            print(f"Failed to scrape {date_param}; see the scraper log for details")
+            exit_code = 1
+            continue
+        if "events" not in result.output_files:
+            print(f"No events found to save for {date_param}")
+            continue
+
+        print(
+            "Scraped "
+            f"{result.written_counts['events']} events and saved to "
+            f"{_display_path(service, 'events', result)}"
+        )
+    return exit_code
 
 
 def _run_detail_extractor_command(args: argparse.Namespace) -> int:
-    service = build_detail_extraction_service()
+    service = build_detail_extraction_service(settings=_resolve_extractor_settings(args))
     result = service.run(csv_file=args.csv_file, date_param=args.date_param)
     if "details" not in result.output_files:
         print("No event details found to save")
@@ -308,7 +523,7 @@ def _run_detail_extractor_command(args: argparse.Namespace) -> int:
 
 
 def _run_history_extractor_command(args: argparse.Namespace) -> int:
-    service = build_history_extraction_service()
+    service = build_history_extraction_service(settings=_resolve_extractor_settings(args))
     result = service.run(csv_file=args.csv_file, date_param=args.date_param)
     if "history" not in result.output_files:
         print("No history data found to save")
@@ -323,7 +538,10 @@ def _run_history_extractor_command(args: argparse.Namespace) -> int:
 
 
 def _run_news_extractor_command(args: argparse.Namespace) -> int:
-    service = build_news_extraction_service()
+    settings = _resolve_extractor_settings(args)
+    if args.output_format:
+        settings = replace(settings, news_output_format=args.output_format)
+    service = build_news_extraction_service(settings=settings)
     result = service.run(csv_file=args.csv_file, date_param=args.date_param)
     if "news" not in result.output_files:
         print("No news data found to save")
@@ -338,8 +556,8 @@ def _run_news_extractor_command(args: argparse.Namespace) -> int:
 
 
 def _run_history_news_extractor_command(args: argparse.Namespace) -> int:
-    service = build_history_news_extraction_service()
-    result = service.run(csv_file=args.csv_file, date_param=args.date_param)
+    service = build_history_news_extraction_service(settings=_resolve_extractor_settings(args))
+    result = service.run(csv_file=args.csv_file, date_param=args.date_param, resume=args.resume)
     messages: list[str] = []
     if "history" in result.output_files:
         messages.append(
@@ -8,7 +8,12 @@ from functools import lru_cache
 from os import environ
 from pathlib import Path
 
-from forexcalendar_scraper.core.constants import DEFAULT_USER_AGENT
+from forexcalendar_scraper.core.constants import (
+    BLOCKED_RESOURCE_TYPES,
+    DEFAULT_USER_AGENT,
+    EVENT_OUTPUT_FORMATS,
+    NEWS_OUTPUT_FORMATS,
+)
 
 
 def _read_bool(source: Mapping[str, str], name: str, default: bool) -> bool:
@@ -32,6 +37,25 @@ def _read_float(source: Mapping[str, str], name: str, default: float) -> float:
     return float(raw_value.strip())
 
 
+def _read_csv(source: Mapping[str, str], name: str, default: tuple[str, ...]) -> tuple[str, ...]:
+    raw_value = source.get(name)
+    if raw_value is None:
+        return default
+    return tuple(item.strip().lower() for item in raw_value.split(",") if item.strip())
+
+
+def _read_choice(
+    source: Mapping[str, str],
+    name: str,
+    choices: tuple[str, ...],
+    default: str,
+) -> str:
+    value = source.get(name, default).strip().lower()
+    if value not in choices:
+        raise ValueError(f"{name} must be one of {', '.join(choices)}, got {value!r}")
+    return value
+
+
 def _load_dotenv_values(dotenv_path: Path) -> dict[str, str]:
     values: dict[str, str] = {}
     if not dotenv_path.exists():
@@ -62,14 +86,34 @@ class Settings:
 
     forex_factory_base_url: str = "https://www.forexfactory.com/calendar"
     browser_headless: bool = True
+    browser_profile_dir: str = ""
     user_agent: str = DEFAULT_USER_AGENT
+    blocked_resource_types: tuple[str, ...] = BLOCKED_RESOURCE_TYPES
+    block_ads: bool = True
+    share_storage_state: bool = True
+    storage_state_file: str = ""
+    context_recycle_events: int = 25
     log_level: str = "INFO"
+    log_to_console: bool = True
     calendar_timeout_ms: int = 15_000
     overlay_timeout_ms: int = 5_000
-    detail_render_wait_seconds: float = 2.0
-    request_delay_seconds: float = 3.0
-    batch_delay_seconds: float = 5.0
+    event_timeout_ms: int = 10_000
+    hash_navigation_enabled: bool = True
+    min_delay_seconds: float = 0.0
+    max_delay_seconds: float = 30.0
+    failure_backoff_threshold: int = 3
+    max_requests_per_minute: float = 0.0
     batch_size: int = 5
+    max_concurrency: int = 1
+    extraction_cache_enabled: bool = True
+    extraction_cache_refresh: bool = False
+    extraction_cache_ttl_seconds: float = 86_400.0
+    extraction_cache_negative_ttl_seconds: float = 3_600.0
+    http_fast_path_enabled: bool = False
+    news_output_format: str = "csv"
+    events_output_format: str = "csv"
+    detail_endpoint_url: str = "https://www.forexfactory.com/calendar/details/1-{detail_id}"
+    http_timeout_seconds: float = 10.0
     api_host: str = "127.0.0.1"
     api_port: int = 8000
     api_reload: bool = False
@@ -93,26 +137,67 @@ class Settings:
                 "https://www.forexfactory.com/calendar",
             ).strip(),
             browser_headless=_read_bool(source, "FOREXFACTORY_HEADLESS", True),
+            browser_profile_dir=source.get("FOREXFACTORY_BROWSER_PROFILE_DIR", "").strip(),
             user_agent=source.get("FOREXFACTORY_USER_AGENT", DEFAULT_USER_AGENT).strip(),
+            blocked_resource_types=_read_csv(
+                source,
+                "FOREXFACTORY_BLOCKED_RESOURCE_TYPES",
+                BLOCKED_RESOURCE_TYPES,
+            ),
+            block_ads=_read_bool(source, "FOREXFACTORY_BLOCK_ADS", True),
+            share_storage_state=_read_bool(source, "FOREXFACTORY_SHARE_STORAGE_STATE", True),
+            storage_state_file=source.get("FOREXFACTORY_STORAGE_STATE_FILE", "").strip(),
+            context_recycle_events=_read_int(source, "FOREXFACTORY_CONTEXT_RECYCLE_EVENTS", 25),
             log_level=source.get("FOREXFACTORY_LOG_LEVEL", "INFO").strip().upper(),
+            log_to_console=_read_bool(source, "FOREXFACTORY_LOG_TO_CONSOLE", True),
             calendar_timeout_ms=_read_int(source, "FOREXFACTORY_CALENDAR_TIMEOUT_MS", 15_000),
             overlay_timeout_ms=_read_int(source, "FOREXFACTORY_OVERLAY_TIMEOUT_MS", 5_000),
-            detail_render_wait_seconds=_read_float(
+            event_timeout_ms=_read_int(source, "FOREXFACTORY_EVENT_TIMEOUT_MS", 10_000),
+            hash_navigation_enabled=_read_bool(source, "FOREXFACTORY_HASH_NAVIGATION", True),
+            min_delay_seconds=_read_float(source, "FOREXFACTORY_MIN_DELAY_SECONDS", 0.0),
+            max_delay_seconds=_read_float(source, "FOREXFACTORY_MAX_DELAY_SECONDS", 30.0),
+            failure_backoff_threshold=_read_int(
                 source,
-                "FOREXFACTORY_RENDER_WAIT_SECONDS",
-                2.0,
+                "FOREXFACTORY_FAILURE_BACKOFF_THRESHOLD",
+                3,
             ),
-            request_delay_seconds=_read_float(
+            max_requests_per_minute=_read_float(
                 source,
-                "FOREXFACTORY_REQUEST_DELAY_SECONDS",
-                3.0,
+                "FOREXFACTORY_MAX_REQUESTS_PER_MINUTE",
+                0.0,
             ),
-            batch_delay_seconds=_read_float(
+            batch_size=_read_int(source, "FOREXFACTORY_BATCH_SIZE", 5),
+            max_concurrency=_read_int(source, "FOREXFACTORY_MAX_CONCURRENCY", 1),
+            extraction_cache_enabled=_read_bool(source, "FOREXFACTORY_CACHE_ENABLED", True),
+            extraction_cache_refresh=_read_bool(source, "FOREXFACTORY_CACHE_REFRESH", False),
+            extraction_cache_ttl_seconds=_read_float(
                 source,
-                "FOREXFACTORY_BATCH_DELAY_SECONDS",
-                5.0,
+                "FOREXFACTORY_CACHE_TTL_SECONDS",
+                86_400.0,
             ),
-            batch_size=_read_int(source, "FOREXFACTORY_BATCH_SIZE", 5),
+            extraction_cache_negative_ttl_seconds=_read_float(
+                source,
+                "FOREXFACTORY_CACHE_NEGATIVE_TTL_SECONDS",
+                3_600.0,
+            ),
+            http_fast_path_enabled=_read_bool(source, "FOREXFACTORY_HTTP_FAST_PATH", False),
+            news_output_format=_read_choice(
+                source,
+                "FOREXFACTORY_NEWS_OUTPUT_FORMAT",
+                NEWS_OUTPUT_FORMATS,
+                "csv",
+            ),
+            events_output_format=_read_choice(
+                source,
+                "FOREXFACTORY_EVENTS_OUTPUT_FORMAT",
+                EVENT_OUTPUT_FORMATS,
+                "csv",
+            ),
+            detail_endpoint_url=source.get(
+                "FOREXFACTORY_DETAIL_ENDPOINT_URL",
+                "https://www.forexfactory.com/calendar/details/1-{detail_id}",
+            ).strip(),
+            http_timeout_seconds=_read_float(source, "FOREXFACTORY_HTTP_TIMEOUT_SECONDS", 10.0),
             api_host=source.get("FOREXFACTORY_API_HOST", "127.0.0.1").strip(),
             api_port=_read_int(source, "FOREXFACTORY_API_PORT", 8000),
             api_reload=_read_bool(source, "FOREXFACTORY_API_RELOAD", False),
@@ -6,7 +6,12 @@ from typing import Final
 DEFAULT_SCRAPER_DATE_PARAM: Final[str] = "day=oct2.2025"
 DEFAULT_EXTRACTOR_DATE_PARAM: Final[str] = "day=oct6.2025"
 DETAILS_FILE_GLOB: Final[str] = "*_details.csv"
+NEWS_OUTPUT_FORMATS: Final[tuple[str, ...]] = ("csv", "jsonl")
+EVENT_OUTPUT_FORMATS: Final[tuple[str, ...]] = ("csv", "parquet")
 DATE_PARAM_PATTERN_TEXT: Final[str] = r"^(day|week)=([a-z]{3})(\d{1,2})\.(\d{4})$"
+MONTH_ABBREVIATIONS: Final[tuple[str, ...]] = (
+    "jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"
+)
 
 DEFAULT_USER_AGENT: Final[str] = (
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
@@ -19,22 +24,46 @@ BROWSER_ARGS: Final[tuple[str, ...]] = (
     "--no-sandbox",
     "--disable-dev-shm-usage",
 )
+BLOCKED_RESOURCE_TYPES: Final[tuple[str, ...]] = ("image", "font", "media", "stylesheet")
+AD_DOMAINS: Final[tuple[str, ...]] = (
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "adservice.google.com",
+    "amazon-adsystem.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "facebook.net",
+    "facebook.com",
+)
+TRACKER_PATH_PATTERN_TEXT: Final[str] = (
+    r"/(analytics|gtm|gtag|doubleclick|pixel|beacon|ads)([/.?]|$)"
+)
+STORAGE_STATE_MAX_AGE_SECONDS: Final[float] = 600.0
+THROTTLE_STATUS_CODES: Final[frozenset[int]] = frozenset({429, 503})
 VIEWPORT_WIDTH: Final[int] = 1920
 VIEWPORT_HEIGHT: Final[int] = 1080
 
 CALENDAR_TABLE_SELECTOR: Final[str] = "table.calendar__table tbody"
 CALENDAR_ROW_SELECTOR: Final[str] = "table.calendar__table tbody tr"
+# Event row cells in `CalendarEvent` field order; the impact cell is read from its icon's title.
+CALENDAR_EVENT_CELL_CLASSES: Final[tuple[str, ...]] = (
+    "calendar__time",
+    "calendar__currency",
+    "calendar__impact",
+    "calendar__event",
+    "calendar__actual",
+    "calendar__forecast",
+    "calendar__previous",
+)
+CALENDAR_IMPACT_CELL_CLASS: Final[str] = "calendar__impact"
 
 DETAIL_OVERLAY_SELECTORS: Final[tuple[str, ...]] = (
     ".overlay__content",
     ".calendar__detail",
-)
-DETAIL_CONTAINER_SELECTORS: Final[tuple[str, ...]] = (
-    "[data-event-id='{detail_id}']",
-    ".calendar__detail",
     ".calendar-detail",
-    "#detail",
-    "[id*='detail']",
 )
 DETAIL_SPECS_TABLE_SELECTORS: Final[tuple[str, ...]] = (
     "table.calendarspecs",
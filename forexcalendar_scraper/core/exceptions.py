@@ -9,6 +9,14 @@ class BrowserInitializationError(ForexCalendarError):
     """Raised when Playwright cannot create a browser session."""
 
 
+class RateLimitedError(ForexCalendarError):
+    """Raised when ForexFactory answers with a throttling status code."""
+
+
+class DetailUnavailableError(ForexCalendarError):
+    """Raised when a detail overlay could not be loaded, as opposed to rendering without data."""
+
+
 class InputFileResolutionError(ForexCalendarError):
     """Raised when an expected input file cannot be resolved."""
 
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from forexcalendar_scraper.core.config import get_settings
 
+_listeners: dict[str, QueueListener] = {}
+_configurations: dict[str, tuple[Path, int, bool]] = {}
+_configure_lock = threading.Lock()
+
 
 def _resolve_log_level(level: str | int | None) -> int:
     if isinstance(level, int):
@@ -16,22 +24,73 @@ def _resolve_log_level(level: str | int | None) -> int:
     return getattr(logging, get_settings().log_level.upper(), logging.INFO)
 
 
-def configure_logger(logger_name: str, log_file: Path, level: str | int | None = None) -> logging.Logger:
-    """Create a logger with matching console and file handlers."""
+def configure_logger(
+    logger_name: str,
+    log_file: Path,
+    level: str | int | None = None,
+    console: bool | None = None,
+) -> logging.Logger:
+    """Create a logger with a file handler and, unless `console` is off, a console handler.
+
+    Records are handed to a background `QueueListener`, so console and file writes never block
+    the scraping threads. Repeated calls with the same configuration reuse the running
+    listener instead of reopening the handlers.
+    """
 
+    resolved_level = _resolve_log_level(level)
+    resolved_console = get_settings().log_to_console if console is None else console
+    configuration = (Path(log_file), resolved_level, resolved_console)
     logger = logging.getLogger(logger_name)
-    logger.setLevel(_resolve_log_level(level))
+    with _configure_lock:
+        if _configurations.get(logger_name) == configuration and logger.handlers:
+            return logger
+        _configure(logger, logger_name, log_file, resolved_level, resolved_console)
+        _configurations[logger_name] = configuration
+    return logger
+
+
+def _configure(
+    logger: logging.Logger,
+    logger_name: str,
+    log_file: Path,
+    level: int,
+    console: bool,
+) -> None:
+    logger.setLevel(level)
     logger.handlers.clear()
+    _stop_listener(logger_name)
 
     formatter = logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s")
 
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    file_handler = logging.FileHandler(log_file, encoding="utf-8", delay=True)
     file_handler.setFormatter(formatter)
+    handlers: list[logging.Handler] = [file_handler]
+
+    if console:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        handlers.append(stream_handler)
 
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(formatter)
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(records, *handlers)
+    listener.start()
+    _listeners[logger_name] = listener
 
-    logger.addHandler(file_handler)
-    logger.addHandler(stream_handler)
+    logger.addHandler(QueueHandler(records))
     logger.propagate = False
-    return logger
+
+
+def _stop_listener(logger_name: str) -> None:
+    _configurations.pop(logger_name, None)
+    listener = _listeners.pop(logger_name, None)
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+@atexit.register
+def _stop_all_listeners() -> None:
+    for logger_name in list(_listeners):
+        _stop_listener(logger_name)
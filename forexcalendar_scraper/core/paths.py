@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import date, timedelta
 from functools import lru_cache
 from pathlib import Path
 import re
 
-from forexcalendar_scraper.core.constants import DATE_PARAM_PATTERN_TEXT
+from forexcalendar_scraper.core.constants import DATE_PARAM_PATTERN_TEXT, MONTH_ABBREVIATIONS
 
 
 DATE_PARAM_PATTERN = re.compile(DATE_PARAM_PATTERN_TEXT, re.IGNORECASE)
@@ -47,13 +48,21 @@ class PathService:
         date_param: str,
         suffix: str = "",
         create_dir: bool = True,
+        extension: str = ".csv",
     ) -> Path:
-        return self.get_output_directory(date_param, create=create_dir) / f"{date_param}{suffix}.csv"
+        output_directory = self.get_output_directory(date_param, create=create_dir)
+        return output_directory / f"{date_param}{suffix}{extension}"
 
     def build_log_file_path(self, script_name: str) -> Path:
         self.log_root.mkdir(parents=True, exist_ok=True)
         return self.log_root / f"{script_name}.log"
 
+    def build_cache_file_path(self, cache_name: str) -> Path:
+        return self.output_root / "cache" / f"{cache_name}.sqlite3"
+
+    def build_browser_profile_path(self) -> Path:
+        return self.output_root / "cache" / "browser_profile"
+
     def display_path(self, path: Path) -> str:
         try:
             return str(path.relative_to(self.root_dir))
@@ -131,6 +140,26 @@ class PathService:
         return unique_matches
 
 
+def build_consecutive_week_params(date_param: str, weeks: int) -> list[str]:
+    """Return `date_param` followed by the next `weeks - 1` week parameters."""
+
+    match = DATE_PARAM_PATTERN.fullmatch(date_param.strip())
+    if not match or match.group(1).lower() != "week":
+        raise ValueError(
+            "Consecutive weeks need a week parameter such as 'week=oct21.2025', "
+            f"not {date_param!r}."
+        )
+    if weeks < 1:
+        raise ValueError("The number of weeks must be at least 1.")
+
+    _, month, day, year = match.groups()
+    start = date(int(year), MONTH_ABBREVIATIONS.index(month.lower()) + 1, int(day))
+    return [
+        f"week={MONTH_ABBREVIATIONS[week.month - 1]}{week.day}.{week.year}"
+        for week in (start + timedelta(weeks=offset) for offset in range(weeks))
+    ]
+
+
 @lru_cache(maxsize=1)
 def get_default_path_service() -> PathService:
     """Return the default path service rooted at the repository."""
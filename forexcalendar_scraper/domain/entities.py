@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
@@ -61,6 +61,16 @@ class DetailBlock:
     event_name: str = ""
     fields: dict[str, str] = field(default_factory=dict)
 
+    def with_event_context(self, event: CalendarEvent) -> DetailBlock:
+        return DetailBlock(
+            self.detail_id,
+            event.date,
+            event.time,
+            event.currency,
+            event.name,
+            dict(self.fields),
+        )
+
     def to_flat_mapping(self) -> dict[str, str]:
         mapping = {
             "detail_id": self.detail_id,
@@ -92,11 +102,18 @@ class HistoryRecord:
     event_currency: str = ""
 
     def with_event_context(self, event: CalendarEvent) -> HistoryRecord:
-        return replace(
-            self,
-            event_name=event.name,
-            event_date=event.date,
-            event_currency=event.currency,
+        # Built directly rather than with `dataclasses.replace`, which re-inspects the fields
+        # for every record.
+        return HistoryRecord(
+            self.detail_id,
+            self.date,
+            self.date_url,
+            self.actual,
+            self.forecast,
+            self.previous,
+            event.name,
+            event.date,
+            event.currency,
         )
 
     def to_csv_row(self) -> dict[str, str]:
@@ -125,11 +142,15 @@ class NewsItem:
     event_currency: str = ""
 
     def with_event_context(self, event: CalendarEvent) -> NewsItem:
-        return replace(
-            self,
-            event_name=event.name,
-            event_date=event.date,
-            event_currency=event.currency,
+        return NewsItem(
+            self.detail_id,
+            self.title,
+            self.url,
+            self.snippet,
+            self.link_type,
+            event.name,
+            event.date,
+            event.currency,
         )
 
     def to_csv_row(self) -> dict[str, str]:
@@ -153,6 +174,12 @@ class HistoryNewsBundle:
     def __bool__(self) -> bool:
         return bool(self.history or self.news)
 
+    def with_event_context(self, event: CalendarEvent) -> HistoryNewsBundle:
+        return HistoryNewsBundle(
+            history=[record.with_event_context(event) for record in self.history],
+            news=[item.with_event_context(event) for item in self.news],
+        )
+
 
 @dataclass(slots=True)
 class CommandResult:
@@ -1,123 +1,366 @@
-"""CSV-backed repository layer."""
+"""CSV-backed repository layer, with optional JSON Lines news and Parquet event output."""
 
 from __future__ import annotations
 
 import csv
+import os
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import fields
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable
+from typing import IO, Any
 
-from forexcalendar_scraper.domain.entities import CalendarEvent, DetailBlock, HistoryRecord, NewsItem
+from forexcalendar_scraper.core.exceptions import OptionalDependencyError
+from forexcalendar_scraper.domain.entities import (
+    CalendarEvent,
+    DetailBlock,
+    HistoryRecord,
+    NewsItem,
+)
+from forexcalendar_scraper.utils.serialization import encode_json
+
+# Input columns in CalendarEvent field order, so rows map positionally without a dict per row.
+EVENT_CSV_COLUMNS = (
+    "date",
+    "time",
+    "currency",
+    "impact",
+    "event",
+    "actual",
+    "forecast",
+    "previous",
+    "detail",
+)
+HISTORY_CSV_FIELDNAMES = (
+    "detail_id",
+    "event_name",
+    "event_date",
+    "event_currency",
+    "date",
+    "date_url",
+    "actual",
+    "forecast",
+    "previous",
+)
+NEWS_CSV_FIELDNAMES = (
+    "detail_id",
+    "event_name",
+    "event_date",
+    "event_currency",
+    "title",
+    "url",
+    "snippet",
+    "link_type",
+)
+# Reads CalendarEvent attributes as a row tuple in `EVENT_CSV_COLUMNS` order.
+_event_row = attrgetter(*(field.name for field in fields(CalendarEvent)))
+READ_BUFFER_SIZE = 1 << 16
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+class DetailBlockCsvWriter:
+    """Append vertical detail blocks to a CSV file as they are extracted."""
+
+    def __init__(self, output_file: Path) -> None:
+        self.output_file = output_file
+        self.written_count = 0
+        self._file_handle: IO[str] | None = None
+        self._writer: Any = None
+
+    def write(self, block: DetailBlock) -> None:
+        if self._writer is None:
+            self.output_file.parent.mkdir(parents=True, exist_ok=True)
+            self._file_handle = self.output_file.open("w", newline="", encoding="utf-8")
+            self._writer = csv.writer(self._file_handle)
+        elif self.written_count:
+            self._writer.writerow(["---", "---"])
+
+        self.written_count += 1
+        self._writer.writerows(block.to_block_rows(self.written_count))
+        self._file_handle.flush()
+
+    def write_many(self, blocks: Iterable[DetailBlock]) -> None:
+        for block in blocks:
+            self.write(block)
+
+    def close(self) -> None:
+        if self._file_handle is not None:
+            self._file_handle.close()
+            self._file_handle = None
+
+
+class CsvRecordWriter:
+    """Append flat records to a CSV file, writing the header with the first row.
+
+    Column names double as record attribute names, so rows are built as tuples by one
+    `attrgetter` and written with a plain `csv.writer`. Rows go through a large write buffer that
+    is flushed once per `write`/`write_many` call.
+    """
+
+    def __init__(self, output_file: Path, fieldnames: Sequence[str], append: bool = False) -> None:
+        self.output_file = output_file
+        self.fieldnames = list(fieldnames)
+        self.append = append
+        self.written_count = 0
+        self._file_handle: IO[str] | None = None
+        self._writer: Any = None
+        self._to_row = attrgetter(*self.fieldnames)
+
+    def write(self, record: HistoryRecord | NewsItem) -> None:
+        self.write_many((record,))
+
+    def write_many(self, records: Iterable[HistoryRecord | NewsItem]) -> None:
+        rows = list(map(self._to_row, records))
+        if not rows:
+            return
+
+        if self._writer is None:
+            self.output_file.parent.mkdir(parents=True, exist_ok=True)
+            resuming = self.append and _prepare_resume(self.output_file)
+            self._file_handle = self.output_file.open(
+                "a" if resuming else "w",
+                newline="",
+                encoding="utf-8",
+                buffering=WRITE_BUFFER_SIZE,
+            )
+            self._writer = csv.writer(self._file_handle)
+            if not resuming:
+                self._writer.writerow(self.fieldnames)
+
+        self._writer.writerows(rows)
+        self.written_count += len(rows)
+        self._file_handle.flush()
+
+    def close(self) -> None:
+        if self._file_handle is not None:
+            self._file_handle.close()
+            self._file_handle = None
+
+
+class JsonlRecordWriter:
+    """Append flat records to a JSON Lines file, one object per record in column order."""
+
+    def __init__(self, output_file: Path, fieldnames: Sequence[str], append: bool = False) -> None:
+        self.output_file = output_file
+        self.fieldnames = tuple(fieldnames)
+        self.append = append
+        self.written_count = 0
+        self._file_handle: IO[str] | None = None
+        self._to_row = attrgetter(*self.fieldnames)
+
+    def write(self, record: HistoryRecord | NewsItem) -> None:
+        self.write_many((record,))
+
+    def write_many(self, records: Iterable[HistoryRecord | NewsItem]) -> None:
+        fieldnames = self.fieldnames
+        to_row = self._to_row
+        lines = [
+            encode_json(dict(zip(fieldnames, to_row(record), strict=True))) for record in records
+        ]
+        if not lines:
+            return
+
+        if self._file_handle is None:
+            self.output_file.parent.mkdir(parents=True, exist_ok=True)
+            resuming = self.append and _prepare_resume(self.output_file)
+            self._file_handle = self.output_file.open(
+                "a" if resuming else "w",
+                encoding="utf-8",
+                buffering=WRITE_BUFFER_SIZE,
+            )
+
+        self._file_handle.write("\n".join(lines) + "\n")
+        self.written_count += len(lines)
+        self._file_handle.flush()
+
+    def close(self) -> None:
+        if self._file_handle is not None:
+            self._file_handle.close()
+            self._file_handle = None
+
+
+def _prepare_resume(output_file: Path) -> bool:
+    """Return whether `output_file` has complete lines to append to.
+
+    A trailing line that an interrupted run left without its newline is truncated first, so the
+    resumed rows do not run into it.
+    """
+
+    if not output_file.exists():
+        return False
+    with output_file.open("r+b") as file_handle:
+        end = position = file_handle.seek(0, os.SEEK_END)
+        while position > 0:
+            step = min(WRITE_BUFFER_SIZE, position)
+            file_handle.seek(position - step)
+            chunk = file_handle.read(step)
+            if position == end and chunk.endswith(b"\n"):
+                return True
+            newline = chunk.rfind(b"\n")
+            if newline >= 0:
+                file_handle.truncate(position - step + newline + 1)
+                return True
+            position -= step
+        file_handle.truncate(0)
+    return False
 
 
 class CsvRepository:
     """Read and write CSV files used by the project."""
 
     def load_event_rows(self, csv_file: str | Path) -> list[dict[str, str]]:
-        events: list[dict[str, str]] = []
-        with Path(csv_file).open("r", encoding="utf-8") as file_handle:
-            reader = csv.DictReader(file_handle)
-            if reader.fieldnames:
-                reader.fieldnames = [field.strip() if field else field for field in reader.fieldnames]
-
-            for row in reader:
-                cleaned_row: dict[str, str] = {}
-                for key, value in row.items():
-                    cleaned_key = key.strip() if key else ""
-                    cleaned_value = value.strip() if isinstance(value, str) else ""
-                    cleaned_row[cleaned_key] = cleaned_value
-                events.append(cleaned_row)
-        return events
+        with _open_csv_for_reading(csv_file) as file_handle:
+            reader = csv.reader(file_handle)
+            header = [field.strip() for field in next(reader, [])]
+            padding = [""] * len(header)
+            return [
+                dict(zip(header, [value.strip() for value in row] + padding, strict=False))
+                for row in reader
+                if row
+            ]
 
     def load_events(self, csv_file: str | Path) -> list[CalendarEvent]:
-        return [CalendarEvent.from_mapping(row) for row in self.load_event_rows(csv_file)]
+        with _open_csv_for_reading(csv_file) as file_handle:
+            reader = csv.reader(file_handle)
+            positions = {field.strip(): index for index, field in enumerate(next(reader, []))}
+            columns = [positions.get(column) for column in EVENT_CSV_COLUMNS]
+            return [
+                CalendarEvent(
+                    *(
+                        row[index].strip() if index is not None and index < len(row) else ""
+                        for index in columns
+                    )
+                )
+                for row in reader
+                if row
+            ]
+
+    def load_detail_ids(self, csv_file: str | Path) -> set[str]:
+        """Return the `detail_id` values of a previously written output CSV, if it exists."""
+
+        if not Path(csv_file).exists():
+            return set()
+        with _open_csv_for_reading(csv_file) as file_handle:
+            return {
+                row["detail_id"].strip()
+                for row in csv.DictReader(file_handle)
+                if (row.get("detail_id") or "").strip()
+            }
 
     def save_events(self, output_file: Path, events: Iterable[CalendarEvent]) -> None:
-        event_rows = [event.to_csv_row() for event in events]
+        event_rows = list(map(_event_row, events))
         if not event_rows:
             return
 
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        with output_file.open("w", newline="", encoding="utf-8") as file_handle:
-            writer = csv.DictWriter(file_handle, fieldnames=list(event_rows[0].keys()))
-            writer.writeheader()
+        if output_file.suffix == ".parquet":
+            _write_events_parquet(output_file, event_rows)
+            return
+        # One large buffer lets the whole day reach the file in a few writes.
+        with output_file.open(
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=WRITE_BUFFER_SIZE,
+        ) as file_handle:
+            writer = csv.writer(file_handle)
+            writer.writerow(EVENT_CSV_COLUMNS)
             writer.writerows(event_rows)
 
     def save_detail_blocks(self, output_file: Path, detail_blocks: Iterable[DetailBlock]) -> None:
-        blocks = list(detail_blocks)
-        if not blocks:
-            return
+        with self.open_detail_block_writer(output_file) as writer:
+            for block in detail_blocks:
+                writer.write(block)
 
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with output_file.open("w", newline="", encoding="utf-8") as file_handle:
-            writer = csv.writer(file_handle)
-            for event_id, block in enumerate(blocks, start=1):
-                writer.writerows(block.to_block_rows(event_id))
-                if event_id < len(blocks):
-                    writer.writerow(["---", "---"])
+    @contextmanager
+    def open_detail_block_writer(self, output_file: Path) -> Iterator[DetailBlockCsvWriter]:
+        """Stream detail blocks to disk; the file is only created once a block is written."""
+
+        writer = DetailBlockCsvWriter(output_file)
+        try:
+            yield writer
+        finally:
+            writer.close()
 
     def load_detail_blocks(self, csv_file: str | Path) -> dict[str, dict[str, str]]:
         events: dict[str, dict[str, str]] = {}
-        current_event_id: str | None = None
+        current_fields: dict[str, str] | None = None
 
-        with Path(csv_file).open("r", encoding="utf-8") as file_handle:
-            reader = csv.reader(file_handle)
-            for row in reader:
+        with _open_csv_for_reading(csv_file) as file_handle:
+            for row in csv.reader(file_handle):
                 if len(row) < 2:
                     continue
 
                 field_name = row[0].strip()
-                field_value = row[1].strip()
-
                 if field_name == "---":
                     continue
                 if field_name == "event_id":
-                    current_event_id = field_value
-                    events[current_event_id] = {}
-                    continue
-                if current_event_id is not None:
-                    events[current_event_id][field_name] = field_value
+                    current_fields = events[row[1].strip()] = {}
+                elif current_fields is not None:
+                    current_fields[field_name] = row[1].strip()
 
         return events
 
-    def save_history_records(self, output_file: Path, history_records: Iterable[HistoryRecord]) -> None:
-        records = [record.to_csv_row() for record in history_records]
-        if not records:
-            return
+    def save_history_records(
+        self,
+        output_file: Path,
+        history_records: Iterable[HistoryRecord],
+    ) -> None:
+        with self.open_history_record_writer(output_file) as writer:
+            writer.write_many(history_records)
 
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with output_file.open("w", newline="", encoding="utf-8") as file_handle:
-            fieldnames = [
-                "detail_id",
-                "event_name",
-                "event_date",
-                "event_currency",
-                "date",
-                "date_url",
-                "actual",
-                "forecast",
-                "previous",
-            ]
-            writer = csv.DictWriter(file_handle, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(records)
+    @contextmanager
+    def open_history_record_writer(
+        self,
+        output_file: Path,
+        append: bool = False,
+    ) -> Iterator[CsvRecordWriter]:
+        """Stream history rows to disk; the file is only created once a row is written."""
+
+        writer = CsvRecordWriter(output_file, HISTORY_CSV_FIELDNAMES, append=append)
+        try:
+            yield writer
+        finally:
+            writer.close()
 
     def save_news_items(self, output_file: Path, news_items: Iterable[NewsItem]) -> None:
-        records = [record.to_csv_row() for record in news_items]
-        if not records:
-            return
+        with self.open_news_item_writer(output_file) as writer:
+            writer.write_many(news_items)
 
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with output_file.open("w", newline="", encoding="utf-8") as file_handle:
-            fieldnames = [
-                "detail_id",
-                "event_name",
-                "event_date",
-                "event_currency",
-                "title",
-                "url",
-                "snippet",
-                "link_type",
-            ]
-            writer = csv.DictWriter(file_handle, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(records)
+    @contextmanager
+    def open_news_item_writer(
+        self,
+        output_file: Path,
+        append: bool = False,
+    ) -> Iterator[CsvRecordWriter | JsonlRecordWriter]:
+        """Stream news rows to disk; the file is only created once a row is written.
+
+        A `.jsonl` output file gets one JSON object per item instead of CSV rows.
+        """
+
+        writer_type = JsonlRecordWriter if output_file.suffix == ".jsonl" else CsvRecordWriter
+        writer = writer_type(output_file, NEWS_CSV_FIELDNAMES, append=append)
+        try:
+            yield writer
+        finally:
+            writer.close()
+
+
+def _write_events_parquet(output_file: Path, event_rows: Sequence[tuple[str, ...]]) -> None:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ModuleNotFoundError as error:
+        raise OptionalDependencyError(
+            "Parquet output requires optional Parquet dependencies. "
+            "Install with `pip install -e '.[parquet]'`."
+        ) from error
+
+    columns = zip(*event_rows, strict=True) if event_rows else ((),) * len(EVENT_CSV_COLUMNS)
+    table = pa.table(dict(zip(EVENT_CSV_COLUMNS, map(list, columns), strict=True)))
+    pq.write_table(table, output_file, compression="zstd")
+
+
+def _open_csv_for_reading(csv_file: str | Path) -> IO[str]:
+    return Path(csv_file).open("r", encoding="utf-8", newline="", buffering=READ_BUFFER_SIZE)
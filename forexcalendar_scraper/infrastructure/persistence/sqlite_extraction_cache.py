@@ -0,0 +1,64 @@
+"""SQLite-backed cache for per-event extraction payloads."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+
+class SqliteExtractionCache:
+    """Persist serialized extraction payloads with per-entry expiry.
+
+    The database is opened on first use and released by `close`, so building a service never
+    touches the file system; a closed cache reopens on its next lookup.
+    """
+
+    def __init__(self, cache_file: Path, clock: Callable[[], float] = time.time) -> None:
+        self._cache_file = cache_file
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT payload, expires_at FROM cache_entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None or row[1] <= self._clock():
+            return None
+        return row[0]
+
+    def set(self, key: str, payload: str, ttl_seconds: float) -> None:
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, payload, expires_at) VALUES (?, ?, ?)",
+                (key, payload, self._clock() + ttl_seconds),
+            )
+            connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+
+        self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._cache_file, check_same_thread=False)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "key TEXT PRIMARY KEY, payload TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        # Expired rows are never read again, so drop them instead of letting the file grow.
+        connection.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (self._clock(),))
+        connection.commit()
+        self._connection = connection
+        return connection
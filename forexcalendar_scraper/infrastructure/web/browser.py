@@ -3,15 +3,50 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import itertools
 import logging
-from typing import Iterator
+import os
+from pathlib import Path
+import re
+import threading
+import time
+from typing import Any, Iterator, NoReturn
+from urllib.parse import urlsplit
 
-from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
+from playwright.sync_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    Response,
+    Route,
+    sync_playwright,
+)
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import StorageState
 
 from forexcalendar_scraper.core.config import Settings, get_settings
-from forexcalendar_scraper.core.constants import BROWSER_ARGS, VIEWPORT_HEIGHT, VIEWPORT_WIDTH
-from forexcalendar_scraper.core.exceptions import BrowserInitializationError
+from forexcalendar_scraper.core.constants import (
+    AD_DOMAINS,
+    BROWSER_ARGS,
+    STORAGE_STATE_MAX_AGE_SECONDS,
+    THROTTLE_STATUS_CODES,
+    TRACKER_PATH_PATTERN_TEXT,
+    VIEWPORT_HEIGHT,
+    VIEWPORT_WIDTH,
+)
+from forexcalendar_scraper.core.exceptions import BrowserInitializationError, RateLimitedError
+from forexcalendar_scraper.utils.serialization import decode_json, encode_json
+
+
+TRACKER_PATH_PATTERN = re.compile(TRACKER_PATH_PATTERN_TEXT, re.IGNORECASE)
+AD_HOST_PATTERN = re.compile(
+    r"(?:^|\.)(?:{})$".format("|".join(re.escape(domain) for domain in AD_DOMAINS))
+)
+CLEAR_STORAGE_SCRIPT = "() => { localStorage.clear(); sessionStorage.clear(); }"
+# Stops Blink from requesting images at all, so they never reach the request route handler.
+DISABLE_IMAGES_ARG = "--blink-settings=imagesEnabled=false"
 
 
 @dataclass(slots=True)
@@ -19,7 +54,7 @@ class BrowserSession:
     """A single Playwright browser session."""
 
     playwright: Playwright
-    browser: Browser
+    browser: Browser | None
     context: BrowserContext
     page: Page
 
@@ -30,7 +65,33 @@ class BrowserSession:
             self.context.close()
         finally:
             try:
-                self.browser.close()
+                if self.browser is not None:
+                    self.browser.close()
+            finally:
+                self.playwright.stop()
+
+
+@dataclass(slots=True)
+class SharedBrowser:
+    """A Playwright driver, browser process, and page reused across many events.
+
+    `browser` is `None` for persistent contexts, which own their browser process.
+    """
+
+    playwright: Playwright
+    browser: Browser | None
+    context: BrowserContext | None = None
+    page: Page | None = None
+    events_served: int = 0
+
+    def close(self) -> None:
+        try:
+            if self.context is not None:
+                self.context.close()
+        finally:
+            try:
+                if self.browser is not None:
+                    self.browser.close()
             finally:
                 self.playwright.stop()
 
@@ -40,44 +101,292 @@ class BrowserSessionFactory:
     """Create browser sessions with shared configuration."""
 
     settings: Settings
+    _local: threading.local = field(default_factory=threading.local, init=False, repr=False)
+    _profile_slots: Iterator[int] = field(default_factory=itertools.count, init=False, repr=False)
+    _storage_state: StorageState | None = field(default=None, init=False, repr=False)
+    _storage_state_saved_at: float = field(default=0.0, init=False, repr=False)
+    _blocked_resource_types: frozenset[str] = field(
+        default_factory=frozenset,
+        init=False,
+        repr=False,
+    )
+    _launch_args: list[str] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._blocked_resource_types = frozenset(self.settings.blocked_resource_types)
+        self._launch_args = build_launch_args(self._blocked_resource_types)
+        state_file = self._storage_state_file
+        if state_file is not None and state_file.exists():
+            try:
+                self._storage_state = decode_json(state_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return
+            # Snapshots from earlier runs are reused but replaced after the first successful event.
+            self._storage_state_saved_at = float("-inf")
+
+    @property
+    def _storage_state_file(self) -> Path | None:
+        if not self.settings.share_storage_state or not self.settings.storage_state_file:
+            return None
+        return Path(self.settings.storage_state_file)
 
     def create_session(self, logger: logging.Logger, purpose: str) -> BrowserSession:
         logger.info("Initializing Playwright browser for %s", purpose)
 
         try:
-            playwright = sync_playwright().start()
-            browser = playwright.chromium.launch(
-                headless=self.settings.browser_headless,
-                args=list(BROWSER_ARGS),
-            )
-            context = browser.new_context(
-                viewport={"width": VIEWPORT_WIDTH, "height": VIEWPORT_HEIGHT},
-                user_agent=self.settings.user_agent,
-            )
-            page = context.new_page()
+            started = self._start_browser()
+            if started.context is None or started.page is None:
+                started.context, started.page = self._open_context(started.browser)
             logger.info("Playwright browser initialized successfully")
             return BrowserSession(
-                playwright=playwright,
-                browser=browser,
-                context=context,
-                page=page,
+                playwright=started.playwright,
+                browser=started.browser,
+                context=started.context,
+                page=started.page,
             )
         except Exception as error:
-            logger.error("Failed to initialize Playwright browser: %s", error)
-            logger.error(
-                "Make sure Playwright Chromium is installed: python3 -m playwright install chromium"
-            )
-            raise BrowserInitializationError(str(error)) from error
+            self._raise_initialization_error(logger, error)
+
+    @property
+    def _shared(self) -> SharedBrowser | None:
+        return getattr(self._local, "shared", None)
 
     @contextmanager
-    def open_page(self, logger: logging.Logger, purpose: str) -> Iterator[Page]:
-        """Yield a Playwright page and always release the browser session."""
+    def shared_browser(self, logger: logging.Logger, purpose: str) -> Iterator[None]:
+        """Keep one browser and page alive per thread, reset between events.
+
+        The browser is only started by the first `open_page`, so a session whose work is all
+        served over HTTP never launches Chromium.
+        """
 
-        session = self.create_session(logger, purpose)
+        if getattr(self._local, "sharing", False):
+            yield
+            return
+
+        self._local.sharing = True
         try:
-            yield session.page
+            yield
         finally:
-            session.close()
+            self._local.sharing = False
+            shared = self._shared
+            self._local.shared = None
+            if shared is not None:
+                shared.close()
+
+    def _start_shared_browser(self, logger: logging.Logger, purpose: str) -> SharedBrowser:
+        logger.info("Initializing shared Playwright browser for %s", purpose)
+        try:
+            shared = self._start_browser()
+        except Exception as error:
+            self._raise_initialization_error(logger, error)
+
+        self._local.shared = shared
+        logger.info("Playwright browser initialized successfully")
+        return shared
+
+    @contextmanager
+    def open_page(self, logger: logging.Logger, purpose: str) -> Iterator[Page]:
+        """Yield a Playwright page and raise `RateLimitedError` if the site throttled it."""
+
+        self._local.throttled_status = None
+        shared = self._shared
+        if shared is None and getattr(self._local, "sharing", False):
+            shared = self._start_shared_browser(logger, purpose)
+        if shared is not None:
+            yield self._acquire_shared_page(shared, logger, purpose)
+            self._remember_storage_state(shared.context, logger)
+        else:
+            session = self.create_session(logger, purpose)
+            try:
+                yield session.page
+                self._remember_storage_state(session.context, logger)
+            finally:
+                session.close()
+
+        throttled_status = self._local.throttled_status
+        if throttled_status is not None:
+            raise RateLimitedError(f"ForexFactory responded with HTTP {throttled_status}")
+
+    def _acquire_shared_page(
+        self,
+        shared: SharedBrowser,
+        logger: logging.Logger,
+        purpose: str,
+    ) -> Page:
+        recycle_after = self.settings.context_recycle_events
+        if shared.page is not None and 0 < recycle_after <= shared.events_served:
+            logger.debug("Recycling browser context after %s events", shared.events_served)
+            self._discard_page(shared)
+        elif shared.page is not None:
+            try:
+                self._reset_page(shared.context, shared.page)
+                shared.events_served += 1
+                return shared.page
+            except PlaywrightError as error:
+                logger.debug("Replacing browser page after reset failure: %s", error)
+                self._discard_page(shared)
+
+        if shared.browser is None:
+            shared.page = self._prepare_page(shared.context.new_page())
+        else:
+            logger.debug("Opening reusable browser context for %s", purpose)
+            shared.context, shared.page = self._open_context(shared.browser)
+        shared.events_served = 1
+        return shared.page
+
+    def _discard_page(self, shared: SharedBrowser) -> None:
+        # Persistent contexts own their browser process, so only the page can be replaced.
+        if shared.browser is None:
+            shared.page.close()
+        else:
+            shared.context.close()
+        shared.page = None
+
+    def _reset_page(self, context: BrowserContext, page: Page) -> None:
+        """Isolate events by clearing cookies and web storage instead of recreating the context.
+
+        The loaded document is kept so the next event can switch overlays by URL fragment, and
+        the cookies of the last successful load are restored so the site skips its first-visit
+        initialization.
+        """
+
+        if page.url.startswith("http"):
+            page.evaluate(CLEAR_STORAGE_SCRIPT)
+        context.clear_cookies()
+        if self._storage_state is not None and self._storage_state.get("cookies"):
+            context.add_cookies(self._storage_state["cookies"])
+
+    def _remember_storage_state(self, context: BrowserContext, logger: logging.Logger) -> None:
+        """Snapshot cookies and storage after a successful load, refreshing stale snapshots."""
+
+        if not self.settings.share_storage_state or self._local.throttled_status is not None:
+            return
+        if (
+            self._storage_state is not None
+            and time.monotonic() - self._storage_state_saved_at < STORAGE_STATE_MAX_AGE_SECONDS
+        ):
+            return
+
+        try:
+            self._storage_state = context.storage_state()
+        except PlaywrightError as error:
+            logger.debug("Could not capture browser storage state: %s", error)
+            return
+        self._storage_state_saved_at = time.monotonic()
+        self._save_storage_state(logger)
+
+    def _save_storage_state(self, logger: logging.Logger) -> None:
+        state_file = self._storage_state_file
+        if state_file is None:
+            return
+
+        # Workers may snapshot concurrently, so write aside and swap the file in atomically.
+        temporary_file = state_file.with_name(f"{state_file.name}.{threading.get_ident()}.tmp")
+        try:
+            state_file.parent.mkdir(parents=True, exist_ok=True)
+            temporary_file.write_text(encode_json(self._storage_state), encoding="utf-8")
+            os.replace(temporary_file, state_file)
+        except OSError as error:
+            logger.debug("Could not save browser storage state to %s: %s", state_file, error)
+
+    def _start_browser(self) -> SharedBrowser:
+        playwright = sync_playwright().start()
+        try:
+            if not self.settings.browser_profile_dir:
+                browser = playwright.chromium.launch(
+                    headless=self.settings.browser_headless,
+                    args=self._launch_args,
+                )
+                return SharedBrowser(playwright=playwright, browser=browser)
+
+            context = playwright.chromium.launch_persistent_context(
+                self._resolve_profile_dir(),
+                headless=self.settings.browser_headless,
+                args=self._launch_args,
+                **self._context_options(),
+            )
+        except Exception:
+            playwright.stop()
+            raise
+
+        self._prepare_context(context)
+        page = context.pages[0] if context.pages else context.new_page()
+        return SharedBrowser(
+            playwright=playwright,
+            browser=None,
+            context=context,
+            page=self._prepare_page(page),
+        )
+
+    def _resolve_profile_dir(self) -> Path:
+        """Give each worker thread its own profile, since Chromium locks a user-data-dir."""
+
+        profile_dir = getattr(self._local, "profile_dir", None)
+        if profile_dir is None:
+            slot = next(self._profile_slots)
+            profile_dir = Path(self.settings.browser_profile_dir) / f"worker-{slot}"
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            self._local.profile_dir = profile_dir
+        return profile_dir
+
+    def _context_options(self) -> dict[str, Any]:
+        return {
+            "viewport": {"width": VIEWPORT_WIDTH, "height": VIEWPORT_HEIGHT},
+            "user_agent": self.settings.user_agent,
+        }
+
+    def _open_context(self, browser: Browser) -> tuple[BrowserContext, Page]:
+        context = browser.new_context(**self._context_options(), storage_state=self._storage_state)
+        self._prepare_context(context)
+        return context, self._prepare_page(context.new_page())
+
+    def _prepare_context(self, context: BrowserContext) -> None:
+        if self._blocked_resource_types or self.settings.block_ads:
+            context.route("**/*", self._route_request)
+
+    def _prepare_page(self, page: Page) -> Page:
+        page.on("response", self._record_response)
+        return page
+
+    def _record_response(self, response: Response) -> None:
+        if response.status not in THROTTLE_STATUS_CODES:
+            return
+        host = urlsplit(response.url).hostname or ""
+        if host == "forexfactory.com" or host.endswith(".forexfactory.com"):
+            self._local.throttled_status = response.status
+
+    def _route_request(self, route: Route) -> None:
+        request = route.request
+        if request.resource_type in self._blocked_resource_types or (
+            self.settings.block_ads and is_ad_request(request.url)
+        ):
+            route.abort()
+        else:
+            route.continue_()
+
+    def _raise_initialization_error(self, logger: logging.Logger, error: Exception) -> NoReturn:
+        logger.error("Failed to initialize Playwright browser: %s", error)
+        logger.error(
+            "Make sure Playwright Chromium is installed: python3 -m playwright install chromium"
+        )
+        raise BrowserInitializationError(str(error)) from error
+
+
+def build_launch_args(blocked_resource_types: frozenset[str]) -> list[str]:
+    """Return Chromium launch flags, switching images off in Blink when they are blocked."""
+
+    if "image" in blocked_resource_types:
+        return [*BROWSER_ARGS, DISABLE_IMAGES_ARG]
+    return list(BROWSER_ARGS)
+
+
+def is_ad_request(url: str) -> bool:
+    """Return whether a request URL targets a known ad or analytics host or tracker path."""
+
+    parts = urlsplit(url)
+    if AD_HOST_PATTERN.search(parts.hostname or "") is not None:
+        return True
+    return TRACKER_PATH_PATTERN.search(parts.path) is not None
 
 
 def create_default_browser_session_factory() -> BrowserSessionFactory:
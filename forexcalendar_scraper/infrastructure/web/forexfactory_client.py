@@ -3,26 +3,191 @@
 from __future__ import annotations
 
 import logging
-import re
+import threading
 import time
+from functools import cache
+from typing import Any
 
-from playwright.sync_api import Locator, Page
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from forexcalendar_scraper.core.config import Settings, get_settings
 from forexcalendar_scraper.core.constants import (
+    CALENDAR_EVENT_CELL_CLASSES,
+    CALENDAR_IMPACT_CELL_CLASS,
     CALENDAR_ROW_SELECTOR,
     CALENDAR_TABLE_SELECTOR,
-    DETAIL_CONTAINER_SELECTORS,
     DETAIL_HISTORY_TABLE_SELECTORS,
     DETAIL_NEWS_CONTAINER_SELECTORS,
     DETAIL_OVERLAY_SELECTORS,
     DETAIL_SPECS_TABLE_SELECTORS,
 )
+from forexcalendar_scraper.core.exceptions import DetailUnavailableError
 from forexcalendar_scraper.domain.entities import CalendarEvent, HistoryRecord, NewsItem
-from forexcalendar_scraper.utils.formatting import sanitize_field_name
-
+from forexcalendar_scraper.infrastructure.web.html_parsing import (
+    NEWS_SNIPPET_LENGTH,
+    build_calendar_events,
+    build_news_items,
+    normalize_url,
+    parse_detail_specs,
+    parse_history_table,
+    parse_html,
+    parse_table_headers,
+)
+from forexcalendar_scraper.utils.serialization import decode_json
 
-DAY_BREAKER_PATTERN = re.compile(r"(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\s+(\w+\s+\d+)")
+# Selector lists are waited on as one CSS union, then resolved in priority order.
+# SHOW_DETAIL_SCRIPT empties the overlay before switching details, so only an overlay that has
+# content again counts as rendered; the bare selectors would still match the emptied element.
+DETAIL_RENDERED_SELECTOR_UNION = ", ".join(
+    f"{selector}:not(:empty)" for selector in DETAIL_OVERLAY_SELECTORS
+)
+HISTORY_NEWS_SELECTOR_UNION = ", ".join(
+    (*DETAIL_HISTORY_TABLE_SELECTORS, *DETAIL_NEWS_CONTAINER_SELECTORS)
+)
+FALLBACK_NEWS_PANEL_SELECTOR = ".half.last.details"
+# The fallback panel's links end the wait too, so overlays without a news list never idle
+# for the full overlay timeout before the fallback is read.
+NEWS_PANEL_SELECTOR_UNION = ", ".join(
+    (*DETAIL_NEWS_CONTAINER_SELECTORS, f"{FALLBACK_NEWS_PANEL_SELECTOR} a")
+)
+FALLBACK_SPECS_TABLE_SELECTOR = ".overlay__content table, .calendar__detail table"
+SPECS_TABLE_SELECTOR_UNION = ", ".join(
+    (*DETAIL_SPECS_TABLE_SELECTORS, FALLBACK_SPECS_TABLE_SELECTOR)
+)
+# Returns the markup of the first element matching the selectors, in priority order, so it can
+# be parsed locally.
+ELEMENT_HTML_SCRIPT = """
+selectors => {
+    for (const selector of selectors) {
+        const element = document.querySelector(selector);
+        if (element) return element.outerHTML;
+    }
+    return "";
+}
+"""
+
+# Reads every calendar row in one round-trip, in the row layout `build_calendar_events` expects.
+# Cell text is whitespace-collapsed the same way `HtmlNode.text` does for the HTTP path.
+CALENDAR_ROWS_SCRIPT = """
+([rowSelector, cellClasses, impactClass]) => {
+    const text = node => (node ? node.textContent || "" : "").replace(/\\s+/g, " ").trim();
+    const readCell = (row, className) => {
+        // Class lookups skip the selector parsing querySelector would repeat for every row.
+        const cell = row.getElementsByClassName(className)[0];
+        if (className !== impactClass) return text(cell);
+        const icon = cell ? cell.querySelector("span") : null;
+        return icon ? (icon.getAttribute("title") || "").trim() || text(icon) : "";
+    };
+    return JSON.stringify(Array.from(document.querySelectorAll(rowSelector), row => {
+        if ((row.getAttribute("class") || "").includes("day-breaker")) {
+            const dateCell = row.querySelector("td");
+            const dateText = text(dateCell);
+            return [true, dateText, dateCell && !dateText ? dateCell.innerHTML : ""];
+        }
+        return [
+            false,
+            ...cellClasses.map(className => readCell(row, className)),
+            (row.getAttribute("data-event-id") || "").trim(),
+        ];
+    }));
+}
+"""
+
+# Reads every link of the first matching news container, or of the fallback panel, as
+# [title, href, parent text] in one round-trip. The browser resolves hrefs to absolute URLs and
+# trims parent text to the snippet length, so panel text never crosses CDP. Structured results
+# come back as one JSON string, which decodes faster than Playwright's value-by-value
+# serialization.
+NEWS_LINKS_SCRIPT = """
+([newsSelectors, fallbackSelector, snippetLength]) => {
+    const text = node => (node ? node.textContent || "" : "").replace(/\\s+/g, " ").trim();
+    const readLinks = (container, fallback) => ({
+        links: Array.from(container.querySelectorAll("a"), link => [
+            text(link),
+            link.getAttribute("href") ? link.href : "",
+            fallback ? text(link.parentElement).slice(0, snippetLength) : "",
+        ]),
+        fallback,
+    });
+
+    for (const selector of newsSelectors) {
+        const container = document.querySelector(selector);
+        if (container) return JSON.stringify(readLinks(container, false));
+    }
+    const fallbackPanel = document.querySelector(fallbackSelector);
+    return JSON.stringify(fallbackPanel ? readLinks(fallbackPanel, true) : null);
+}
+"""
+
+# Reads the history table markup and the news links of an open overlay in one round-trip.
+HISTORY_NEWS_EXTRACTION_SCRIPT = """
+([historySelectors, newsSelectors, fallbackSelector, snippetLength]) => {
+    const first = selectors => {
+        for (const selector of selectors) {
+            const element = document.querySelector(selector);
+            if (element) return element;
+        }
+        return null;
+    };
+    const text = node => (node ? node.textContent || "" : "").replace(/\\s+/g, " ").trim();
+    const readLinks = (container, fallback) => ({
+        links: Array.from(container.querySelectorAll("a"), link => [
+            text(link),
+            link.getAttribute("href") ? link.href : "",
+            fallback ? text(link.parentElement).slice(0, snippetLength) : "",
+        ]),
+        fallback,
+    });
+
+    const table = first(historySelectors);
+    const newsContainer = first(newsSelectors);
+    const fallbackPanel = newsContainer ? null : document.querySelector(fallbackSelector);
+    return JSON.stringify({
+        history: table ? table.outerHTML : "",
+        news: newsContainer
+            ? readLinks(newsContainer, false)
+            : fallbackPanel
+                ? readLinks(fallbackPanel, true)
+                : null,
+    });
+}
+"""
+
+# Empties the previous overlay so selector waits only match the newly requested detail.
+SHOW_DETAIL_SCRIPT = """
+detailId => {
+    for (const overlay of document.querySelectorAll(".overlay__content, .calendar__detail")) {
+        overlay.replaceChildren();
+    }
+    window.location.hash = "detail=" + detailId;
+}
+"""
+
+# Returns the overlay markup around the first matching specs table so it can be parsed locally.
+# Overlays with unusual markup fall back to their first table with more than one row.
+DETAIL_FRAGMENT_SCRIPT = """
+([selectors, fallbackSelector]) => {
+    let specs = null;
+    for (const selector of selectors) {
+        specs = document.querySelector(selector);
+        if (specs) break;
+    }
+    if (!specs) {
+        specs = Array.from(document.querySelectorAll(fallbackSelector))
+            .find(table => table.rows.length > 1) || null;
+    }
+    if (!specs) return "";
+    const container = specs.closest(".overlay__content, .calendar__detail, .calendar-detail");
+    return (container || specs.parentElement || specs).outerHTML;
+}
+"""
+
+
+@cache
+def _join_selectors(selectors: tuple[str, ...]) -> str:
+    return ", ".join(selectors)
 
 
 class ForexFactoryClient:
@@ -30,6 +195,7 @@ class ForexFactoryClient:
 
     def __init__(self, settings: Settings | None = None) -> None:
         self.settings = settings or get_settings()
+        self._local = threading.local()
 
     def build_calendar_url(self, date_param: str) -> str:
         return f"{self.settings.forex_factory_base_url}?{date_param}"
@@ -42,39 +208,28 @@ class ForexFactoryClient:
     ) -> list[CalendarEvent]:
         url = self.build_calendar_url(date_param)
         logger.info("Navigating to ForexFactory calendar page: %s", url)
-        page.goto(url)
-        page.wait_for_selector(CALENDAR_TABLE_SELECTOR, timeout=self.settings.calendar_timeout_ms)
+        # The table is server-rendered, so a parsed document is enough; waiting for the load event
+        # would also wait on ads, iframes, and late scripts. Rows are only read from the DOM, so the
+        # table need not pass visibility checks either.
+        page.goto(url, wait_until="domcontentloaded", timeout=self.settings.calendar_timeout_ms)
+        page.wait_for_selector(
+            CALENDAR_TABLE_SELECTOR,
+            state="attached",
+            timeout=self.settings.calendar_timeout_ms,
+        )
 
-        rows = page.locator(CALENDAR_ROW_SELECTOR).all()
+        rows = decode_json(
+            page.evaluate(
+                CALENDAR_ROWS_SCRIPT,
+                [
+                    CALENDAR_ROW_SELECTOR,
+                    list(CALENDAR_EVENT_CELL_CLASSES),
+                    CALENDAR_IMPACT_CELL_CLASS,
+                ],
+            )
+        )
         logger.info("Found %s rows in the calendar table", len(rows))
-
-        events: list[CalendarEvent] = []
-        current_date = ""
-        skipped_rows = 0
-
-        for index, row in enumerate(rows):
-            try:
-                row_classes = row.get_attribute("class") or ""
-                if "day-breaker" in row_classes:
-                    extracted_date = self._extract_date_from_row(row, logger, index)
-                    if extracted_date:
-                        current_date = extracted_date
-                    continue
-
-                event = self._extract_event_from_row(row, current_date, logger, index)
-                if event is None:
-                    skipped_rows += 1
-                    continue
-
-                events.append(event)
-                if len(events) % 10 == 0:
-                    logger.info("Processed %s calendar events so far", len(events))
-            except Exception as error:
-                skipped_rows += 1
-                logger.debug("Skipped row %s: %s", index + 1, error)
-
-        logger.info("Calendar scraping finished. Processed=%s Skipped=%s", len(events), skipped_rows)
-        return events
+        return build_calendar_events(rows, logger)
 
     def open_event_overlay(
         self,
@@ -82,28 +237,39 @@ class ForexFactoryClient:
         date_param: str,
         detail_id: str,
         logger: logging.Logger,
-    ) -> bool:
+    ) -> None:
+        """Show the overlay for `detail_id`, raising `DetailUnavailableError` if it never loads.
+
+        Failed navigations and overlay timeouts are transient, so they are raised rather than
+        reported as an event without data.
+        """
+
         if not detail_id:
-            logger.debug("No detail ID provided; skipping overlay navigation")
-            return False
+            raise ValueError("A detail ID is required to open its overlay")
 
-        detail_url = f"{self.build_calendar_url(date_param)}#detail={detail_id}"
+        calendar_url = self.build_calendar_url(date_param)
+        detail_url = f"{calendar_url}#detail={detail_id}"
         logger.debug("Opening detail overlay for detail_id=%s", detail_id)
-        page.goto(detail_url, wait_until="domcontentloaded")
-        time.sleep(self.settings.detail_render_wait_seconds)
+        self._start_event_deadline()
+        try:
+            if self._can_navigate_by_hash(page, calendar_url, detail_url):
+                page.evaluate(SHOW_DETAIL_SCRIPT, detail_id)
+            else:
+                page.goto(
+                    detail_url,
+                    wait_until="commit",
+                    timeout=self._remaining_timeout_ms(self.settings.calendar_timeout_ms),
+                )
+        except PlaywrightError as error:
+            raise DetailUnavailableError(
+                f"Navigation failed for detail_id={detail_id}: {error}"
+            ) from error
 
-        detail_selectors = [selector.format(detail_id=detail_id) for selector in DETAIL_OVERLAY_SELECTORS]
-        detail_selectors.extend(
-            selector.format(detail_id=detail_id) for selector in DETAIL_CONTAINER_SELECTORS
-        )
-        selector = self._wait_for_any_selector(page, detail_selectors)
-        if selector is None:
-            logger.debug("Could not find detail overlay for detail_id=%s", detail_id)
-            return False
+        # Only whether the overlay rendered matters here, so no selector lookup follows the wait.
+        if not self._wait_for_selectors(page, DETAIL_RENDERED_SELECTOR_UNION):
+            raise DetailUnavailableError(f"Detail overlay did not render for detail_id={detail_id}")
 
-        logger.debug("Found detail overlay for detail_id=%s with selector=%s", detail_id, selector)
-        time.sleep(self.settings.detail_render_wait_seconds)
-        return True
+        logger.debug("Found detail overlay for detail_id=%s", detail_id)
 
     def extract_detail_specs(
         self,
@@ -112,8 +278,7 @@ class ForexFactoryClient:
         detail_id: str,
         logger: logging.Logger,
     ) -> dict[str, str] | None:
-        if not self.open_event_overlay(page, date_param, detail_id, logger):
-            return None
+        self.open_event_overlay(page, date_param, detail_id, logger)
         return self.extract_detail_specs_from_open_page(page, detail_id, logger)
 
     def extract_detail_specs_from_open_page(
@@ -122,25 +287,15 @@ class ForexFactoryClient:
         detail_id: str,
         logger: logging.Logger,
     ) -> dict[str, str] | None:
-        specs_table = self._find_specs_table(page)
-        if specs_table is None:
+        if not self._wait_for_selectors(page, SPECS_TABLE_SELECTOR_UNION):
             logger.debug("No specs table found for detail_id=%s", detail_id)
             return None
 
-        specs_data: dict[str, str] = {}
-        for row in specs_table.locator("tr").all():
-            cells = row.locator("td").all()
-            if len(cells) < 2:
-                continue
-
-            label = (cells[0].text_content() or "").strip()
-            value = (cells[1].text_content() or "").strip()
-            if not label or not value:
-                continue
-
-            specs_data[sanitize_field_name(label)] = value
-
-        self._attach_full_details_link(page, specs_data)
+        fragment = page.evaluate(
+            DETAIL_FRAGMENT_SCRIPT,
+            [list(DETAIL_SPECS_TABLE_SELECTORS), FALLBACK_SPECS_TABLE_SELECTOR],
+        )
+        specs_data = parse_detail_specs(parse_html(fragment))
         if not specs_data:
             return None
 
@@ -158,8 +313,7 @@ class ForexFactoryClient:
         detail_id: str,
         logger: logging.Logger,
     ) -> list[HistoryRecord]:
-        if not self.open_event_overlay(page, date_param, detail_id, logger):
-            return []
+        self.open_event_overlay(page, date_param, detail_id, logger)
         return self.extract_history_from_open_page(page, detail_id, logger)
 
     def extract_history_from_open_page(
@@ -168,52 +322,14 @@ class ForexFactoryClient:
         detail_id: str,
         logger: logging.Logger,
     ) -> list[HistoryRecord]:
-        history_table = self._find_first_locator(page, DETAIL_HISTORY_TABLE_SELECTORS)
-        if history_table is None:
+        if not self._wait_for_selectors(page, _join_selectors(DETAIL_HISTORY_TABLE_SELECTORS)):
             logger.debug("No history table found for detail_id=%s", detail_id)
             return []
-
-        history_records: list[HistoryRecord] = []
-        header_row = history_table.locator("thead tr, tr:first-child").first
-        if header_row.count() > 0:
-            headers = [
-                (cell.text_content() or "").strip().lower()
-                for cell in header_row.locator("th, td").all()
-            ]
-            if headers:
-                logger.debug("History table headers for detail_id=%s: %s", detail_id, headers)
-
-        for row in history_table.locator("tbody tr, tr").all():
-            cells = row.locator("td").all()
-            if len(cells) < 2:
-                continue
-
-            record = HistoryRecord(detail_id=detail_id, date="")
-            for index, cell in enumerate(cells):
-                cell_text = (cell.text_content() or "").strip()
-                if index == 0:
-                    record.date = cell_text
-                    link = cell.locator("a").first
-                    if link.count() > 0:
-                        href = link.get_attribute("href")
-                        if href:
-                            record.date_url = self._normalize_url(href)
-                elif index == 1:
-                    record.actual = cell_text
-                elif index == 2:
-                    record.forecast = cell_text
-                elif index == 3:
-                    record.previous = cell_text
-
-            if record.date:
-                history_records.append(record)
-
-        logger.debug(
-            "Extracted %s history records for detail_id=%s",
-            len(history_records),
+        return self._build_history_records(
+            page.evaluate(ELEMENT_HTML_SCRIPT, list(DETAIL_HISTORY_TABLE_SELECTORS)),
             detail_id,
+            logger,
         )
-        return history_records
 
     def extract_news(
         self,
@@ -221,201 +337,144 @@ class ForexFactoryClient:
         date_param: str,
         detail_id: str,
         logger: logging.Logger,
+        event: CalendarEvent | None = None,
     ) -> list[NewsItem]:
-        if not self.open_event_overlay(page, date_param, detail_id, logger):
-            return []
-        return self.extract_news_from_open_page(page, detail_id, logger)
+        self.open_event_overlay(page, date_param, detail_id, logger)
+        return self.extract_news_from_open_page(page, detail_id, logger, event)
 
     def extract_news_from_open_page(
         self,
         page: Page,
         detail_id: str,
         logger: logging.Logger,
+        event: CalendarEvent | None = None,
     ) -> list[NewsItem]:
-        news_container = self._find_first_locator(page, DETAIL_NEWS_CONTAINER_SELECTORS)
-        if news_container is not None:
-            news_items = self._extract_news_links(news_container.locator("a").all(), detail_id)
-            logger.debug("Extracted %s structured news items for detail_id=%s", len(news_items), detail_id)
-            return news_items
-
-        right_panel = page.locator(".half.last.details").first
-        if right_panel.count() == 0:
+        if not self._wait_for_selectors(page, NEWS_PANEL_SELECTOR_UNION):
+            # Neither a news list nor a fallback link exists, so evaluating could only find nothing.
             logger.debug("No news container found for detail_id=%s", detail_id)
             return []
 
-        news_items = self._extract_news_links(right_panel.locator("a").all(), detail_id, include_parent=True)
-        logger.debug("Extracted %s fallback news items for detail_id=%s", len(news_items), detail_id)
-        return news_items
+        links = page.evaluate(
+            NEWS_LINKS_SCRIPT,
+            [
+                list(DETAIL_NEWS_CONTAINER_SELECTORS),
+                FALLBACK_NEWS_PANEL_SELECTOR,
+                NEWS_SNIPPET_LENGTH,
+            ],
+        )
+        return self._build_news_items(decode_json(links), detail_id, logger, event)
 
-    def _extract_date_from_row(
+    def extract_history_news_from_open_page(
         self,
-        row: Locator,
-        logger: logging.Logger,
-        row_index: int,
-    ) -> str:
-        date_cell = row.locator("td").first
-        date_text = (date_cell.text_content() or "").strip()
-        if not date_text:
-            cell_html = date_cell.inner_html()
-            date_match = DAY_BREAKER_PATTERN.search(cell_html)
-            if date_match:
-                date_text = date_match.group(0)
-
-        cleaned_date = " ".join(date_text.split())
-        if cleaned_date:
-            logger.info("Detected date section on row %s: %s", row_index + 1, cleaned_date)
-        return cleaned_date
-
-    def _extract_event_from_row(
-        self,
-        row: Locator,
-        current_date: str,
+        page: Page,
+        detail_id: str,
         logger: logging.Logger,
-        row_index: int,
-    ) -> CalendarEvent | None:
-        event = CalendarEvent(
-            date=current_date or "Unknown",
-            time=self._get_locator_text(row, ".calendar__time"),
-            currency=self._get_locator_text(row, ".calendar__currency"),
-            impact=self._get_locator_attribute_or_text(row, ".calendar__impact span", "title"),
-            name=self._get_locator_text(row, ".calendar__event"),
-            actual=self._get_locator_text(row, ".calendar__actual"),
-            forecast=self._get_locator_text(row, ".calendar__forecast"),
-            previous=self._get_locator_text(row, ".calendar__previous"),
-            detail_id=(row.get_attribute("data-event-id") or "").strip(),
+    ) -> tuple[list[HistoryRecord], list[NewsItem]]:
+        """Read both overlay panels with one wait and one evaluate."""
+
+        if not self._wait_for_selectors(page, HISTORY_NEWS_SELECTOR_UNION):
+            logger.debug("No history table or news container found for detail_id=%s", detail_id)
+
+        extracted = decode_json(
+            page.evaluate(
+                HISTORY_NEWS_EXTRACTION_SCRIPT,
+                [
+                    list(DETAIL_HISTORY_TABLE_SELECTORS),
+                    list(DETAIL_NEWS_CONTAINER_SELECTORS),
+                    FALLBACK_NEWS_PANEL_SELECTOR,
+                    NEWS_SNIPPET_LENGTH,
+                ],
+            )
         )
-        if event.name or event.currency:
-            return event
-
-        all_cells = row.locator("td").all()
-        if len(all_cells) < 7:
-            logger.debug("Skipped row %s due to insufficient columns", row_index + 1)
-            return None
-
-        fallback_event = CalendarEvent(
-            date=current_date or "Unknown",
-            time=self._get_locator_text(row, ".calendar__time"),
-            currency=self._get_locator_text(row, ".calendar__currency"),
-            impact=self._get_locator_attribute_or_text(row, ".calendar__impact span", "title"),
-            name=self._get_locator_text(row, ".calendar__event"),
-            actual=self._get_locator_text(row, ".calendar__actual"),
-            forecast=self._get_locator_text(row, ".calendar__forecast"),
-            previous=self._get_locator_text(row, ".calendar__previous"),
-            detail_id=(row.get_attribute("data-event-id") or "").strip(),
+        return (
+            self._build_history_records(extracted["history"], detail_id, logger),
+            self._build_news_items(extracted["news"], detail_id, logger),
         )
-        if fallback_event.name or fallback_event.currency:
-            logger.debug("Recovered event from row %s", row_index + 1)
-            return fallback_event
-        return None
-
-    def _get_locator_text(self, row: Locator, selector: str) -> str:
-        locator = row.locator(selector)
-        if locator.count() == 0:
-            return ""
-        return (locator.first.text_content() or "").strip()
-
-    def _get_locator_attribute_or_text(self, row: Locator, selector: str, attribute: str) -> str:
-        locator = row.locator(selector)
-        if locator.count() == 0:
-            return ""
-        value = locator.first.get_attribute(attribute)
-        if value:
-            return value.strip()
-        return (locator.first.text_content() or "").strip()
-
-    def _wait_for_any_selector(self, page: Page, selectors: list[str]) -> str | None:
-        for selector in selectors:
-            try:
-                page.wait_for_selector(selector, timeout=self.settings.overlay_timeout_ms)
-                return selector
-            except Exception:
-                continue
-        return None
-
-    def _find_first_locator(self, page: Page, selectors: tuple[str, ...]) -> Locator | None:
-        for selector in selectors:
-            try:
-                page.wait_for_selector(selector, timeout=self.settings.overlay_timeout_ms)
-                locator = page.locator(selector).first
-                if locator.count() > 0:
-                    return locator
-            except Exception:
-                continue
-        return None
-
-    def _find_specs_table(self, page: Page) -> Locator | None:
-        specs_table = self._find_first_locator(page, DETAIL_SPECS_TABLE_SELECTORS)
-        if specs_table is not None:
-            return specs_table
-
-        try:
-            page.wait_for_selector("table", timeout=self.settings.overlay_timeout_ms)
-        except Exception:
-            return None
-
-        for table in page.locator("table").all():
-            if len(table.locator("tr").all()) > 1:
-                return table
-        return None
 
-    def _attach_full_details_link(self, page: Page, specs_data: dict[str, str]) -> None:
-        solo_div = page.locator(".calendardetails__solo").first
-        if solo_div.count() == 0:
-            return
+    def _build_history_records(
+        self,
+        table_html: str,
+        detail_id: str,
+        logger: logging.Logger,
+    ) -> list[HistoryRecord]:
+        history_table = parse_html(table_html).find(lambda node: node.tag == "table")
+        if history_table is None:
+            return []
 
-        link = solo_div.locator("a").first
-        if link.count() == 0:
-            return
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "History table headers for detail_id=%s: %s",
+                detail_id,
+                parse_table_headers(history_table),
+            )
 
-        href = link.get_attribute("href")
-        if href:
-            specs_data["full_details_url"] = self._normalize_url(href)
+        history_records = [
+            HistoryRecord(
+                detail_id=detail_id,
+                date=date,
+                date_url=normalize_url(href) if href else "",
+                actual=actual,
+                forecast=forecast,
+                previous=previous,
+            )
+            for date, href, actual, forecast, previous in parse_history_table(history_table)
+            if date
+        ]
 
-        link_text = (link.text_content() or "").strip()
-        if link_text:
-            specs_data["full_details_link_text"] = link_text
+        logger.debug(
+            "Extracted %s history records for detail_id=%s",
+            len(history_records),
+            detail_id,
+        )
+        return history_records
 
-    def _extract_news_links(
+    def _build_news_items(
         self,
-        links: list[Locator],
+        links: dict[str, Any] | None,
         detail_id: str,
-        include_parent: bool = False,
+        logger: logging.Logger,
+        event: CalendarEvent | None = None,
     ) -> list[NewsItem]:
-        news_items: list[NewsItem] = []
-        for link in links:
-            title = (link.text_content() or "").strip()
-            href = link.get_attribute("href")
-            if not title or not href or len(title) <= 5:
-                continue
-            if len(title) < 15 and any(character.isdigit() for character in title):
-                continue
-
-            snippet = ""
-            if include_parent:
-                parent = link.locator("xpath=..").first
-                if parent.count() > 0:
-                    parent_text = (parent.text_content() or "").strip()
-                    if len(parent_text) > len(title):
-                        snippet = parent_text[:200]
-
-            news_items.append(
-                NewsItem(
-                    detail_id=detail_id,
-                    title=title,
-                    url=self._normalize_url(href),
-                    snippet=snippet,
-                    link_type=self._infer_link_type(href),
-                )
-            )
+        if links is None:
+            logger.debug("No news container found for detail_id=%s", detail_id)
+            return []
+
+        news_items = build_news_items(links["links"], detail_id, event)
+        logger.debug(
+            "Extracted %s %s news items for detail_id=%s",
+            len(news_items),
+            "fallback" if links["fallback"] else "structured",
+            detail_id,
+        )
         return news_items
 
-    def _normalize_url(self, href: str) -> str:
-        if href.startswith("/"):
-            return f"https://www.forexfactory.com{href}"
-        return href
+    def _can_navigate_by_hash(self, page: Page, calendar_url: str, detail_url: str) -> bool:
+        """Reuse an already loaded calendar document when only the `#detail=` fragment changes."""
 
-    def _infer_link_type(self, href: str) -> str:
-        lowered = href.lower()
-        if "news" in lowered or "article" in lowered:
-            return "news"
-        return "related"
+        if not self.settings.hash_navigation_enabled:
+            return False
+        current_url = page.url
+        return current_url != detail_url and current_url.split("#", 1)[0] == calendar_url
+
+    def _start_event_deadline(self) -> None:
+        """Bound every wait for the current event by one end-to-end budget."""
+
+        timeout_ms = self.settings.event_timeout_ms
+        self._local.deadline = time.monotonic() + timeout_ms / 1000 if timeout_ms > 0 else None
+
+    def _remaining_timeout_ms(self, timeout_ms: int) -> int:
+        deadline = getattr(self._local, "deadline", None)
+        if deadline is None:
+            return timeout_ms
+        return min(timeout_ms, int((deadline - time.monotonic()) * 1000))
+
+    def _wait_for_selectors(self, page: Page, selector_union: str) -> bool:
+        # Playwright treats a zero timeout as "wait forever", so an exhausted budget bails out.
+        timeout_ms = self._remaining_timeout_ms(self.settings.overlay_timeout_ms)
+        if timeout_ms <= 0:
+            return False
+        try:
+            page.wait_for_selector(selector_union, state="attached", timeout=timeout_ms)
+        except PlaywrightTimeoutError:
+            return False
+        return True
@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 import logging
-
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from forexcalendar_scraper.domain.entities import (
+    CalendarEvent,
+    DetailBlock,
+    HistoryNewsBundle,
+    HistoryRecord,
+    NewsItem,
+)
 from forexcalendar_scraper.infrastructure.web.browser import BrowserSessionFactory
 from forexcalendar_scraper.infrastructure.web.forexfactory_client import ForexFactoryClient
-from forexcalendar_scraper.domain.entities import CalendarEvent, DetailBlock, HistoryNewsBundle, HistoryRecord, NewsItem
+
+if TYPE_CHECKING:
+    from forexcalendar_scraper.infrastructure.web.forexfactory_http_client import (
+        ForexFactoryHttpClient,
+    )
 
 
 @dataclass(slots=True)
@@ -16,8 +31,32 @@ class ForexFactoryGateway:
 
     browser_factory: BrowserSessionFactory
     client: ForexFactoryClient
+    http_client: ForexFactoryHttpClient | None = None
+
+    _active_sessions: int = field(default=0, init=False, repr=False)
+    _session_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @contextmanager
+    def open_session(self, logger: logging.Logger, purpose: str) -> Iterator[None]:
+        """Hold a worker's browser for the session and close the HTTP pool after the last one."""
+
+        with self._session_lock:
+            self._active_sessions += 1
+        try:
+            with self.browser_factory.shared_browser(logger, purpose):
+                yield
+        finally:
+            with self._session_lock:
+                self._active_sessions -= 1
+                if not self._active_sessions and self.http_client is not None:
+                    self.http_client.close()
 
     def scrape_calendar(self, date_param: str, logger: logging.Logger) -> list[CalendarEvent]:
+        if self.http_client is not None:
+            events = self.http_client.fetch_calendar_events(date_param, logger)
+            if events:
+                return events
+
         with self.browser_factory.open_page(logger, "calendar scraping") as page:
             return self.client.scrape_calendar(page, date_param, logger)
 
@@ -30,8 +69,12 @@ class ForexFactoryGateway:
         if not event.detail_id:
             return None
 
-        with self.browser_factory.open_page(logger, "detail extraction") as page:
-            fields = self.client.extract_detail_specs(page, date_param, event.detail_id, logger)
+        fields = None
+        if self.http_client is not None:
+            fields = self.http_client.fetch_detail_specs(event.detail_id, logger)
+        if not fields:
+            with self.browser_factory.open_page(logger, "detail extraction") as page:
+                fields = self.client.extract_detail_specs(page, date_param, event.detail_id, logger)
 
         if not fields:
             return None
@@ -54,8 +97,12 @@ class ForexFactoryGateway:
         if not event.detail_id:
             return None
 
-        with self.browser_factory.open_page(logger, "history extraction") as page:
-            records = self.client.extract_history(page, date_param, event.detail_id, logger)
+        records = None
+        if self.http_client is not None:
+            records = self.http_client.fetch_history_records(event.detail_id, logger)
+        if not records:
+            with self.browser_factory.open_page(logger, "history extraction") as page:
+                records = self.client.extract_history(page, date_param, event.detail_id, logger)
 
         if not records:
             return None
@@ -70,12 +117,21 @@ class ForexFactoryGateway:
         if not event.detail_id:
             return None
 
-        with self.browser_factory.open_page(logger, "news extraction") as page:
-            records = self.client.extract_news(page, date_param, event.detail_id, logger)
-
-        if not records:
-            return None
-        return [record.with_event_context(event) for record in records]
+        # Items come back with the event context already set, so each is built only once.
+        news_items = None
+        if self.http_client is not None:
+            news_items = self.http_client.fetch_news_items(event.detail_id, logger, event)
+        if not news_items:
+            with self.browser_factory.open_page(logger, "news extraction") as page:
+                news_items = self.client.extract_news(
+                    page,
+                    date_param,
+                    event.detail_id,
+                    logger,
+                    event,
+                )
+
+        return news_items or None
 
     def extract_history_news_bundle(
         self,
@@ -86,18 +142,22 @@ class ForexFactoryGateway:
         if not event.detail_id:
             return None
 
-        with self.browser_factory.open_page(logger, "history and news extraction") as page:
-            if not self.client.open_event_overlay(page, date_param, event.detail_id, logger):
-                return None
-
-            history = [
-                record.with_event_context(event)
-                for record in self.client.extract_history_from_open_page(page, event.detail_id, logger)
-            ]
-            news = [
-                item.with_event_context(event)
-                for item in self.client.extract_news_from_open_page(page, event.detail_id, logger)
-            ]
-
-        bundle = HistoryNewsBundle(history=history, news=news)
+        extracted = None
+        if self.http_client is not None:
+            extracted = self.http_client.fetch_history_news(event.detail_id, logger)
+        if extracted is None:
+            with self.browser_factory.open_page(logger, "history and news extraction") as page:
+                self.client.open_event_overlay(page, date_param, event.detail_id, logger)
+                extracted = self.client.extract_history_news_from_open_page(
+                    page,
+                    event.detail_id,
+                    logger,
+                )
+
+        history, news = extracted
+
+        bundle = HistoryNewsBundle(
+            history=[record.with_event_context(event) for record in history],
+            news=[item.with_event_context(event) for item in news],
+        )
         return bundle if bundle else None
\ No newline at end of file
@@ -0,0 +1,234 @@
+"""Browserless ForexFactory detail fetching over plain HTTP."""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+import httpx
+
+from forexcalendar_scraper.core.config import Settings, get_settings
+from forexcalendar_scraper.core.constants import THROTTLE_STATUS_CODES
+from forexcalendar_scraper.core.exceptions import RateLimitedError
+from forexcalendar_scraper.domain.entities import CalendarEvent, HistoryRecord, NewsItem
+from forexcalendar_scraper.infrastructure.web.html_parsing import (
+    HtmlNode,
+    build_calendar_events,
+    build_news_items,
+    normalize_url,
+    parse_calendar_rows,
+    parse_detail_specs,
+    parse_history_rows,
+    parse_html,
+    parse_news_links,
+)
+from forexcalendar_scraper.utils.formatting import sanitize_field_name
+from forexcalendar_scraper.utils.serialization import decode_json
+
+
+class ForexFactoryHttpClient:
+    """Fetch the server-rendered calendar page and the XHR detail endpoint behind its overlay."""
+
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
+        self.settings = settings or get_settings()
+        self._transport = transport
+        self._client: httpx.Client | None = None
+        self._lock = threading.Lock()
+
+    def build_calendar_url(self, date_param: str) -> str:
+        return f"{self.settings.forex_factory_base_url}?{date_param}"
+
+    def build_detail_url(self, detail_id: str) -> str:
+        return self.settings.detail_endpoint_url.format(detail_id=detail_id)
+
+    def fetch_calendar_events(
+        self,
+        date_param: str,
+        logger: logging.Logger,
+    ) -> list[CalendarEvent] | None:
+        """Read the calendar table without a browser, or `None` so the caller can fall back.
+
+        Throttled responses raise `RateLimitedError` like the browser path does; other HTTP
+        errors, such as anti-bot 403 pages, fall back to the browser.
+        """
+
+        try:
+            response = self._http().get(self.build_calendar_url(date_param))
+        except httpx.HTTPError as error:
+            logger.debug("HTTP calendar fetch failed for %s: %s", date_param, error)
+            return None
+
+        if response.status_code in THROTTLE_STATUS_CODES:
+            raise RateLimitedError(f"ForexFactory responded with HTTP {response.status_code}")
+        if response.is_error:
+            logger.debug(
+                "HTTP calendar fetch failed for %s: HTTP %s",
+                date_param,
+                response.status_code,
+            )
+            return None
+
+        rows = parse_calendar_rows(parse_html(response.text))
+        if not rows:
+            logger.debug("HTTP calendar page had no calendar rows for %s", date_param)
+            return None
+        logger.info("Found %s rows in the calendar table over HTTP", len(rows))
+        return build_calendar_events(rows, logger)
+
+    def fetch_detail_specs(self, detail_id: str, logger: logging.Logger) -> dict[str, str] | None:
+        payload = self._fetch_detail_payload(detail_id, logger)
+        if payload is None:
+            return None
+
+        specs_data = self._parse_detail_payload(payload)
+        if not specs_data:
+            logger.debug("HTTP detail payload had no specs for detail_id=%s", detail_id)
+            return None
+        return specs_data
+
+    def fetch_history_records(
+        self,
+        detail_id: str,
+        logger: logging.Logger,
+    ) -> list[HistoryRecord] | None:
+        root = self._fetch_detail_fragment(detail_id, logger)
+        if root is None:
+            return None
+
+        history_records = self._parse_history_records(root, detail_id)
+        if not history_records:
+            logger.debug("HTTP detail payload had no history for detail_id=%s", detail_id)
+            return None
+        return history_records
+
+    def fetch_news_items(
+        self,
+        detail_id: str,
+        logger: logging.Logger,
+        event: CalendarEvent | None = None,
+    ) -> list[NewsItem] | None:
+        root = self._fetch_detail_fragment(detail_id, logger)
+        if root is None:
+            return None
+
+        news_items = self._parse_news_items(root, detail_id, event)
+        if not news_items:
+            logger.debug("HTTP detail payload had no news for detail_id=%s", detail_id)
+            return None
+        return news_items
+
+    def fetch_history_news(
+        self,
+        detail_id: str,
+        logger: logging.Logger,
+    ) -> tuple[list[HistoryRecord], list[NewsItem]] | None:
+        """Read the history table and related news from one detail request."""
+
+        root = self._fetch_detail_fragment(detail_id, logger)
+        if root is None:
+            return None
+
+        history_records = self._parse_history_records(root, detail_id)
+        news_items = self._parse_news_items(root, detail_id)
+        if not history_records and not news_items:
+            logger.debug("HTTP detail payload had no history or news for detail_id=%s", detail_id)
+            return None
+        return history_records, news_items
+
+    def close(self) -> None:
+        """Close the connection pool; the next request opens a new one."""
+
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def _http(self) -> httpx.Client:
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    headers={
+                        "User-Agent": self.settings.user_agent,
+                        "Referer": self.settings.forex_factory_base_url,
+                        "X-Requested-With": "XMLHttpRequest",
+                    },
+                    timeout=self.settings.http_timeout_seconds,
+                    follow_redirects=True,
+                    transport=self._transport,
+                )
+            return self._client
+
+    def _fetch_detail_fragment(self, detail_id: str, logger: logging.Logger) -> HtmlNode | None:
+        payload = self._fetch_detail_payload(detail_id, logger)
+        if payload is None or payload.lstrip().startswith("{"):
+            return None
+        return parse_html(payload)
+
+    def _parse_history_records(self, root: HtmlNode, detail_id: str) -> list[HistoryRecord]:
+        return [
+            HistoryRecord(
+                detail_id=detail_id,
+                date=date,
+                date_url=normalize_url(href) if href else "",
+                actual=actual,
+                forecast=forecast,
+                previous=previous,
+            )
+            for date, href, actual, forecast, previous in parse_history_rows(root)
+            if date
+        ]
+
+    def _parse_news_items(
+        self,
+        root: HtmlNode,
+        detail_id: str,
+        event: CalendarEvent | None = None,
+    ) -> list[NewsItem]:
+        news_links = parse_news_links(root)
+        return build_news_items(news_links[0], detail_id, event) if news_links else []
+
+    def _fetch_detail_payload(self, detail_id: str, logger: logging.Logger) -> str | None:
+        url = self.build_detail_url(detail_id)
+        try:
+            response = self._http().get(url)
+        except httpx.HTTPError as error:
+            logger.debug("HTTP detail fetch failed for detail_id=%s: %s", detail_id, error)
+            return None
+
+        if response.status_code in THROTTLE_STATUS_CODES:
+            raise RateLimitedError(f"ForexFactory responded with HTTP {response.status_code}")
+        if response.is_error:
+            logger.debug(
+                "HTTP detail fetch failed for detail_id=%s: HTTP %s",
+                detail_id,
+                response.status_code,
+            )
+            return None
+        return response.text
+
+    def _parse_detail_payload(self, payload: str) -> dict[str, str]:
+        if payload.lstrip().startswith("{"):
+            try:
+                return self._parse_json_specs(decode_json(payload))
+            except ValueError:
+                return {}
+
+        return parse_detail_specs(parse_html(payload))
+
+    def _parse_json_specs(self, payload: object) -> dict[str, str]:
+        data = payload.get("data", payload) if isinstance(payload, dict) else {}
+        specs = data.get("specs", []) if isinstance(data, dict) else []
+
+        specs_data: dict[str, str] = {}
+        for spec in specs:
+            if not isinstance(spec, dict):
+                continue
+            label = str(spec.get("title") or "").strip()
+            value = parse_html(str(spec.get("html") or "")).text()
+            if label and value:
+                specs_data[sanitize_field_name(label)] = value
+        return specs_data
@@ -0,0 +1,398 @@
+"""Lightweight stdlib HTML parsing for ForexFactory fragments fetched without a browser."""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Any
+
+from forexcalendar_scraper.core.constants import (
+    CALENDAR_EVENT_CELL_CLASSES,
+    CALENDAR_IMPACT_CELL_CLASS,
+)
+from forexcalendar_scraper.domain.entities import CalendarEvent, NewsItem
+from forexcalendar_scraper.utils.formatting import sanitize_field_name
+
+SITE_ORIGIN = "https://www.forexfactory.com"
+VOID_ELEMENTS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+)
+DETAIL_CONTAINER_CLASSES = frozenset({"calendar__detail", "calendar-detail"})
+HISTORY_CONTAINER_CLASSES = frozenset({"half", "last", "details"})
+CALENDAR_EVENT_CELL_CLASS_SET = frozenset(CALENDAR_EVENT_CELL_CLASSES)
+DAY_BREAKER_PATTERN = re.compile(r"(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\s+(\w+\s+\d+)")
+DIGIT_PATTERN = re.compile(r"\d")
+NEWS_LINK_PATTERN = re.compile(r"news|article", re.IGNORECASE)
+NEWS_SNIPPET_LENGTH = 200
+IMPLICITLY_CLOSED = {
+    "tr": frozenset({"tr"}),
+    "td": frozenset({"td", "th"}),
+    "th": frozenset({"td", "th"}),
+    "li": frozenset({"li"}),
+    "p": frozenset({"p"}),
+}
+
+
+@dataclass(slots=True)
+class HtmlNode:
+    """A minimal element tree node."""
+
+    tag: str
+    attrs: dict[str, str] = field(default_factory=dict)
+    children: list[HtmlNode | str] = field(default_factory=list)
+    parent: HtmlNode | None = field(default=None, repr=False)
+
+    @property
+    def classes(self) -> set[str]:
+        return set(self.attrs.get("class", "").split())
+
+    def get(self, name: str, default: str = "") -> str:
+        return self.attrs.get(name, default)
+
+    def text(self) -> str:
+        parts: list[str] = []
+        self._collect_text(parts)
+        return " ".join("".join(parts).split())
+
+    def iter(self) -> Iterator[HtmlNode]:
+        for child in self.children:
+            if isinstance(child, HtmlNode):
+                yield child
+                yield from child.iter()
+
+    def find_all(self, predicate: Callable[[HtmlNode], bool]) -> list[HtmlNode]:
+        return [node for node in self.iter() if predicate(node)]
+
+    def find(self, predicate: Callable[[HtmlNode], bool]) -> HtmlNode | None:
+        return next((node for node in self.iter() if predicate(node)), None)
+
+    def child_elements(self, *tags: str) -> list[HtmlNode]:
+        return [
+            child
+            for child in self.children
+            if isinstance(child, HtmlNode) and (not tags or child.tag in tags)
+        ]
+
+    def _collect_text(self, parts: list[str]) -> None:
+        for child in self.children:
+            if isinstance(child, str):
+                parts.append(child)
+            else:
+                child._collect_text(parts)
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.root = HtmlNode(tag="#document")
+        self._stack: list[HtmlNode] = [self.root]
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        closes = IMPLICITLY_CLOSED.get(tag)
+        if closes and self._stack[-1].tag in closes:
+            self._stack.pop()
+
+        node = HtmlNode(
+            tag=tag,
+            attrs={name: value or "" for name, value in attrs},
+            parent=self._stack[-1],
+        )
+        self._stack[-1].children.append(node)
+        if tag not in VOID_ELEMENTS:
+            self._stack.append(node)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS and self._stack[-1].tag == tag:
+            self._stack.pop()
+
+    def handle_endtag(self, tag: str) -> None:
+        for index in range(len(self._stack) - 1, 0, -1):
+            if self._stack[index].tag == tag:
+                del self._stack[index:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        self._stack[-1].children.append(data)
+
+
+def parse_html(markup: str) -> HtmlNode:
+    """Parse an HTML document or fragment into a small element tree."""
+
+    builder = _TreeBuilder()
+    builder.feed(markup)
+    builder.close()
+    return builder.root
+
+
+def normalize_url(href: str) -> str:
+    """Expand site-relative ForexFactory links into absolute URLs."""
+
+    return SITE_ORIGIN + href if href[:1] == "/" else href
+
+
+def has_class(*class_names: str) -> Callable[[HtmlNode], bool]:
+    """Match elements carrying every requested class name."""
+
+    required = set(class_names)
+    return lambda node: required.issubset(node.classes)
+
+
+def class_contains(fragment: str, tag: str | None = None) -> Callable[[HtmlNode], bool]:
+    """Match elements whose class attribute contains a substring, like `[class*='...']`."""
+
+    return lambda node: (tag is None or node.tag == tag) and fragment in node.get("class")
+
+
+def table_rows(table: HtmlNode, cell_tags: tuple[str, ...] = ("td",)) -> list[list[HtmlNode]]:
+    """Return the cell nodes for every row within a table, including tbody rows."""
+
+    return [row.child_elements(*cell_tags) for row in table.find_all(lambda node: node.tag == "tr")]
+
+
+def parse_specs_table(root: HtmlNode) -> dict[str, str]:
+    """Extract label/value pairs from the first detail specs table in a parsed fragment."""
+
+    specs_table = (
+        root.find(class_contains("specs", tag="table"))
+        or root.find(class_contains("specs"))
+        or _find_detail_table(root)
+        or root.find(lambda node: node.tag == "table" and len(table_rows(node)) > 1)
+    )
+    if specs_table is None:
+        return {}
+
+    specs_data: dict[str, str] = {}
+    for cells in table_rows(specs_table):
+        if len(cells) < 2:
+            continue
+        label = cells[0].text()
+        value = cells[1].text()
+        if label and value:
+            specs_data[sanitize_field_name(label)] = value
+    return specs_data
+
+
+def _find_detail_table(root: HtmlNode) -> HtmlNode | None:
+    for container in root.find_all(lambda node: bool(node.classes & DETAIL_CONTAINER_CLASSES)):
+        table = container.find(lambda node: node.tag == "table")
+        if table is not None:
+            return table
+    return None
+
+
+def find_full_details_link(root: HtmlNode) -> tuple[str, str] | None:
+    """Return the `(href, text)` of the `.calendardetails__solo` link when present."""
+
+    solo_div = root.find(has_class("calendardetails__solo"))
+    if solo_div is None:
+        return None
+
+    link = solo_div.find(lambda node: node.tag == "a")
+    if link is None:
+        return None
+    return normalize_url(link.get("href")), link.text()
+
+
+def parse_detail_specs(root: HtmlNode) -> dict[str, str]:
+    """Extract detail specs plus the full details link from a parsed overlay fragment."""
+
+    specs_data = parse_specs_table(root)
+    full_details_link = find_full_details_link(root)
+    if specs_data and full_details_link is not None:
+        href, link_text = full_details_link
+        if href:
+            specs_data["full_details_url"] = href
+        if link_text:
+            specs_data["full_details_link_text"] = link_text
+    return specs_data
+
+
+def parse_history_rows(root: HtmlNode) -> list[tuple[str, str, str, str, str]]:
+    """Extract `(date, href, actual, forecast, previous)` rows from a detail history table."""
+
+    history_table = _find_history_table(root)
+    if history_table is None:
+        return []
+    return parse_history_table(history_table)
+
+
+def parse_history_table(table: HtmlNode) -> list[tuple[str, str, str, str, str]]:
+    """Extract `(date, href, actual, forecast, previous)` rows from a parsed history table."""
+
+    rows: list[tuple[str, str, str, str, str]] = []
+    for cells in table_rows(table):
+        if len(cells) < 2:
+            continue
+        texts = [cell.text() for cell in cells[:4]] + [""] * (4 - len(cells))
+        link = cells[0].find(lambda node: node.tag == "a")
+        href = link.get("href") if link is not None else ""
+        rows.append((texts[0], href, texts[1], texts[2], texts[3]))
+    return rows
+
+
+def parse_table_headers(table: HtmlNode) -> list[str]:
+    """Return the lowercased header cell texts of a parsed table."""
+
+    header_rows = table_rows(table, ("th", "td"))
+    return [cell.text().lower() for cell in header_rows[0]] if header_rows else []
+
+
+def _find_history_table(root: HtmlNode) -> HtmlNode | None:
+    containers = (
+        root.find_all(lambda node: HISTORY_CONTAINER_CLASSES.issubset(node.classes))
+        + root.find_all(class_contains("history"))
+    )
+    for container in containers:
+        table = container.find(lambda node: node.tag == "table")
+        if table is not None:
+            return table
+    return None
+
+
+def parse_news_links(root: HtmlNode) -> tuple[list[tuple[str, str, str]], bool] | None:
+    """Return `(title, href, parent text)` links from the news panel and whether the
+    `.half.last.details` fallback was used, or `None` when neither is present.
+    """
+
+    container = next(
+        (
+            taglist
+            for panel in root.find_all(has_class("half", "last"))
+            if (taglist := panel.find(has_class("ff_taglist"))) is not None
+        ),
+        None,
+    ) or root.find(class_contains("news"))
+    if container is not None:
+        return _read_links(container, include_parent=False), False
+
+    fallback_panel = root.find(has_class(*HISTORY_CONTAINER_CLASSES))
+    if fallback_panel is None:
+        return None
+    return _read_links(fallback_panel, include_parent=True), True
+
+
+def _read_links(container: HtmlNode, include_parent: bool) -> list[tuple[str, str, str]]:
+    return [
+        (
+            link.text(),
+            link.get("href"),
+            (
+                link.parent.text()[:NEWS_SNIPPET_LENGTH]
+                if include_parent and link.parent is not None
+                else ""
+            ),
+        )
+        for link in container.find_all(lambda node: node.tag == "a")
+    ]
+
+
+def build_news_items(
+    links: Iterable[Sequence[str]],
+    detail_id: str,
+    event: CalendarEvent | None = None,
+) -> list[NewsItem]:
+    """Turn `(title, href, parent text)` links into news items, dropping navigation noise.
+
+    When `event` is given its context is filled in directly, so items are built only once.
+    """
+
+    event_name, event_date, event_currency = (
+        (event.name, event.date, event.currency) if event is not None else ("", "", "")
+    )
+    news_items: list[NewsItem] = []
+    for title, href, parent_text in links:
+        if not title or not href or len(title) <= 5:
+            continue
+        if len(title) < 15 and DIGIT_PATTERN.search(title):
+            continue
+
+        news_items.append(
+            NewsItem(
+                detail_id=detail_id,
+                title=title,
+                url=normalize_url(href),
+                snippet=parent_text[:NEWS_SNIPPET_LENGTH] if len(parent_text) > len(title) else "",
+                link_type="news" if NEWS_LINK_PATTERN.search(href) else "related",
+                event_name=event_name,
+                event_date=event_date,
+                event_currency=event_currency,
+            )
+        )
+    return news_items
+
+
+def parse_calendar_rows(root: HtmlNode) -> list[list[Any]]:
+    """Read calendar table rows in the layout `build_calendar_events` expects."""
+
+    table = root.find(has_class("calendar__table"))
+    if table is None:
+        return []
+
+    rows: list[list[Any]] = []
+    for row in table.find_all(lambda node: node.tag == "tr"):
+        if "day-breaker" in row.get("class"):
+            date_cell = row.find(lambda node: node.tag == "td")
+            rows.append([True, date_cell.text() if date_cell is not None else "", ""])
+            continue
+
+        # One walk per row finds every cell, instead of one subtree search per column.
+        cells_by_class: dict[str, HtmlNode] = {}
+        for node in row.iter():
+            for class_name in node.classes & CALENDAR_EVENT_CELL_CLASS_SET:
+                cells_by_class.setdefault(class_name, node)
+
+        cells = []
+        for class_name in CALENDAR_EVENT_CELL_CLASSES:
+            cell = cells_by_class.get(class_name)
+            if cell is not None and class_name == CALENDAR_IMPACT_CELL_CLASS:
+                cell = cell.find(lambda node: node.tag == "span")
+                cells.append((cell.get("title").strip() or cell.text()) if cell is not None else "")
+            else:
+                cells.append(cell.text() if cell is not None else "")
+        rows.append([False, *cells, row.get("data-event-id").strip()])
+    return rows
+
+
+def build_calendar_events(
+    rows: Iterable[Sequence[Any]],
+    logger: logging.Logger,
+) -> list[CalendarEvent]:
+    """Turn calendar rows into events dated by the preceding day-breaker row.
+
+    Day breakers are `[True, date text, date cell markup]` and event rows are `[False, time,
+    currency, impact, name, actual, forecast, previous, detail ID]`, matching the
+    `CalendarEvent` field order after `date`.
+    """
+
+    events: list[CalendarEvent] = []
+    current_date = ""
+    skipped_rows = 0
+
+    for index, (is_day_breaker, *cells) in enumerate(rows):
+        if is_day_breaker:
+            extracted_date = _parse_day_breaker_date(*cells)
+            if extracted_date:
+                logger.info("Detected date section on row %s: %s", index + 1, extracted_date)
+                current_date = extracted_date
+            continue
+
+        event = CalendarEvent(current_date or "Unknown", *cells)
+        if event.name or event.currency:
+            events.append(event)
+        else:
+            skipped_rows += 1
+
+    logger.info("Calendar scraping finished. Processed=%s Skipped=%s", len(events), skipped_rows)
+    return events
+
+
+def _parse_day_breaker_date(date_text: str, cell_html: str) -> str:
+    if not date_text:
+        date_match = DAY_BREAKER_PATTERN.search(cell_html)
+        if date_match:
+            date_text = date_match.group(0)
+    return " ".join(date_text.split())
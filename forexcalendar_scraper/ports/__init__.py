@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from contextlib import AbstractContextManager
 import logging
 from pathlib import Path
-from typing import Callable, Iterable, Protocol, Sequence
+from typing import Callable, Iterable, Protocol, Sequence, TypeVar
 
 from forexcalendar_scraper.domain.entities import (
     CalendarEvent,
@@ -17,7 +18,16 @@ from forexcalendar_scraper.domain.entities import (
 )
 
 
-LoggerFactory = Callable[[str, Path, str | int | None], logging.Logger]
+LoggerFactory = Callable[[str, Path, str | int | None, bool], logging.Logger]
+RecordT = TypeVar("RecordT", contravariant=True)
+
+
+class RecordWriterPort(Protocol[RecordT]):
+    """Port for streaming records to an output as they are produced."""
+
+    def write(self, record: RecordT) -> None: ...
+
+    def write_many(self, records: Iterable[RecordT]) -> None: ...
 
 
 class PathServicePort(Protocol):
@@ -28,6 +38,7 @@ class PathServicePort(Protocol):
         date_param: str,
         suffix: str = "",
         create_dir: bool = True,
+        extension: str = ".csv",
     ) -> Path: ...
 
     def build_log_file_path(self, script_name: str) -> Path: ...
@@ -44,6 +55,8 @@ class PathServicePort(Protocol):
 
     def find_matching_files(self, pattern: str) -> list[Path]: ...
 
+    def build_cache_file_path(self, cache_name: str) -> Path: ...
+
 
 class EventRepositoryPort(Protocol):
     """Port for reading and writing calendar data."""
@@ -52,20 +65,45 @@ class EventRepositoryPort(Protocol):
 
     def load_events(self, csv_file: str | Path) -> list[CalendarEvent]: ...
 
+    def load_detail_ids(self, csv_file: str | Path) -> set[str]: ...
+
     def save_events(self, output_file: Path, events: Iterable[CalendarEvent]) -> None: ...
 
     def save_detail_blocks(self, output_file: Path, detail_blocks: Iterable[DetailBlock]) -> None: ...
 
+    def open_detail_block_writer(
+        self,
+        output_file: Path,
+    ) -> AbstractContextManager[RecordWriterPort[DetailBlock]]: ...
+
     def load_detail_blocks(self, csv_file: str | Path) -> dict[str, dict[str, str]]: ...
 
     def save_history_records(self, output_file: Path, history_records: Iterable[HistoryRecord]) -> None: ...
 
+    def open_history_record_writer(
+        self,
+        output_file: Path,
+        append: bool = False,
+    ) -> AbstractContextManager[RecordWriterPort[HistoryRecord]]: ...
+
     def save_news_items(self, output_file: Path, news_items: Iterable[NewsItem]) -> None: ...
 
+    def open_news_item_writer(
+        self,
+        output_file: Path,
+        append: bool = False,
+    ) -> AbstractContextManager[RecordWriterPort[NewsItem]]: ...
+
 
 class CalendarGatewayPort(Protocol):
     """Port for scraping and extracting ForexFactory data without exposing browser details."""
 
+    def open_session(
+        self,
+        logger: logging.Logger,
+        purpose: str,
+    ) -> AbstractContextManager[None]: ...
+
     def scrape_calendar(self, date_param: str, logger: logging.Logger) -> list[CalendarEvent]: ...
 
     def extract_detail_block(
@@ -97,6 +135,16 @@ class CalendarGatewayPort(Protocol):
     ) -> HistoryNewsBundle | None: ...
 
 
+class ExtractionCachePort(Protocol):
+    """Port for persisting serialized extraction payloads between runs."""
+
+    def get(self, key: str) -> str | None: ...
+
+    def set(self, key: str, payload: str, ttl_seconds: float) -> None: ...
+
+    def close(self) -> None: ...
+
+
 class EventStorePort(Protocol):
     """Port for database-backed persistence and API reads."""
 
@@ -1,5 +1,6 @@
 """Helper functions shared across modules."""
 
 from forexcalendar_scraper.utils.formatting import numeric_sort_key, sanitize_field_name, truncate_text
+from forexcalendar_scraper.utils.serialization import decode_json, encode_json
 
-__all__ = ["numeric_sort_key", "sanitize_field_name", "truncate_text"]
+__all__ = ["decode_json", "encode_json", "numeric_sort_key", "sanitize_field_name", "truncate_text"]
@@ -6,19 +6,16 @@ import re
 
 
 NON_ALNUM_PATTERN = re.compile(r"[^a-z0-9_]+")
+REPEATED_UNDERSCORE_PATTERN = re.compile(r"_+")
+FIELD_NAME_TRANSLATION = str.maketrans({"/": "_", " ": "_", ":": None, "(": None, ")": None})
 
 
 def sanitize_field_name(label: str) -> str:
     """Convert a scraped label into a stable field name."""
 
-    normalized = label.strip().lower()
-    normalized = normalized.replace("/", "_")
-    normalized = normalized.replace(" ", "_")
-    normalized = normalized.replace(":", "")
-    normalized = normalized.replace("(", "")
-    normalized = normalized.replace(")", "")
+    normalized = label.strip().lower().translate(FIELD_NAME_TRANSLATION)
     normalized = NON_ALNUM_PATTERN.sub("_", normalized)
-    normalized = re.sub(r"_+", "_", normalized)
+    normalized = REPEATED_UNDERSCORE_PATTERN.sub("_", normalized)
     return normalized.strip("_")
 
 
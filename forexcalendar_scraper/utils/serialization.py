@@ -0,0 +1,27 @@
+"""JSON encoding that uses orjson when the optional `fast` extra is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+
+def encode_json(value: Any) -> str:
+    """Serialize a value to a compact JSON string."""
+
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def decode_json(payload: str | bytes) -> Any:
+    """Parse a JSON document, raising `ValueError` when it is malformed."""
+
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
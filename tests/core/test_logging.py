@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from forexcalendar_scraper.core.logging import configure_logger
+
+
+def test_configure_logger_reuses_handlers_until_the_configuration_changes(tmp_path):
+    log_file = tmp_path / "scraper.log"
+
+    handler = configure_logger("test.core.logging", log_file, "INFO").handlers[0]
+    repeated_handler = configure_logger("test.core.logging", log_file, "INFO").handlers[0]
+    changed_handler = configure_logger("test.core.logging", log_file, "DEBUG").handlers[0]
+
+    assert repeated_handler is handler
+    assert changed_handler is not handler
+
+
+def test_configure_logger_can_skip_the_console_handler(tmp_path, capsys):
+    logger = configure_logger("test.core.logging.quiet", tmp_path / "scraper.log", "INFO", False)
+    logger.info("written to the log file only")
+    configure_logger("test.core.logging.quiet", tmp_path / "other.log", "INFO", False)
+
+    assert capsys.readouterr().err == ""
+    assert "written to the log file only" in (tmp_path / "scraper.log").read_text()
@@ -1,4 +1,4 @@
-from forexcalendar_scraper.core.paths import PathService
+from forexcalendar_scraper.core.paths import PathService, build_consecutive_week_params
 
 
 def test_resolve_primary_csv_path_prefers_dated_output(tmp_path):
@@ -22,4 +22,11 @@ def test_resolve_input_file_finds_matching_output_file(tmp_path):
         preferred_date_param="day=oct6.2025",
     )
 
-    assert resolved == output_file.resolve()
\ No newline at end of file
+    assert resolved == output_file.resolve()
+
+def test_build_consecutive_week_params_crosses_month_and_year_ends():
+    assert build_consecutive_week_params("week=dec22.2025", 3) == [
+        "week=dec22.2025",
+        "week=dec29.2025",
+        "week=jan5.2026",
+    ]
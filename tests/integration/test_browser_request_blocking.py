@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+from forexcalendar_scraper.core.config import Settings
+from forexcalendar_scraper.infrastructure.web.browser import (
+    DISABLE_IMAGES_ARG,
+    BrowserSessionFactory,
+    build_launch_args,
+    is_ad_request,
+)
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://securepubads.g.doubleclick.net/tag/js/gpt.js", True),
+        ("https://www.googletagmanager.com/gtm.js?id=GTM-1", True),
+        ("https://connect.facebook.net/en_US/fbevents.js", True),
+        ("https://www.forexfactory.com/analytics.js", True),
+        ("https://notdoubleclick.net/app.js", False),
+        ("https://www.forexfactory.com/calendar?day=oct6.2025", False),
+        ("https://www.forexfactory.com/news/1-adsense-report", False),
+    ],
+)
+def test_is_ad_request_matches_ad_hosts_and_tracker_paths(url, expected):
+    assert is_ad_request(url) is expected
+
+
+def test_build_launch_args_disables_images_only_when_they_are_blocked():
+    assert DISABLE_IMAGES_ARG in build_launch_args(frozenset({"image", "font"}))
+    assert DISABLE_IMAGES_ARG not in build_launch_args(frozenset({"font"}))
+
+
+def test_shared_browser_does_not_launch_chromium_until_a_page_is_opened(monkeypatch):
+    def fail_to_start(self):
+        raise AssertionError("the browser should not be started")
+
+    monkeypatch.setattr(BrowserSessionFactory, "_start_browser", fail_to_start)
+    factory = BrowserSessionFactory(Settings())
+
+    with factory.shared_browser(logging.getLogger("test.browser.shared"), "calendar scraping"):
+        pass
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+
+from forexcalendar_scraper.core.config import Settings
+from forexcalendar_scraper.infrastructure.web import browser
+from forexcalendar_scraper.infrastructure.web.browser import (
+    CLEAR_STORAGE_SCRIPT,
+    BrowserSessionFactory,
+)
+
+STORAGE_STATE = {
+    "cookies": [{"name": "fftimezone", "value": "UTC", "domain": ".forexfactory.com", "path": "/"}],
+    "origins": [],
+}
+
+
+class FakeContext:
+    def __init__(self, state: dict) -> None:
+        self.state = state
+        self.snapshots = 0
+        self.cleared_cookies = 0
+        self.added_cookies: list[list[dict]] = []
+
+    def storage_state(self) -> dict:
+        self.snapshots += 1
+        return self.state
+
+    def clear_cookies(self) -> None:
+        self.cleared_cookies += 1
+
+    def add_cookies(self, cookies: list[dict]) -> None:
+        self.added_cookies.append(cookies)
+
+
+class FakePage:
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.scripts: list[str] = []
+
+    def evaluate(self, script: str) -> None:
+        self.scripts.append(script)
+
+
+def _build_factory(**overrides) -> BrowserSessionFactory:
+    factory = BrowserSessionFactory(Settings(**overrides))
+    factory._local.throttled_status = None
+    return factory
+
+
+def test_remember_storage_state_snapshots_once_while_fresh():
+    factory = _build_factory()
+    context = FakeContext(STORAGE_STATE)
+    logger = logging.getLogger("test.browser.storage_state")
+
+    factory._remember_storage_state(context, logger)
+    factory._remember_storage_state(context, logger)
+
+    assert context.snapshots == 1
+    assert factory._storage_state == STORAGE_STATE
+
+
+def test_remember_storage_state_skips_throttled_loads():
+    factory = _build_factory()
+    factory._local.throttled_status = 429
+    context = FakeContext(STORAGE_STATE)
+
+    factory._remember_storage_state(context, logging.getLogger("test.browser.storage_state"))
+
+    assert context.snapshots == 0
+    assert factory._storage_state is None
+
+
+def test_reset_page_clears_storage_and_reseeds_remembered_cookies():
+    factory = _build_factory()
+    factory._remember_storage_state(
+        FakeContext(STORAGE_STATE),
+        logging.getLogger("test.browser.storage_state"),
+    )
+    context = FakeContext(STORAGE_STATE)
+    page = FakePage("https://www.forexfactory.com/calendar?day=oct6.2025")
+
+    factory._reset_page(context, page)
+
+    assert page.scripts == [CLEAR_STORAGE_SCRIPT]
+    assert context.cleared_cookies == 1
+    assert context.added_cookies == [STORAGE_STATE["cookies"]]
+
+
+def test_reset_page_skips_web_storage_on_blank_pages():
+    factory = _build_factory()
+    context = FakeContext(STORAGE_STATE)
+    page = FakePage("about:blank")
+
+    factory._reset_page(context, page)
+
+    assert page.scripts == []
+    assert context.cleared_cookies == 1
+    assert context.added_cookies == []
+
+
+def test_snapshot_loaded_from_disk_is_refreshed_after_the_first_load(tmp_path):
+    state_file = tmp_path / "state" / "storage_state.json"
+    state_file.parent.mkdir()
+    state_file.write_text(json.dumps({"cookies": [], "origins": []}), encoding="utf-8")
+    factory = _build_factory(storage_state_file=str(state_file))
+    context = FakeContext(STORAGE_STATE)
+
+    assert factory._storage_state_saved_at == float("-inf")
+    factory._remember_storage_state(context, logging.getLogger("test.browser.storage_state"))
+
+    assert context.snapshots == 1
+    assert json.loads(state_file.read_text(encoding="utf-8")) == STORAGE_STATE
+
+
+def test_save_storage_state_swaps_in_a_per_thread_temporary_file(tmp_path, monkeypatch):
+    state_file = tmp_path / "storage_state.json"
+    replaced: list[tuple[str, str]] = []
+    replace = os.replace
+
+    def record_replace(source, destination) -> None:
+        replaced.append((os.fspath(source), os.fspath(destination)))
+        replace(source, destination)
+
+    monkeypatch.setattr(browser.os, "replace", record_replace)
+    factory = _build_factory(storage_state_file=str(state_file))
+    factory._remember_storage_state(
+        FakeContext(STORAGE_STATE),
+        logging.getLogger("test.browser.storage_state"),
+    )
+
+    temporary_file = tmp_path / f"storage_state.json.{threading.get_ident()}.tmp"
+    assert replaced == [(str(temporary_file), str(state_file))]
+    assert not temporary_file.exists()
+    assert json.loads(state_file.read_text(encoding="utf-8")) == STORAGE_STATE
+
+
+def test_storage_state_file_is_ignored_when_sharing_is_off(tmp_path):
+    state_file = tmp_path / "storage_state.json"
+    state_file.write_text(json.dumps(STORAGE_STATE), encoding="utf-8")
+
+    factory = _build_factory(share_storage_state=False, storage_state_file=str(state_file))
+
+    assert factory._storage_state is None
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+import logging
+
+import pytest
+from forexcalendar_scraper.core.config import Settings
+from forexcalendar_scraper.core.exceptions import DetailUnavailableError
+from forexcalendar_scraper.domain.entities import CalendarEvent, HistoryRecord
+from forexcalendar_scraper.infrastructure.web.forexfactory_client import ForexFactoryClient
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+
+class StubCalendarPage:
+    def __init__(self, rows: list[list[object]]) -> None:
+        self.rows = rows
+        self.evaluate_calls = 0
+
+    def goto(self, url: str, wait_until: str, timeout: int) -> None:
+        self.url = url
+        self.wait_until = wait_until
+
+    def wait_for_selector(self, selector: str, state: str, timeout: int) -> None:
+        self.wait_state = state
+
+    def evaluate(self, script: str, argument: object) -> str:
+        self.evaluate_calls += 1
+        return json.dumps(self.rows)
+
+
+class StubOverlayPage:
+    def __init__(self, markup: str) -> None:
+        self.markup = markup
+        self.evaluate_arguments: list[object] = []
+
+    def wait_for_selector(self, selector: str, state: str, timeout: int) -> None:
+        self.waited_selector = selector
+
+    def evaluate(self, script: str, argument: object) -> str:
+        self.evaluate_arguments.append(argument)
+        return self.markup
+
+
+class StubLoadedCalendarPage(StubOverlayPage):
+    url = "https://www.forexfactory.com/calendar?day=oct6.2025#detail=100"
+
+    def __init__(self) -> None:
+        super().__init__("")
+        self.waited_selectors: list[str] = []
+
+    def wait_for_selector(self, selector: str, state: str, timeout: int) -> None:
+        self.waited_selectors.append(selector)
+
+
+def test_open_event_overlay_by_hash_waits_for_the_refilled_overlay():
+    page = StubLoadedCalendarPage()
+
+    ForexFactoryClient(Settings()).open_event_overlay(
+        page,
+        "day=oct6.2025",
+        "101",
+        logging.getLogger("test.forexfactory_client.overlay"),
+    )
+
+    assert page.evaluate_arguments == ["101"]
+    assert all(
+        selector.strip().endswith(":not(:empty)")
+        for selector in page.waited_selectors[0].split(",")
+    )
+    assert ".calendar-detail:not(:empty)" in page.waited_selectors[0]
+
+
+class StubUnrenderedCalendarPage(StubLoadedCalendarPage):
+    def wait_for_selector(self, selector: str, state: str, timeout: int) -> None:
+        raise PlaywrightTimeoutError("overlay never filled")
+
+
+def test_open_event_overlay_raises_when_the_overlay_never_renders():
+    client = ForexFactoryClient(Settings())
+    logger = logging.getLogger("test.forexfactory_client.overlay")
+
+    with pytest.raises(DetailUnavailableError):
+        client.open_event_overlay(StubUnrenderedCalendarPage(), "day=oct6.2025", "101", logger)
+    with pytest.raises(ValueError):
+        client.open_event_overlay(StubLoadedCalendarPage(), "day=oct6.2025", "", logger)
+
+
+def test_extract_history_from_open_page_picks_the_table_in_the_same_evaluate():
+    page = StubOverlayPage(
+        "<table><tr><td><a href='/calendar?day=sep10.2025'>Sep 10, 2025</a></td>"
+        "<td>0.4%</td><td>0.3%</td><td>0.2%</td></tr></table>"
+    )
+
+    records = ForexFactoryClient(Settings()).extract_history_from_open_page(
+        page,
+        "101",
+        logging.getLogger("test.forexfactory_client.history"),
+    )
+
+    assert len(page.evaluate_arguments) == 1
+    assert isinstance(page.evaluate_arguments[0], list)
+    assert records == [
+        HistoryRecord(
+            detail_id="101",
+            date="Sep 10, 2025",
+            date_url="https://www.forexfactory.com/calendar?day=sep10.2025",
+            actual="0.4%",
+            forecast="0.3%",
+            previous="0.2%",
+        )
+    ]
+
+
+def test_scrape_calendar_reads_all_rows_with_one_evaluate():
+    page = StubCalendarPage(
+        [
+            [True, "", '<span class="date" title="Mon Oct 6"></span>'],
+            [False, "8:30am", "USD", "High Impact", "CPI m/m", "0.3%", "0.2%", "0.4%", "101"],
+            [False, "", "", "", "", "", "", "", ""],
+            [True, "Tue Oct 7", ""],
+            [False, "All Day", "EUR", "Non-Economic", "Bank Holiday", "", "", "", "102"],
+        ]
+    )
+
+    events = ForexFactoryClient(Settings()).scrape_calendar(
+        page,
+        "day=oct6.2025",
+        logging.getLogger("test.forexfactory_client"),
+    )
+
+    assert (page.wait_until, page.wait_state) == ("domcontentloaded", "attached")
+    assert page.evaluate_calls == 1
+    assert events == [
+        CalendarEvent(
+            date="Mon Oct 6",
+            time="8:30am",
+            currency="USD",
+            impact="High Impact",
+            name="CPI m/m",
+            actual="0.3%",
+            forecast="0.2%",
+            previous="0.4%",
+            detail_id="101",
+        ),
+        CalendarEvent(
+            date="Tue Oct 7",
+            time="All Day",
+            currency="EUR",
+            impact="Non-Economic",
+            name="Bank Holiday",
+            detail_id="102",
+        ),
+    ]
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import logging
+from contextlib import nullcontext
+
+import httpx
+import pytest
+from forexcalendar_scraper.core.config import Settings
+from forexcalendar_scraper.core.exceptions import RateLimitedError
+from forexcalendar_scraper.domain.entities import CalendarEvent
+from forexcalendar_scraper.infrastructure.web.forexfactory_gateway import ForexFactoryGateway
+from forexcalendar_scraper.infrastructure.web.forexfactory_http_client import ForexFactoryHttpClient
+
+DETAIL_HTML = """
+<div class="calendardetails">
+  <table class="calendarspecs">
+    <tr><td class="calendarspecs__spec">Source</td><td>Bureau of Labor Statistics</td></tr>
+    <tr><td>Usual Effect</td><td>'Actual' greater than 'Forecast' is good for currency;</td></tr>
+    <tr><td>Frequency</td><td></td></tr>
+  </table>
+  <div class="calendardetails__solo"><a href="/news/1-cpi">Full details</a></div>
+</div>
+"""
+
+CALENDAR_HTML = """
+<table class="calendar__table">
+  <tbody>
+    <tr class="calendar__row calendar__row--day-breaker"><td colspan="10">Mon Oct 6</td></tr>
+    <tr class="calendar__row" data-event-id="101">
+      <td class="calendar__cell calendar__time">8:30am</td>
+      <td class="calendar__cell calendar__currency">USD</td>
+      <td class="calendar__cell calendar__impact"><span title="High Impact Expected"></span></td>
+      <td class="calendar__cell calendar__event"><span>CPI m/m</span></td>
+      <td class="calendar__cell calendar__actual">0.3%</td>
+      <td class="calendar__cell calendar__forecast">0.2%</td>
+      <td class="calendar__cell calendar__previous">0.4%</td>
+    </tr>
+  </tbody>
+</table>
+"""
+
+
+def _build_client(handler) -> ForexFactoryHttpClient:
+    return ForexFactoryHttpClient(
+        Settings(detail_endpoint_url="https://example.com/details/{detail_id}"),
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def test_fetch_calendar_events_parses_server_rendered_table():
+    requested_urls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_urls.append(str(request.url))
+        return httpx.Response(200, text=CALENDAR_HTML)
+
+    events = _build_client(handler).fetch_calendar_events(
+        "day=oct6.2025",
+        logging.getLogger("test.http"),
+    )
+
+    assert requested_urls == ["https://www.forexfactory.com/calendar?day=oct6.2025"]
+    assert events == [
+        CalendarEvent(
+            date="Mon Oct 6",
+            time="8:30am",
+            currency="USD",
+            impact="High Impact Expected",
+            name="CPI m/m",
+            actual="0.3%",
+            forecast="0.2%",
+            previous="0.4%",
+            detail_id="101",
+        )
+    ]
+
+
+def test_fetch_calendar_events_falls_back_on_anti_bot_pages():
+    client = _build_client(lambda request: httpx.Response(403, text="Just a moment..."))
+
+    assert client.fetch_calendar_events("day=oct6.2025", logging.getLogger("test.http")) is None
+
+
+def test_fetch_calendar_events_raises_when_throttled():
+    client = _build_client(lambda request: httpx.Response(429, text="slow down"))
+
+    with pytest.raises(RateLimitedError):
+        client.fetch_calendar_events("day=oct6.2025", logging.getLogger("test.http"))
+
+
+def test_fetch_detail_specs_parses_specs_table_fragment():
+    requested_urls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_urls.append(str(request.url))
+        return httpx.Response(200, text=DETAIL_HTML)
+
+    specs = _build_client(handler).fetch_detail_specs("12345", logging.getLogger("test.http"))
+
+    assert requested_urls == ["https://example.com/details/12345"]
+    assert specs == {
+        "source": "Bureau of Labor Statistics",
+        "usual_effect": "'Actual' greater than 'Forecast' is good for currency;",
+        "full_details_url": "https://www.forexfactory.com/news/1-cpi",
+        "full_details_link_text": "Full details",
+    }
+
+
+def test_fetch_detail_specs_returns_none_on_http_error():
+    client = _build_client(lambda request: httpx.Response(403, text="blocked"))
+
+    assert client.fetch_detail_specs("12345", logging.getLogger("test.http")) is None
+
+
+def test_fetch_detail_specs_raises_when_throttled():
+    client = _build_client(lambda request: httpx.Response(429, text="slow down"))
+
+    with pytest.raises(RateLimitedError):
+        client.fetch_detail_specs("12345", logging.getLogger("test.http"))
+
+
+def test_fetch_history_records_parses_history_table_fragment():
+    history_html = """
+    <div class="half last details">
+      <table>
+        <tr><th>History</th><th>Actual</th><th>Forecast</th><th>Previous</th></tr>
+        <tr><td><a href="/calendar?day=sep11.2025">Sep 2025</a></td><td>0.4%</td>
+            <td>0.3%</td><td>0.2%</td></tr>
+        <tr><td>Aug 2025</td><td>0.2%</td></tr>
+      </table>
+    </div>
+    """
+    client = _build_client(lambda request: httpx.Response(200, text=history_html))
+
+    records = client.fetch_history_records("12345", logging.getLogger("test.http"))
+
+    assert [
+        (record.date, record.date_url, record.actual, record.forecast, record.previous)
+        for record in records
+    ] == [
+        (
+            "Sep 2025",
+            "https://www.forexfactory.com/calendar?day=sep11.2025",
+            "0.4%",
+            "0.3%",
+            "0.2%",
+        ),
+        ("Aug 2025", "", "0.2%", "", ""),
+    ]
+
+
+def test_fetch_history_news_reads_both_from_one_request():
+    detail_html = """
+    <div class="half last details">
+      <table>
+        <tr><th>History</th><th>Actual</th></tr>
+        <tr><td>Sep 2025</td><td>0.4%</td></tr>
+      </table>
+      <div class="ff_taglist">
+        <a href="/news/1-cpi-beats-expectations">CPI beats expectations again</a>
+        <a href="/calendar">Menu</a>
+      </div>
+    </div>
+    """
+    requested_urls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_urls.append(str(request.url))
+        return httpx.Response(200, text=detail_html)
+
+    history, news = _build_client(handler).fetch_history_news(
+        "12345",
+        logging.getLogger("test.http"),
+    )
+
+    assert len(requested_urls) == 1
+    assert [(record.date, record.actual) for record in history] == [("Sep 2025", "0.4%")]
+    assert [(item.title, item.url, item.link_type) for item in news] == [
+        (
+            "CPI beats expectations again",
+            "https://www.forexfactory.com/news/1-cpi-beats-expectations",
+            "news",
+        )
+    ]
+
+
+def test_fetch_news_items_returns_none_without_news_links():
+    client = _build_client(
+        lambda request: httpx.Response(200, text="<div class='overlay__content'></div>")
+    )
+
+    assert client.fetch_news_items("12345", logging.getLogger("test.http")) is None
+
+
+
+class StubBrowserFactory:
+    def shared_browser(self, logger: logging.Logger, purpose: str) -> nullcontext[None]:
+        return nullcontext()
+
+
+class ClosingHttpClient:
+    def __init__(self) -> None:
+        self.close_calls = 0
+
+    def close(self) -> None:
+        self.close_calls += 1
+
+
+def test_gateway_closes_the_http_client_when_the_last_session_ends():
+    http_client = ClosingHttpClient()
+    gateway = ForexFactoryGateway(
+        browser_factory=StubBrowserFactory(),
+        client=None,
+        http_client=http_client,
+    )
+    logger = logging.getLogger("test.http.gateway")
+
+    with gateway.open_session(logger, "detail extraction"):
+        with gateway.open_session(logger, "detail extraction"):
+            pass
+        assert http_client.close_calls == 0
+
+    assert http_client.close_calls == 1
+
+
+def test_http_client_reopens_its_pool_after_close():
+    requested_urls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_urls.append(str(request.url))
+        return httpx.Response(404)
+
+    client = _build_client(handler)
+    logger = logging.getLogger("test.http")
+    client.fetch_detail_specs("12345", logger)
+    client.close()
+
+    assert client.fetch_detail_specs("12345", logger) is None
+    assert len(requested_urls) == 2
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from forexcalendar_scraper.domain.entities import CalendarEvent
+from forexcalendar_scraper.infrastructure.web.html_parsing import (
+    build_news_items,
+    normalize_url,
+    parse_detail_specs,
+    parse_html,
+)
+
+
+def test_build_news_items_classifies_links_and_drops_navigation_noise():
+    links = [
+        ("CPI beats expectations again", "/news/1-cpi-beats", ""),
+        ("Fed minutes in detail", "https://example.com/Article/2", ""),
+        ("Economic calendar overview", "/calendar?week=this", "Economic calendar overview page"),
+        ("Page 2", "/news?page=2", ""),
+        ("Home", "/", ""),
+        ("Untitled link without href", "", ""),
+    ]
+
+    news_items = build_news_items(links, "12345")
+
+    assert [(item.title, item.url, item.link_type, item.snippet) for item in news_items] == [
+        (
+            "CPI beats expectations again",
+            "https://www.forexfactory.com/news/1-cpi-beats",
+            "news",
+            "",
+        ),
+        ("Fed minutes in detail", "https://example.com/Article/2", "news", ""),
+        (
+            "Economic calendar overview",
+            "https://www.forexfactory.com/calendar?week=this",
+            "related",
+            "Economic calendar overview page",
+        ),
+    ]
+
+
+def test_build_news_items_fills_in_event_context():
+    event = CalendarEvent(date="Mon Oct 6", currency="USD", name="CPI m/m", detail_id="12345")
+
+    news_items = build_news_items(
+        [("Inflation cools as expected", "/news/1-inflation-cools", "")],
+        "12345",
+        event,
+    )
+
+    assert [(item.event_name, item.event_date, item.event_currency) for item in news_items] == [
+        ("CPI m/m", "Mon Oct 6", "USD")
+    ]
+
+
+def test_normalize_url_only_prefixes_site_relative_links():
+    assert normalize_url("/news/1") == "https://www.forexfactory.com/news/1"
+    assert normalize_url("https://example.com/a") == "https://example.com/a"
+    assert normalize_url("") == ""
+
+
+def test_parse_detail_specs_falls_back_to_the_first_table_with_several_rows():
+    fragment = parse_html(
+        '<div class="overlay__content">'
+        "<table><tr><td>Legend</td></tr></table>"
+        "<table><tr><td>Source</td><td>BLS</td></tr><tr><td>Frequency</td><td>Monthly</td></tr>"
+        "</table></div>"
+    )
+
+    assert parse_detail_specs(fragment) == {"source": "BLS", "frequency": "Monthly"}
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from forexcalendar_scraper.domain.entities import NewsItem
+from forexcalendar_scraper.infrastructure.persistence.csv_repository import CsvRepository
+
+
+def _news_item(index: int) -> NewsItem:
+    return NewsItem(
+        detail_id=str(index),
+        title=f"Headline {index}",
+        url=f"https://www.forexfactory.com/news/{index}",
+    )
+
+
+def _read_news(repository: CsvRepository, output_file) -> list[str]:
+    if output_file.suffix == ".jsonl":
+        lines = output_file.read_text(encoding="utf-8").splitlines()
+        return [json.loads(line)["detail_id"] for line in lines]
+    return [row["detail_id"] for row in repository.load_event_rows(output_file)]
+
+
+@pytest.mark.parametrize("extension", [".csv", ".jsonl"])
+def test_news_writer_appends_to_an_existing_file(tmp_path, extension):
+    repository = CsvRepository()
+    output_file = tmp_path / f"news{extension}"
+
+    with repository.open_news_item_writer(output_file) as writer:
+        writer.write(_news_item(1))
+    with repository.open_news_item_writer(output_file, append=True) as writer:
+        writer.write(_news_item(2))
+
+    assert _read_news(repository, output_file) == ["1", "2"]
+
+
+@pytest.mark.parametrize("extension", [".csv", ".jsonl"])
+def test_news_writer_starts_a_fresh_file_when_there_is_nothing_to_resume(tmp_path, extension):
+    repository = CsvRepository()
+    output_file = tmp_path / "output" / f"news{extension}"
+
+    with repository.open_news_item_writer(output_file, append=True) as writer:
+        writer.write(_news_item(1))
+
+    assert _read_news(repository, output_file) == ["1"]
+
+
+@pytest.mark.parametrize("extension", [".csv", ".jsonl"])
+def test_news_writer_drops_a_row_cut_off_by_an_interrupted_run(tmp_path, extension):
+    repository = CsvRepository()
+    output_file = tmp_path / f"news{extension}"
+
+    with repository.open_news_item_writer(output_file) as writer:
+        writer.write(_news_item(1))
+    with output_file.open("a", encoding="utf-8") as file_handle:
+        file_handle.write('{"detail_id": "2", "tit' if extension == ".jsonl" else "2,Headl")
+    with repository.open_news_item_writer(output_file, append=True) as writer:
+        writer.write(_news_item(3))
+
+    assert _read_news(repository, output_file) == ["1", "3"]
+
+
+def test_news_writer_overwrites_without_append(tmp_path):
+    repository = CsvRepository()
+    output_file = tmp_path / "news.jsonl"
+    output_file.write_text('{"detail_id": "0"}\n', encoding="utf-8")
+
+    with repository.open_news_item_writer(output_file) as writer:
+        writer.write(_news_item(1))
+
+    assert _read_news(repository, output_file) == ["1"]
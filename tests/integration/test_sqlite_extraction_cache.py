@@ -0,0 +1,51 @@
+import sqlite3
+from contextlib import closing
+
+from forexcalendar_scraper.infrastructure.persistence.sqlite_extraction_cache import (
+    SqliteExtractionCache,
+)
+
+
+def test_sqlite_extraction_cache_persists_entries_until_they_expire(tmp_path):
+    now = [1_000.0]
+    cache_file = tmp_path / "cache" / "extraction_cache.sqlite3"
+    cache = SqliteExtractionCache(cache_file, clock=lambda: now[0])
+    cache.set("details:day=oct6.2025:12345", '{"source": "BLS"}', ttl_seconds=60)
+    cache.close()
+
+    reopened = SqliteExtractionCache(cache_file, clock=lambda: now[0])
+    assert reopened.get("details:day=oct6.2025:12345") == '{"source": "BLS"}'
+
+    now[0] += 61
+    assert reopened.get("details:day=oct6.2025:12345") is None
+    assert reopened.get("details:day=oct6.2025:missing") is None
+
+
+def test_sqlite_extraction_cache_opens_the_database_on_first_use(tmp_path):
+    cache_file = tmp_path / "cache" / "extraction_cache.sqlite3"
+    cache = SqliteExtractionCache(cache_file)
+    assert not cache_file.parent.exists()
+
+    cache.set("history:12345", "[]", ttl_seconds=60)
+    cache.close()
+    assert cache.get("history:12345") == "[]"
+    cache.close()
+
+
+def test_sqlite_extraction_cache_purges_expired_entries_on_open(tmp_path):
+    now = [1_000.0]
+    cache_file = tmp_path / "extraction_cache.sqlite3"
+    cache = SqliteExtractionCache(cache_file, clock=lambda: now[0])
+    cache.set("details-csv:old", "{}", ttl_seconds=60)
+    cache.set("details-csv:fresh", "{}", ttl_seconds=600)
+    cache.close()
+
+    now[0] += 61
+    with closing(sqlite3.connect(cache_file)) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM cache_entries").fetchone() == (2,)
+    assert cache.get("details-csv:fresh") == "{}"
+    with closing(sqlite3.connect(cache_file)) as connection:
+        keys = connection.execute("SELECT key FROM cache_entries").fetchall()
+    cache.close()
+
+    assert keys == [("details-csv:fresh",)]
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
 import logging
+import sys
+import threading
+from contextlib import contextmanager
 
+import pytest
 from forexcalendar_scraper.application.calendar_scraper_service import CalendarScraperService
 from forexcalendar_scraper.core.config import Settings
+from forexcalendar_scraper.core.exceptions import OptionalDependencyError
 from forexcalendar_scraper.core.paths import PathService
 from forexcalendar_scraper.domain.entities import CalendarEvent
 from forexcalendar_scraper.infrastructure.persistence.csv_repository import CsvRepository
 
 
 class StubCalendarGateway:
+    def __init__(self) -> None:
+        self.session_threads: list[int] = []
+
+    @contextmanager
+    def open_session(self, logger: logging.Logger, purpose: str):
+        self.session_threads.append(threading.get_ident())
+        yield
+
     def scrape_calendar(self, date_param: str, logger: logging.Logger) -> list[CalendarEvent]:
         return [
             CalendarEvent(
@@ -21,7 +34,7 @@ class StubCalendarGateway:
                 actual="0.3%",
                 forecast="0.2%",
                 previous="0.2%",
-                detail_id="12345",
+                detail_id=f"12345-{date_param}",
             )
         ]
 
@@ -73,7 +86,87 @@ def test_calendar_scraper_service_writes_events(tmp_path):
     assert result.processed_events == 1
     assert result.written_counts == {"events": 1}
     assert rows[0]["event"] == "CPI m/m"
-    assert rows[0]["detail"] == "12345"
+    assert rows[0]["detail"] == "12345-day=oct6.2025"
     assert event_store.calls[0][0] == "events"
     assert event_store.calls[0][1] == "day=oct6.2025"
-    assert event_store.calls[0][2][0].name == "CPI m/m"
\ No newline at end of file
+    assert event_store.calls[0][2][0].name == "CPI m/m"
+
+
+def test_calendar_scraper_service_scrapes_many_dates_with_shared_sessions(tmp_path):
+    path_service = PathService.from_root(tmp_path)
+    repository = CsvRepository()
+    gateway = StubCalendarGateway()
+    logger = _build_test_logger("test.calendar_scraper.many")
+    date_params = [f"day=oct{day}.2025" for day in range(6, 11)]
+
+    service = CalendarScraperService(
+        settings=Settings(max_concurrency=2),
+        path_service=path_service,
+        csv_repository=repository,
+        calendar_gateway=gateway,
+        logger_factory=lambda *args, **kwargs: logger,
+    )
+
+    results = service.run_many(date_params)
+
+    assert [
+        repository.load_event_rows(result.output_files["events"])[0]["detail"]
+        for result in results
+    ] == [f"12345-{date_param}" for date_param in date_params]
+    assert len(gateway.session_threads) == 2
+
+
+class FailingDateCalendarGateway(StubCalendarGateway):
+    def scrape_calendar(self, date_param: str, logger: logging.Logger) -> list[CalendarEvent]:
+        if date_param == "day=oct7.2025":
+            raise TimeoutError("calendar table never rendered")
+        return super().scrape_calendar(date_param, logger)
+
+
+def test_calendar_scraper_service_keeps_scraping_after_a_date_fails(tmp_path):
+    logger = _build_test_logger("test.calendar_scraper.failure")
+    date_params = ["day=oct6.2025", "day=oct7.2025", "day=oct8.2025"]
+
+    service = CalendarScraperService(
+        settings=Settings(),
+        path_service=PathService.from_root(tmp_path),
+        csv_repository=CsvRepository(),
+        calendar_gateway=FailingDateCalendarGateway(),
+        logger_factory=lambda *args, **kwargs: logger,
+    )
+
+    results = service.run_many(date_params)
+
+    assert [result.failed_events for result in results] == [0, 1, 0]
+    assert [result.written_counts.get("events", 0) for result in results] == [1, 0, 1]
+
+
+def _build_parquet_service(tmp_path, name: str) -> CalendarScraperService:
+    logger = _build_test_logger(name)
+    return CalendarScraperService(
+        settings=Settings(events_output_format="parquet"),
+        path_service=PathService.from_root(tmp_path),
+        csv_repository=CsvRepository(),
+        calendar_gateway=StubCalendarGateway(),
+        logger_factory=lambda *args, **kwargs: logger,
+    )
+
+
+def test_calendar_scraper_service_writes_parquet_events(tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    service = _build_parquet_service(tmp_path, "test.calendar_scraper.parquet")
+
+    result = service.run("day=oct6.2025")
+
+    table = parquet.read_table(result.output_files["events"])
+    assert result.output_files["events"].suffix == ".parquet"
+    assert table.column("event").to_pylist() == ["CPI m/m"]
+    assert table.column("detail").to_pylist() == ["12345-day=oct6.2025"]
+
+
+def test_calendar_scraper_service_requires_pyarrow_for_parquet(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    service = _build_parquet_service(tmp_path, "test.calendar_scraper.parquet_missing")
+
+    with pytest.raises(OptionalDependencyError):
+        service.run("day=oct6.2025")
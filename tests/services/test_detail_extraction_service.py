@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import logging
+from contextlib import nullcontext
 
 from forexcalendar_scraper.application.detail_extraction_service import DetailExtractionService
 from forexcalendar_scraper.core.config import Settings
+from forexcalendar_scraper.core.exceptions import DetailUnavailableError
 from forexcalendar_scraper.core.paths import PathService
 from forexcalendar_scraper.domain.entities import CalendarEvent, DetailBlock
 from forexcalendar_scraper.infrastructure.persistence.csv_repository import CsvRepository
 
 
 class StubDetailGateway:
+    def open_session(self, logger: logging.Logger, purpose: str) -> nullcontext[None]:
+        return nullcontext()
+
     def extract_detail_block(
         self,
         event: CalendarEvent,
@@ -75,7 +80,7 @@ def test_detail_extraction_service_writes_vertical_blocks(tmp_path):
     )
 
     service = DetailExtractionService(
-        settings=Settings(request_delay_seconds=0.0, batch_delay_seconds=0.0),
+        settings=Settings(),
         path_service=path_service,
         csv_repository=repository,
         calendar_gateway=StubDetailGateway(),
@@ -94,4 +99,144 @@ def test_detail_extraction_service_writes_vertical_blocks(tmp_path):
     assert detail_blocks["1"]["description"] == "Moderated discussion"
     assert detail_blocks["1"]["speaker"] == "Alberto Musalem"
     assert event_store.detail_results[0][0].detail_id == "12345"
-    assert event_store.detail_results[0][1].fields["speaker"] == "Alberto Musalem"
\ No newline at end of file
+    assert event_store.detail_results[0][1].fields["speaker"] == "Alberto Musalem"
+
+
+def test_detail_extraction_service_keeps_rows_for_repeated_detail_ids(tmp_path):
+    path_service = PathService.from_root(tmp_path)
+    repository = CsvRepository()
+    logger = _build_test_logger("test.detail_extractor.repeats")
+    gateway = CountingDetailGateway()
+    event_store = StubEventStore()
+
+    repository.save_events(
+        path_service.build_output_file_path("day=oct6.2025"),
+        [
+            CalendarEvent(date="Mon Oct 6", currency="USD", name="CPI m/m", detail_id="12345"),
+            CalendarEvent(date="Tue Oct 7", currency="USD", name="CPI m/m", detail_id="12345"),
+        ],
+    )
+
+    service = DetailExtractionService(
+        settings=Settings(),
+        path_service=path_service,
+        csv_repository=repository,
+        calendar_gateway=gateway,
+        logger_factory=lambda *args, **kwargs: logger,
+        event_store=event_store,
+    )
+
+    result = service.run(date_param="day=oct6.2025")
+
+    detail_blocks = repository.load_detail_blocks(result.output_files["details"])
+    assert gateway.calls == 1
+    assert result.written_counts == {"details": 2}
+    assert [block["event_date"] for block in detail_blocks.values()] == ["Mon Oct 6", "Tue Oct 7"]
+    assert [block.event_date for _, block in event_store.detail_results] == [
+        "Mon Oct 6",
+        "Tue Oct 7",
+    ]
+
+
+class DictExtractionCache:
+    def __init__(self) -> None:
+        self.entries: dict[str, str] = {}
+        self.closed = False
+
+    def get(self, key: str) -> str | None:
+        return self.entries.get(key)
+
+    def set(self, key: str, payload: str, ttl_seconds: float) -> None:
+        self.entries[key] = payload
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class CountingDetailGateway(StubDetailGateway):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def extract_detail_block(
+        self,
+        event: CalendarEvent,
+        date_param: str,
+        logger: logging.Logger,
+    ) -> DetailBlock | None:
+        self.calls += 1
+        return super().extract_detail_block(event, date_param, logger)
+
+
+def test_detail_extraction_service_reuses_cached_results_on_rerun(tmp_path):
+    path_service = PathService.from_root(tmp_path)
+    repository = CsvRepository()
+    logger = _build_test_logger("test.detail_extractor.cache")
+    gateway = CountingDetailGateway()
+    cache = DictExtractionCache()
+
+    input_file = path_service.build_output_file_path("day=oct6.2025")
+    repository.save_events(
+        input_file,
+        [
+            CalendarEvent(date="Mon Oct 6", name="CPI m/m", detail_id="12345"),
+            CalendarEvent(date="Mon Oct 6", name="Unknown", detail_id="99999"),
+        ],
+    )
+
+    service = DetailExtractionService(
+        settings=Settings(),
+        path_service=path_service,
+        csv_repository=repository,
+        calendar_gateway=gateway,
+        logger_factory=lambda *args, **kwargs: logger,
+        extraction_cache=cache,
+    )
+
+    first_result = service.run(date_param="day=oct6.2025")
+    second_result = service.run(date_param="day=oct6.2025")
+
+    assert gateway.calls == 2
+    assert cache.entries["details:day=oct6.2025:99999"] == "null"
+    assert second_result.processed_events == first_result.processed_events == 1
+    assert second_result.failed_events == 1
+    assert cache.closed
+
+
+class TimingOutDetailGateway(StubDetailGateway):
+    def extract_detail_block(
+        self,
+        event: CalendarEvent,
+        date_param: str,
+        logger: logging.Logger,
+    ) -> DetailBlock | None:
+        if event.detail_id == "99999":
+            raise DetailUnavailableError("Detail overlay did not render for detail_id=99999")
+        return super().extract_detail_block(event, date_param, logger)
+
+
+def test_detail_extraction_service_does_not_cache_overlays_that_failed_to_load(tmp_path):
+    path_service = PathService.from_root(tmp_path)
+    repository = CsvRepository()
+    cache = DictExtractionCache()
+
+    repository.save_events(
+        path_service.build_output_file_path("day=oct6.2025"),
+        [
+            CalendarEvent(date="Mon Oct 6", name="CPI m/m", detail_id="12345"),
+            CalendarEvent(date="Mon Oct 6", name="Retail Sales m/m", detail_id="99999"),
+        ],
+    )
+
+    service = DetailExtractionService(
+        settings=Settings(),
+        path_service=path_service,
+        csv_repository=repository,
+        calendar_gateway=TimingOutDetailGateway(),
+        logger_factory=lambda *args, **kwargs: _build_test_logger("test.detail_extractor.timeout"),
+        extraction_cache=cache,
+    )
+
+    result = service.run(date_param="day=oct6.2025")
+
+    assert (result.processed_events, result.failed_events) == (1, 1)
+    assert list(cache.entries) == ["details:day=oct6.2025:12345"]
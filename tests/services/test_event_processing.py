@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+
+from forexcalendar_scraper.application import event_processing
+from forexcalendar_scraper.application.event_processing import EventBatchProcessor
+from forexcalendar_scraper.application.extraction_cache import with_extraction_cache
+from forexcalendar_scraper.core.config import Settings
+from forexcalendar_scraper.core.exceptions import DetailUnavailableError, RateLimitedError
+from forexcalendar_scraper.domain.entities import CalendarEvent
+
+
+def _build_test_logger(name: str) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.handlers.clear()
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    return logger
+
+
+def test_process_runs_concurrent_workers_and_preserves_event_order():
+    events = [CalendarEvent(name=f"Event {index}", detail_id=str(index)) for index in range(1, 9)]
+    events.append(CalendarEvent(name="No detail"))
+    sessions: list[int] = []
+    emitted: list[str] = []
+
+    @contextmanager
+    def session_factory():
+        sessions.append(threading.get_ident())
+        yield
+
+    processor = EventBatchProcessor[str](
+        Settings(max_concurrency=3),
+        _build_test_logger("test.event_processing"),
+    )
+    results, summary = processor.process(
+        events,
+        lambda event: None if event.detail_id == "4" else f"payload-{event.detail_id}",
+        "Processed %s events so far",
+        session_factory=session_factory,
+        on_result=lambda event, payload: emitted.append((payload, threading.get_ident())),
+    )
+
+    assert [payload for _, payload in results] == [
+        f"payload-{index}" for index in (1, 2, 3, 5, 6, 7, 8)
+    ]
+    assert emitted == [(payload, threading.get_ident()) for _, payload in results]
+    assert (summary.processed_events, summary.failed_events, summary.skipped_events) == (7, 1, 1)
+    assert len(sessions) == 3
+
+
+def test_process_drops_emitted_results_when_not_kept():
+    events = [CalendarEvent(name=f"Event {index}", detail_id=str(index)) for index in range(1, 6)]
+    emitted: list[str] = []
+
+    processor = EventBatchProcessor[str](
+        Settings(max_concurrency=2),
+        _build_test_logger("test.event_processing.streaming"),
+    )
+    results, summary = processor.process(
+        events,
+        lambda event: f"payload-{event.detail_id}",
+        "Processed %s events so far",
+        on_result=lambda event, payload: emitted.append(payload),
+        keep_results=False,
+    )
+
+    assert results == []
+    assert emitted == [f"payload-{index}" for index in range(1, 6)]
+    assert summary.processed_events == 5
+
+
+def test_process_drops_missing_and_duplicate_detail_ids_before_extraction():
+    events = [
+        CalendarEvent(name="CPI", detail_id="1"),
+        CalendarEvent(name="No detail"),
+        CalendarEvent(name="GDP", detail_id="2"),
+        CalendarEvent(name="CPI again", detail_id="1"),
+    ]
+    extracted: list[str] = []
+
+    processor = EventBatchProcessor[str](
+        Settings(),
+        _build_test_logger("test.event_processing.dedupe"),
+    )
+    results, summary = processor.process(
+        events,
+        lambda event: extracted.append(event.name) or event.name,
+        "Processed %s events so far",
+    )
+
+    assert extracted == ["CPI", "GDP"]
+    assert [payload for _, payload in results] == ["CPI", "GDP"]
+    assert (summary.processed_events, summary.skipped_events) == (2, 2)
+
+
+
+def test_process_skips_the_session_when_no_event_has_a_detail_id():
+    sessions: list[str] = []
+
+    @contextmanager
+    def session_factory():
+        sessions.append("opened")
+        yield
+
+    processor = EventBatchProcessor[str](
+        Settings(),
+        _build_test_logger("test.event_processing.empty"),
+    )
+    results, summary = processor.process(
+        [CalendarEvent(name="No detail"), CalendarEvent(name="Holiday")],
+        lambda event: event.name,
+        "Processed %s events so far",
+        session_factory=session_factory,
+    )
+
+    assert results == []
+    assert summary.skipped_events == 2
+    assert sessions == []
+
+def test_process_shares_results_with_events_repeating_a_detail_id():
+    events = [
+        CalendarEvent(name="CPI", currency="USD", detail_id="1"),
+        CalendarEvent(name="GDP", detail_id="2"),
+        CalendarEvent(name="CPI", currency="CAD", detail_id="1"),
+    ]
+    extracted: list[str] = []
+    emitted: list[str] = []
+
+    processor = EventBatchProcessor[str](
+        Settings(),
+        _build_test_logger("test.event_processing.share"),
+    )
+    results, summary = processor.process(
+        events,
+        lambda event: extracted.append(event.detail_id) or f"payload-{event.detail_id}",
+        "Processed %s events so far",
+        on_result=lambda event, payload: emitted.append(payload),
+        share_result=lambda event, payload: f"{payload}-{event.currency}",
+    )
+
+    assert extracted == ["1", "2"]
+    assert emitted == ["payload-1", "payload-1-CAD", "payload-2"]
+    assert [event.currency for event, _ in results] == ["USD", "CAD", ""]
+    assert (summary.processed_events, summary.skipped_events) == (3, 0)
+
+
+def test_process_backs_off_when_throttled_and_recovers_on_success(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(event_processing.time, "sleep", sleeps.append)
+    events = [CalendarEvent(name=f"Event {index}", detail_id=str(index)) for index in range(1, 6)]
+
+    def extractor(event: CalendarEvent) -> str:
+        if event.detail_id in {"1", "2"}:
+            raise RateLimitedError("HTTP 429")
+        return event.name
+
+    processor = EventBatchProcessor[str](
+        Settings(min_delay_seconds=0.0, max_delay_seconds=1.5),
+        _build_test_logger("test.event_processing.backoff"),
+    )
+    results, summary = processor.process(events, extractor, "Processed %s events so far")
+
+    assert sleeps == [1.0, 1.5, 0.75, 0.375]
+    assert [payload for _, payload in results] == ["Event 3", "Event 4", "Event 5"]
+    assert (summary.processed_events, summary.failed_events) == (3, 2)
+
+
+def test_process_backs_off_after_consecutive_empty_results(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(event_processing.time, "sleep", sleeps.append)
+    events = [CalendarEvent(name=f"Event {index}", detail_id=str(index)) for index in range(1, 6)]
+
+    processor = EventBatchProcessor[str](
+        Settings(failure_backoff_threshold=2),
+        _build_test_logger("test.event_processing.failures"),
+    )
+    processor.process(
+        events,
+        lambda event: event.name if event.detail_id == "4" else None,
+        "Processed %s events so far",
+        empty_results_are_misses=True,
+    )
+
+    assert sleeps == [1.0, 2.0, 1.0]
+
+
+def test_process_does_not_back_off_on_legitimately_empty_results(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(event_processing.time, "sleep", sleeps.append)
+    events = [CalendarEvent(name=f"Event {index}", detail_id=str(index)) for index in range(1, 6)]
+
+    processor = EventBatchProcessor[list[str]](
+        Settings(failure_backoff_threshold=2),
+        _build_test_logger("test.event_processing.empty"),
+    )
+    _, summary = processor.process(events, lambda event: [], "Processed %s events so far")
+
+    assert sleeps == []
+    assert summary.failed_events == 5
+
+
+def test_process_backs_off_after_consecutive_overlays_fail_to_load(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(event_processing.time, "sleep", sleeps.append)
+    events = [CalendarEvent(name=f"Event {index}", detail_id=str(index)) for index in range(1, 5)]
+
+    def extractor(event: CalendarEvent) -> str:
+        raise DetailUnavailableError(f"overlay for {event.detail_id} did not render")
+
+    processor = EventBatchProcessor[str](
+        Settings(failure_backoff_threshold=2),
+        _build_test_logger("test.event_processing.unavailable"),
+    )
+    processor.process(events, extractor, "Processed %s events so far")
+
+    assert sleeps == [1.0, 2.0]
+
+
+
+class DictExtractionCache:
+    def __init__(self, entries: dict[str, str]) -> None:
+        self.entries = dict(entries)
+
+    def get(self, key: str) -> str | None:
+        return self.entries.get(key)
+
+    def set(self, key: str, payload: str, ttl_seconds: float) -> None:
+        self.entries[key] = payload
+
+    def close(self) -> None:
+        return None
+
+
+def test_process_serves_cached_misses_without_pacing_or_backoff(monkeypatch):
+    clock = [100.0]
+    sleeps: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(event_processing.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(event_processing.time, "sleep", sleep)
+    events = [CalendarEvent(name=f"Event {index}", detail_id=str(index)) for index in range(1, 7)]
+    settings = Settings(
+        min_delay_seconds=0.5,
+        failure_backoff_threshold=2,
+        max_requests_per_minute=1,
+    )
+    logger = _build_test_logger("test.event_processing.cache_hits")
+    extracted: list[str] = []
+
+    def extractor(event: CalendarEvent) -> str | None:
+        extracted.append(event.detail_id)
+        return None
+
+    processor = EventBatchProcessor[str](settings, logger)
+    results, summary = processor.process(
+        events,
+        with_extraction_cache(
+            extractor,
+            DictExtractionCache({f"test:{event.detail_id}": "" for event in events}),
+            settings,
+            logger,
+            key_builder=lambda event: f"test:{event.detail_id}",
+            encode=lambda payload: payload or "",
+            decode=lambda event, payload: payload or None,
+        ),
+        "Processed %s events so far",
+    )
+
+    assert extracted == []
+    assert sleeps == []
+    assert processor._delay.current == 0.5
+    assert (results, summary.failed_events) == ([], 6)
+
+
+def test_process_skips_the_delay_once_the_queue_has_drained(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(event_processing.time, "sleep", sleeps.append)
+    both_started = threading.Barrier(2, timeout=5)
+
+    def extractor(event: CalendarEvent) -> str:
+        both_started.wait()
+        return event.name
+
+    processor = EventBatchProcessor[str](
+        Settings(max_concurrency=2, min_delay_seconds=1.0),
+        _build_test_logger("test.event_processing.drained"),
+    )
+    results, _ = processor.process(
+        [CalendarEvent(name=f"Event {index}", detail_id=str(index)) for index in (1, 2)],
+        extractor,
+        "Processed %s events so far",
+    )
+
+    assert len(results) == 2
+    assert sleeps == []
+
+def test_process_spaces_event_starts_with_the_shared_rate_limit(monkeypatch):
+    clock = [100.0]
+    sleeps: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(event_processing.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(event_processing.time, "sleep", sleep)
+    events = [CalendarEvent(name=f"Event {index}", detail_id=str(index)) for index in range(1, 4)]
+
+    processor = EventBatchProcessor[str](
+        Settings(max_requests_per_minute=30),
+        _build_test_logger("test.event_processing.rate_limit"),
+    )
+    results, _ = processor.process(events, lambda event: event.name, "Processed %s events so far")
+
+    assert sleeps == [2.0, 2.0]
+    assert len(results) == 3
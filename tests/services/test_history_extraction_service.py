@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+
+from forexcalendar_scraper.application.history_extraction_service import HistoryExtractionService
+from forexcalendar_scraper.core.config import Settings
+from forexcalendar_scraper.core.paths import PathService
+from forexcalendar_scraper.domain.entities import CalendarEvent, HistoryRecord
+from forexcalendar_scraper.infrastructure.persistence.csv_repository import CsvRepository
+
+
+class StubHistoryGateway:
+    def __init__(self) -> None:
+        self.session_threads: list[int] = []
+        self.extracted_ids: list[str] = []
+
+    @contextmanager
+    def open_session(self, logger: logging.Logger, purpose: str):
+        self.session_threads.append(threading.get_ident())
+        yield
+
+    def extract_history_records(
+        self,
+        event: CalendarEvent,
+        date_param: str,
+        logger: logging.Logger,
+    ) -> list[HistoryRecord] | None:
+        self.extracted_ids.append(event.detail_id)
+        return [
+            HistoryRecord(
+                detail_id=event.detail_id,
+                date=f"Sep {event.detail_id}",
+                actual="0.2%",
+                event_name=event.name,
+            )
+        ]
+
+
+class DictExtractionCache:
+    def __init__(self) -> None:
+        self.entries: dict[str, str] = {}
+        self.closed = False
+
+    def get(self, key: str) -> str | None:
+        return self.entries.get(key)
+
+    def set(self, key: str, payload: str, ttl_seconds: float) -> None:
+        self.entries[key] = payload
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _build_test_logger(name: str) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.handlers.clear()
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    return logger
+
+
+def test_history_extraction_service_runs_workers_with_their_own_sessions(tmp_path):
+    path_service = PathService.from_root(tmp_path)
+    repository = CsvRepository()
+    gateway = StubHistoryGateway()
+    logger = _build_test_logger("test.history_extractor")
+
+    input_file = path_service.build_output_file_path("day=oct6.2025")
+    repository.save_events(
+        input_file,
+        [
+            CalendarEvent(date="Mon Oct 6", name=f"Event {index}", detail_id=str(index))
+            for index in range(1, 7)
+        ],
+    )
+
+    service = HistoryExtractionService(
+        settings=Settings(max_concurrency=3),
+        path_service=path_service,
+        csv_repository=repository,
+        calendar_gateway=gateway,
+        logger_factory=lambda *args, **kwargs: logger,
+    )
+
+    result = service.run(date_param="day=oct6.2025")
+
+    history_rows = repository.load_event_rows(result.output_files["history"])
+    assert result.processed_events == 6
+    assert [row["detail_id"] for row in history_rows] == [str(index) for index in range(1, 7)]
+    assert len(gateway.session_threads) == 3
+
+
+def test_history_extraction_service_reuses_cached_history_across_days(tmp_path):
+    path_service = PathService.from_root(tmp_path)
+    repository = CsvRepository()
+    gateway = StubHistoryGateway()
+    cache = DictExtractionCache()
+    logger = _build_test_logger("test.history_extractor.cache")
+
+    days = (("day=oct6.2025", "CPI m/m"), ("day=nov6.2025", "CPI m/m rerun"))
+    for date_param, event_name in days:
+        repository.save_events(
+            path_service.build_output_file_path(date_param),
+            [CalendarEvent(date=date_param, name=event_name, detail_id="12345")],
+        )
+
+    service = HistoryExtractionService(
+        settings=Settings(),
+        path_service=path_service,
+        csv_repository=repository,
+        calendar_gateway=gateway,
+        logger_factory=lambda *args, **kwargs: logger,
+        extraction_cache=cache,
+    )
+
+    service.run(date_param="day=oct6.2025")
+    result = service.run(date_param="day=nov6.2025")
+
+    history_rows = repository.load_event_rows(result.output_files["history"])
+    assert gateway.extracted_ids == ["12345"]
+    assert history_rows[0]["event_name"] == "CPI m/m rerun"
+    assert history_rows[0]["date"] == "Sep 12345"
+    assert cache.closed
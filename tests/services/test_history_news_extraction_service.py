@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from contextlib import contextmanager
 
 from forexcalendar_scraper.application.history_news_extraction_service import (
     HistoryNewsExtractionService,
@@ -17,12 +18,22 @@ from forexcalendar_scraper.infrastructure.persistence.csv_repository import CsvR
 
 
 class StubHistoryNewsGateway:
+    def __init__(self) -> None:
+        self.session_purposes: list[str] = []
+        self.extracted_ids: list[str] = []
+
+    @contextmanager
+    def open_session(self, logger: logging.Logger, purpose: str):
+        self.session_purposes.append(purpose)
+        yield
+
     def extract_history_news_bundle(
         self,
         event: CalendarEvent,
         date_param: str,
         logger: logging.Logger,
     ) -> HistoryNewsBundle | None:
+        self.extracted_ids.append(event.detail_id)
         if event.detail_id != "12345":
             return None
 
@@ -89,6 +100,7 @@ def test_history_news_extraction_service_writes_both_outputs(tmp_path):
     repository = CsvRepository()
     logger = _build_test_logger("test.history_news_extractor")
     event_store = StubEventStore()
+    gateway = StubHistoryNewsGateway()
 
     input_file = path_service.build_output_file_path("day=oct6.2025")
     repository.save_events(
@@ -105,10 +117,10 @@ def test_history_news_extraction_service_writes_both_outputs(tmp_path):
     )
 
     service = HistoryNewsExtractionService(
-        settings=Settings(request_delay_seconds=0.0, batch_delay_seconds=0.0),
+        settings=Settings(),
         path_service=path_service,
         csv_repository=repository,
-        calendar_gateway=StubHistoryNewsGateway(),
+        calendar_gateway=gateway,
         logger_factory=lambda *args, **kwargs: logger,
         event_store=event_store,
     )
@@ -132,4 +144,41 @@ def test_history_news_extraction_service_writes_both_outputs(tmp_path):
     assert news_rows[0]["event_currency"] == "USD"
     assert event_store.history_results[0][0].detail_id == "12345"
     assert event_store.history_results[0][1][0].actual == "0.2%"
-    assert event_store.news_results[0][1][0].title == "Inflation update"
\ No newline at end of file
+    assert event_store.news_results[0][1][0].title == "Inflation update"
+    assert gateway.session_purposes == ["history and news extraction"]
+
+
+def test_history_news_extraction_service_resumes_from_existing_outputs(tmp_path):
+    path_service = PathService.from_root(tmp_path)
+    repository = CsvRepository()
+    logger = _build_test_logger("test.history_news_extractor.resume")
+    gateway = StubHistoryNewsGateway()
+
+    input_file = path_service.build_output_file_path("day=oct6.2025")
+    repository.save_events(
+        input_file,
+        [
+            CalendarEvent(date="Mon Oct 6", name="CPI m/m", detail_id="12345"),
+            CalendarEvent(date="Mon Oct 6", name="PPI m/m", detail_id="67890"),
+        ],
+    )
+
+    service = HistoryNewsExtractionService(
+        settings=Settings(),
+        path_service=path_service,
+        csv_repository=repository,
+        calendar_gateway=gateway,
+        logger_factory=lambda *args, **kwargs: logger,
+    )
+
+    service.run(date_param="day=oct6.2025")
+    result = service.run(date_param="day=oct6.2025", resume=True)
+
+    history_file = path_service.build_output_file_path(
+        "day=oct6.2025",
+        "_history",
+        create_dir=False,
+    )
+    assert gateway.extracted_ids == ["12345", "67890", "67890"]
+    assert result.skipped_events == 1
+    assert [row["detail_id"] for row in repository.load_event_rows(history_file)] == ["12345"]
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import json
+import logging
+from contextlib import contextmanager
+
+from forexcalendar_scraper.application.news_extraction_service import NewsExtractionService
+from forexcalendar_scraper.core.config import Settings
+from forexcalendar_scraper.core.paths import PathService
+from forexcalendar_scraper.domain.entities import CalendarEvent, NewsItem
+from forexcalendar_scraper.infrastructure.persistence.csv_repository import CsvRepository
+
+
+class StubNewsGateway:
+    def __init__(self) -> None:
+        self.session_purposes: list[str] = []
+        self.extracted_ids: list[str] = []
+
+    @contextmanager
+    def open_session(self, logger: logging.Logger, purpose: str):
+        self.session_purposes.append(purpose)
+        yield
+
+    def extract_news_items(
+        self,
+        event: CalendarEvent,
+        date_param: str,
+        logger: logging.Logger,
+    ) -> list[NewsItem] | None:
+        self.extracted_ids.append(event.detail_id)
+        return [
+            NewsItem(
+                detail_id=event.detail_id,
+                title=f"Headline for {event.name}",
+                url=f"https://www.forexfactory.com/news/{event.detail_id}",
+                event_name=event.name,
+            )
+        ]
+
+
+def _build_test_logger(name: str) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.handlers.clear()
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    return logger
+
+
+def test_news_extraction_service_reuses_one_session_for_all_events(tmp_path):
+    path_service = PathService.from_root(tmp_path)
+    repository = CsvRepository()
+    gateway = StubNewsGateway()
+    logger = _build_test_logger("test.news_extractor")
+
+    input_file = path_service.build_output_file_path("day=oct6.2025")
+    repository.save_events(
+        input_file,
+        [
+            CalendarEvent(date="Mon Oct 6", name=f"Event {index}", detail_id=str(index))
+            for index in range(1, 4)
+        ],
+    )
+
+    service = NewsExtractionService(
+        settings=Settings(),
+        path_service=path_service,
+        csv_repository=repository,
+        calendar_gateway=gateway,
+        logger_factory=lambda *args, **kwargs: logger,
+    )
+
+    result = service.run(date_param="day=oct6.2025")
+
+    news_rows = repository.load_event_rows(result.output_files["news"])
+    assert gateway.session_purposes == ["news extraction"]
+    assert gateway.extracted_ids == ["1", "2", "3"]
+    assert [row["title"] for row in news_rows] == [f"Headline for Event {i}" for i in range(1, 4)]
+
+
+def test_news_extraction_service_spreads_events_over_concurrent_workers(tmp_path):
+    path_service = PathService.from_root(tmp_path)
+    repository = CsvRepository()
+    gateway = StubNewsGateway()
+    logger = _build_test_logger("test.news_extractor.workers")
+
+    repository.save_events(
+        path_service.build_output_file_path("day=oct6.2025"),
+        [
+            CalendarEvent(date="Mon Oct 6", name=f"Event {index}", detail_id=str(index))
+            for index in range(1, 9)
+        ],
+    )
+
+    service = NewsExtractionService(
+        settings=Settings(max_concurrency=4),
+        path_service=path_service,
+        csv_repository=repository,
+        calendar_gateway=gateway,
+        logger_factory=lambda *args, **kwargs: logger,
+    )
+
+    result = service.run(date_param="day=oct6.2025")
+
+    news_rows = repository.load_event_rows(result.output_files["news"])
+    assert len(gateway.session_purposes) == 4
+    assert [row["detail_id"] for row in news_rows] == [str(index) for index in range(1, 9)]
+
+
+def test_news_extraction_service_writes_json_lines_when_configured(tmp_path):
+    path_service = PathService.from_root(tmp_path)
+    repository = CsvRepository()
+    gateway = StubNewsGateway()
+    logger = _build_test_logger("test.news_extractor.jsonl")
+
+    repository.save_events(
+        path_service.build_output_file_path("day=oct6.2025"),
+        [CalendarEvent(date="Mon Oct 6", name="CPI m/m", currency="USD", detail_id="7")],
+    )
+
+    service = NewsExtractionService(
+        settings=Settings(news_output_format="jsonl"),
+        path_service=path_service,
+        csv_repository=repository,
+        calendar_gateway=gateway,
+        logger_factory=lambda *args, **kwargs: logger,
+    )
+
+    result = service.run(date_param="day=oct6.2025")
+
+    output_file = result.output_files["news"]
+    lines = output_file.read_text(encoding="utf-8").splitlines()
+    assert output_file.suffix == ".jsonl"
+    assert [json.loads(line) for line in lines] == [
+        {
+            "detail_id": "7",
+            "event_name": "CPI m/m",
+            "event_date": "",
+            "event_currency": "",
+            "title": "Headline for CPI m/m",
+            "url": "https://www.forexfactory.com/news/7",
+            "snippet": "",
+            "link_type": "related",
+        }
+    ]
+
+
+def test_news_extraction_service_shares_news_with_repeated_detail_ids(tmp_path):
+    path_service = PathService.from_root(tmp_path)
+    repository = CsvRepository()
+    gateway = StubNewsGateway()
+    logger = _build_test_logger("test.news_extractor.repeats")
+
+    repository.save_events(
+        path_service.build_output_file_path("day=oct6.2025"),
+        [
+            CalendarEvent(date="Mon Oct 6", name="CPI m/m", currency="USD", detail_id="7"),
+            CalendarEvent(date="Tue Oct 7", name="CPI m/m", currency="USD", detail_id="7"),
+        ],
+    )
+
+    service = NewsExtractionService(
+        settings=Settings(),
+        path_service=path_service,
+        csv_repository=repository,
+        calendar_gateway=gateway,
+        logger_factory=lambda *args, **kwargs: logger,
+    )
+
+    result = service.run(date_param="day=oct6.2025")
+
+    news_rows = repository.load_event_rows(result.output_files["news"])
+    assert gateway.extracted_ids == ["7"]
+    assert [row["detail_id"] for row in news_rows] == ["7", "7"]
+    assert news_rows[1]["event_date"] == "Tue Oct 7"
+    assert (result.processed_events, result.skipped_events) == (2, 0)
@@ -3,6 +3,7 @@ import unittest
 from pathlib import Path
 
 from forexcalendar_scraper.core.paths import PathService
+from forexcalendar_scraper.domain.entities import CalendarEvent
 from forexcalendar_scraper.infrastructure.persistence.csv_repository import CsvRepository
 
 
@@ -111,4 +112,26 @@ class PathServiceAndCsvRepositoryTests(unittest.TestCase):
         self.assertEqual(
             events,
             [{"date": "Mon Oct 6", "event": "CPI", "detail": "12345"}],
-        )
\ No newline at end of file
+        )
+
+    def test_load_events_pads_short_rows_and_skips_blank_lines(self):
+        csv_file = self.root_dir / "events.csv"
+        csv_file.write_text("date,event,detail\n\nMon Oct 6,CPI\n", encoding="utf-8")
+
+        events = self.repository.load_event_rows(csv_file)
+
+        self.assertEqual(events, [{"date": "Mon Oct 6", "event": "CPI", "detail": ""}])
+
+    def test_load_events_maps_columns_without_intermediate_rows(self):
+        csv_file = self.root_dir / "events.csv"
+        csv_file.write_text(
+            " detail , event , date \n 12345 , CPI , Mon Oct 6 \n\n",
+            encoding="utf-8",
+        )
+
+        events = self.repository.load_events(csv_file)
+
+        self.assertEqual(
+            events,
+            [CalendarEvent(date="Mon Oct 6", name="CPI", detail_id="12345")],
+        )
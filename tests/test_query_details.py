@@ -3,11 +3,36 @@ import unittest
 from pathlib import Path
 
 from forexcalendar_scraper.application.detail_query_service import DetailQueryService
+from forexcalendar_scraper.bootstrap import build_detail_query_service
+from forexcalendar_scraper.core.config import Settings
 from forexcalendar_scraper.core.exceptions import InputFileResolutionError
 from forexcalendar_scraper.core.paths import PathService
 from forexcalendar_scraper.infrastructure.persistence.csv_repository import CsvRepository
 
 
+class CountingCsvRepository(CsvRepository):
+    def __init__(self) -> None:
+        self.parsed_files: list[Path] = []
+
+    def load_detail_blocks(self, csv_file):
+        self.parsed_files.append(Path(csv_file))
+        return super().load_detail_blocks(csv_file)
+
+
+class DictExtractionCache:
+    def __init__(self) -> None:
+        self.entries: dict[str, str] = {}
+
+    def get(self, key: str) -> str | None:
+        return self.entries.get(key)
+
+    def set(self, key: str, payload: str, ttl_seconds: float) -> None:
+        self.entries[key] = payload
+
+    def close(self) -> None:
+        pass
+
+
 class DetailQueryServiceTests(unittest.TestCase):
     @staticmethod
     def _build_service(root_dir: Path) -> DetailQueryService:
@@ -68,4 +93,72 @@ class DetailQueryServiceTests(unittest.TestCase):
             output = self._build_service(Path(temp_dir)).show_specific_field(events, "2", "speaker")
 
         self.assertIn("MPC Member Breeden Speaks", output)
-        self.assertIn("Sarah Breeden", output)
\ No newline at end of file
+        self.assertIn("Sarah Breeden", output)
+
+    def test_list_all_fields_counts_events_carrying_each_field(self):
+        events = {
+            "1": {"event_name": "CPI m/m", "source": "BLS"},
+            "2": {"event_name": "GDP q/q"},
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output = self._build_service(Path(temp_dir)).list_all_fields(events)
+
+        self.assertIn("All Unique Fields (2 total)", output)
+        self.assertIn(f"{'event_name':25s} (present in 2/2 events)", output)
+        self.assertIn(f"{'source':25s} (present in 1/2 events)", output)
+
+    def test_load_details_reuses_cached_parse_until_the_file_changes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root_dir = Path(temp_dir)
+            details_file = root_dir / "details.csv"
+            details_file.write_text("event_id,1\nevent_name,CPI m/m\n", encoding="utf-8")
+            repository = CountingCsvRepository()
+            cache = DictExtractionCache()
+            service = DetailQueryService(
+                path_service=PathService.from_root(root_dir),
+                csv_repository=repository,
+                extraction_cache=cache,
+                cache_ttl_seconds=60.0,
+            )
+
+            first_events = service.load_details(details_file)
+            second_events = service.load_details(details_file)
+            details_file.write_text("event_id,1\nevent_name,Core CPI m/m\n", encoding="utf-8")
+            changed_events = service.load_details(details_file)
+
+        self.assertEqual(first_events, second_events)
+        self.assertEqual(len(repository.parsed_files), 2)
+        self.assertEqual(changed_events["1"]["event_name"], "Core CPI m/m")
+        self.assertEqual(len(cache.entries), 1)
+
+    def test_load_details_reparses_malformed_cache_entries(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root_dir = Path(temp_dir)
+            details_file = root_dir / "details.csv"
+            details_file.write_text("event_id,1\nevent_name,CPI m/m\n", encoding="utf-8")
+            repository = CountingCsvRepository()
+            cache = DictExtractionCache()
+            cache.entries[f"details-csv:{details_file.resolve()}"] = '{"events": []}'
+            service = DetailQueryService(
+                path_service=PathService.from_root(root_dir),
+                csv_repository=repository,
+                extraction_cache=cache,
+                cache_ttl_seconds=60.0,
+            )
+
+            events = service.load_details(details_file)
+
+        self.assertEqual(events["1"]["event_name"], "CPI m/m")
+        self.assertEqual(len(repository.parsed_files), 1)
+
+    def test_query_service_does_not_create_an_extraction_cache(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path_service = PathService.from_root(Path(temp_dir))
+            service = build_detail_query_service(
+                path_service=path_service,
+                settings=Settings(extraction_cache_ttl_seconds=60.0),
+            )
+
+            self.assertIsNone(service.extraction_cache)
+            self.assertFalse(path_service.build_cache_file_path("extraction_cache").parent.exists())
+